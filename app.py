@@ -3,23 +3,31 @@
 #
 # IAToolkit is open source software.
 
+import importlib.util
 import os
 import sys
 
 # Add src/ to sys.path BEFORE importing iatoolkit
-# this is only needed when iatoolkit is running without importing the pip package
-src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
-sys.path.insert(0, src_path)
+# this is only needed when iatoolkit is running without importing the pip package.
+# If iatoolkit is already importable (pip install -e ., PYTHONPATH=./src, preloaded workers)
+# sys.path is left untouched, so every other import doesn't pay for an extra entry.
+if 'iatoolkit' not in sys.modules and importlib.util.find_spec('iatoolkit') is None:
+    src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
 
-from dotenv import load_dotenv
 from iatoolkit.core import IAToolkit
 from iatoolkit.company_registry import register_company
-from companies.sample_company.sample_company import SampleCompany
 
-# load environment variables
-load_dotenv(override=True)
+# load environment variables from the .env next to this file.
+# An explicit path skips the upward directory search; a missing file is simply ignored.
+from dotenv import load_dotenv
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env'), override=True)
 
 def create_app():
+    # company modules are imported here, so importing app.py stays cheap
+    from companies.sample_company.sample_company import SampleCompany
+
     # IMPORTANT: companies must be registered before creating the IAToolkit
     register_company('sample_company', SampleCompany)
 
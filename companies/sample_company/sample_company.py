@@ -12,6 +12,8 @@ import logging
 
 
 class SampleCompany(BaseCompany):
+    __slots__ = ('sql_service', 'knowledge_service', 'sample_database')
+
     @inject
     def __init__(self,
                 sql_service: SqlService,
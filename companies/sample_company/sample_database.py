@@ -1,8 +1,25 @@
 import pandas as pd
 from sqlalchemy import text, inspect
+import logging
 import os
 
 
+# Simplified mapping: (Excel sheet, SQL table, date columns, columns for deduplication)
+_SCHEMA_PLAN: tuple[tuple[str, str, tuple[str, ...], tuple[str, ...] | None], ...] = (
+    ("Categories", "categories", (), None),
+    ("Suppliers", "suppliers", (), None),
+    ("Products", "products", (), None),
+    ("Customers", "customers", (), None),
+    ("Employees", "employees", ("birthdate", "hiredate"), None),
+    ("Shippers", "shippers", (), None),
+    ("Orders", "orders", ("orderdate", "requireddate", "shippeddate"), None),
+    ("OrderDetails", "order_details", (), ("orderid", "productid")),  # Correction: Deduplicate on PK
+    ("Regions", "regions", (), None),
+    ("Territories", "territories", (), None),
+    ("EmployeeTerritories", "employee_territories", (), ("employeeid", "territoryid")),
+)
+
+
 class SampleCompanyDatabase:
     def __init__(self, db_manager):
         """
@@ -33,7 +50,7 @@ class SampleCompanyDatabase:
             # create the schema if it doesn't exist'
             with connection.begin():
                 if self.db_manager.schema and is_postgres:
-                    print(f"⚙️  Creating schema '{self.db_manager.schema}'...")
+                    logging.info(f"⚙️  Creating schema '{self.db_manager.schema}'...")
 
                     # 1. create the schema and confirm
                     connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.db_manager.schema}"))
@@ -45,10 +62,10 @@ class SampleCompanyDatabase:
                 for statement in statements:
                     connection.execute(text(statement))
 
-        print(f"Database schema created successfully from '{sql_script_path}'.")
+        logging.info(f"Database schema created successfully from '{sql_script_path}'.")
 
     @staticmethod
-    def _normalize_df(df: pd.DataFrame, date_cols: list[str]) -> pd.DataFrame:
+    def _normalize_df(df: pd.DataFrame, date_cols: tuple[str, ...]) -> pd.DataFrame:
         """
         Normalizes a DataFrame by handling NaNs and converting date columns.
         """
@@ -74,21 +91,6 @@ class SampleCompanyDatabase:
         :param xlsx_path: Path to the .xlsx file (e.g., 'northwind.xlsx')
         :return: dict with number of rows inserted per table
         """
-        # Simplified mapping: (Excel sheet, SQL table, date columns, columns for deduplication)
-        schema_plan = [
-            ("Categories", "categories", [], None),
-            ("Suppliers", "suppliers", [], None),
-            ("Products", "products", [], None),
-            ("Customers", "customers", [], None),
-            ("Employees", "employees", ["birthdate", "hiredate"], None),
-            ("Shippers", "shippers", [], None),
-            ("Orders", "orders", ["orderdate", "requireddate", "shippeddate"], None),
-            ("OrderDetails", "order_details", [], ["orderid", "productid"]),  # Correction: Deduplicate on PK
-            ("Regions", "regions", [], None),
-            ("Territories", "territories", [], None),
-            ("EmployeeTerritories", "employee_territories", [], ["employeeid", "territoryid"]),
-        ]
-
         xls = pd.read_excel(xlsx_path, sheet_name=None, dtype=object)
         results = {}
         table_name = ""
@@ -101,7 +103,7 @@ class SampleCompanyDatabase:
                     if connection.dialect.name == 'sqlite':
                         connection.execute(text("PRAGMA foreign_keys = ON;"))
 
-                    for sheet_name, table_name, date_cols, deduplicate_on in schema_plan:
+                    for sheet_name, table_name, date_cols, deduplicate_on in _SCHEMA_PLAN:
                         if sheet_name not in xls:
                             results[table_name] = 0
                             continue
@@ -114,7 +116,7 @@ class SampleCompanyDatabase:
                         df = self._normalize_df(df, date_cols)
 
                         if deduplicate_on:
-                            df.drop_duplicates(subset=deduplicate_on, keep='first', inplace=True)
+                            df.drop_duplicates(subset=list(deduplicate_on), keep='first', inplace=True)
 
                         # This intersection will now work perfectly.
                         db_columns = [col['name'] for col in inspector.get_columns(table_name, schema=self.db_manager.schema)]
@@ -7,6 +7,9 @@
 from abc import ABC, abstractmethod
 
 class BaseCompany(ABC):
+    # attributes set by IAToolkit when hydrating the company configuration.
+    # subclasses that also declare __slots__ avoid the per-instance __dict__
+    __slots__ = ('company_short_name', 'company')
 
     @abstractmethod
     # execute the specific action configured in the intent table
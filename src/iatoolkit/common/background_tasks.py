@@ -0,0 +1,43 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from flask import current_app
+from typing import Callable
+import logging
+import threading
+
+
+# process-wide executors by name, created on first use and shared by all requests
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Returns the executor registered under `name`, creating it with `max_workers` threads the first time."""
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'iat-{name}')
+            _executors[name] = executor
+        return executor
+
+
+def run_in_app_context(app, fn: Callable, *args, description: str):
+    # own app context: its teardown removes this thread's DB session when done
+    with app.app_context():
+        try:
+            fn(*args)
+        except Exception as e:
+            logging.exception(f"Background {description} failed: {e}")
+
+
+def submit_in_app_context(executor: ThreadPoolExecutor, fn: Callable, *args, description: str) -> Future:
+    """
+    Runs fn(*args) on the executor inside an app context of the current app.
+    Errors are logged as "Background <description> failed", never raised to the caller.
+    """
+    return executor.submit(run_in_app_context, current_app._get_current_object(), fn, *args,
+                           description=description)
@@ -1,6 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List
+from typing import Dict, List
 import abc
+import logging
 
 
 class AssetType(Enum):
@@ -11,6 +13,11 @@ class AssetType(Enum):
 
 
 class AssetRepository(abc.ABC):
+    # threads used by the default read_many. read_text runs on them without the Flask app
+    # context or the request's DB session, so only repositories whose reads need neither
+    # (e.g. an object storage client) should raise it.
+    read_many_workers = 1
+
     @abc.abstractmethod
     def exists(self, company_short_name: str, asset_type: AssetType, filename: str) -> bool:
         pass
@@ -23,6 +30,30 @@ class AssetRepository(abc.ABC):
     def list_files(self, company_short_name: str, asset_type: AssetType, extension: str = None) -> List[str]:
         pass
 
+    def read_many(self, company_short_name: str, asset_type: AssetType, extension: str = None) -> Dict[str, str]:
+        """
+        Reads every asset of a type (optionally filtered by extension) in one call, as a
+        {filename: text} dict in listing order; files that cannot be read are logged and left out.
+        This default lists the files and reads them one by one, or on up to read_many_workers
+        threads; repositories that can fetch several objects in one round trip should override it.
+        """
+        filenames = self.list_files(company_short_name, asset_type, extension=extension)
+
+        def read(filename: str):
+            try:
+                return self.read_text(company_short_name, asset_type, filename)
+            except Exception as e:
+                logging.warning(f"Error reading {asset_type.value} file {filename}: {e}")
+                return None
+
+        if len(filenames) <= 1 or self.read_many_workers <= 1:
+            contents = [read(filename) for filename in filenames]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(filenames), self.read_many_workers)) as executor:
+                contents = list(executor.map(read, filenames))
+
+        return {filename: text for filename, text in zip(filenames, contents) if text is not None}
+
     @abc.abstractmethod
     def write_text(self, company_short_name: str, asset_type: AssetType, filename: str, content: str) -> None:
         """Creates or updates a text asset."""
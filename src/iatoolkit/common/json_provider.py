@@ -0,0 +1,52 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from typing import Any
+import logging
+
+try:
+    import orjson
+except ImportError:
+    # optional dependency: pip install iatoolkit[orjson]
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes with orjson and keeps the output of the default provider:
+    keys are sorted, and dates, Decimals and other non-native types go through the same
+    `default` function. Calls with options orjson has no equivalent for, and values it
+    cannot encode (e.g. integers over 64 bits), fall back to the stdlib encoder.
+    Decoding stays on the stdlib: orjson turns integers over 64 bits into floats and
+    rejects NaN and Infinity, which json.loads accepts.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        # jsonify passes compact separators, or indent=2 in debug mode
+        unsupported = {key: value for key, value in kwargs.items()
+                       if (key, value) not in (('separators', (',', ':')), ('indent', 2))}
+        if unsupported:
+            return super().dumps(obj, **kwargs)
+        if kwargs.get('indent') == 2:
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+
+def configure_json_provider(app: Flask):
+    """Uses orjson to encode jsonify responses when it is installed."""
+    if orjson is None:
+        return
+    app.json = ORJSONProvider(app)
+    logging.info("✅ orjson JSON provider enabled")
@@ -4,23 +4,78 @@
 # IAToolkit is open source software.
 
 import logging
+import re
 from typing import List, Union
 from iatoolkit.common.exceptions import IAToolkitException
 from flask import request
 from injector import inject
 import os
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
+from functools import lru_cache
 from datetime import datetime, date
 from decimal import Decimal
 import yaml
 from cryptography.fernet import Fernet
 import base64
+import numpy as np
+
+# use the libyaml C bindings when PyYAML was built with them (same safe semantics, much faster)
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
+# weights applied to the rut digits, from the rightmost one, and the resulting verifier digit
+_RUT_WEIGHTS = (2, 3, 4, 5, 6, 7, 2, 3)
+_RUT_VERIFIER_DIGITS = {value: str(value) for value in range(1, 10)} | {10: 'K', 11: '0'}
+_RUT_PATTERN = re.compile(r'^(\d+)\s*-([0-9Kk])$')
+# verifier digit by value of (11 - sum % 11), for the vectorized path
+_RUT_VERIFIER_TABLE = np.array([''] + [_RUT_VERIFIER_DIGITS[value] for value in range(1, 12)])
+
+
+# jinja environments are expensive to build and they cache the compiled templates,
+# so they are shared per search path instead of being rebuilt on every render.
+_jinja_environments: dict[tuple[str, ...], Environment] = {}
+
+
+def _get_jinja_environment(searchpath: tuple[str, ...]) -> Environment:
+    env = _jinja_environments.get(searchpath)
+    if env is None:
+        loader = FileSystemLoader(list(searchpath)) if searchpath else None
+        # prompts are plain text: no autoescaping, and room for every prompt template in the cache
+        env = _jinja_environments.setdefault(
+            searchpath,
+            Environment(loader=loader, autoescape=False, optimized=True, cache_size=1000),
+        )
+    return env
+
+
+@lru_cache(maxsize=256)
+def _compile_string_template(searchpath: tuple[str, ...], template_string: str) -> Template:
+    return _get_jinja_environment(searchpath).from_string(template_string)
+
+
+@lru_cache(maxsize=512)
+def _read_text_file(path: str, mtime_ns: int, size: int, encoding: str | None) -> str:
+    # mtime/size are part of the key so an edited file is read again
+    if encoding is None:
+        with open(path, 'r') as f:
+            return f.read()
+    with open(path, 'r', encoding=encoding) as f:
+        return f.read()
+
+
+def _read_text(path: str, encoding: str | None = 'utf-8') -> str:
+    stat = os.stat(path)
+    return _read_text_file(path, stat.st_mtime_ns, stat.st_size, encoding)
 
 
 class Utility:
     @inject
     def __init__(self):
         self.encryption_key = os.getenv('FERNET_KEY')
+        self._cipher = None
 
     def render_prompt_from_template(self,
                                     template_pathname: str,
@@ -33,7 +88,8 @@ class Utility:
             template_dir = os.path.dirname(template_pathname)
             template_file = os.path.basename(template_pathname)
 
-            env = Environment(loader=FileSystemLoader(template_dir))
+            # the environment reloads a template only when its file changes on disk
+            env = _get_jinja_environment((template_dir,))
             template = env.get_template(template_file)
 
             # add all the keys in client_data to kwargs
@@ -64,13 +120,10 @@ class Utility:
         """
         try:
             # Si se proporciona un searchpath, se usa un FileSystemLoader para permitir includes.
-            if searchpath:
-                loader = FileSystemLoader(searchpath)
-            else:
-                loader = None  # Sin loader, no se pueden incluir plantillas desde archivos.
-
-            env = Environment(loader=loader)
-            template = env.from_string(template_string)
+            # Sin loader, no se pueden incluir plantillas desde archivos.
+            if isinstance(searchpath, str):
+                searchpath = [searchpath]
+            template = _compile_string_template(tuple(searchpath or ()), template_string)
 
             kwargs.update(client_data)
 
@@ -90,10 +143,7 @@ class Utility:
 
         # 2. read the file
         try:
-            with open(template_path, 'r') as f:
-                template_string = f.read()
-
-            return template_string
+            return _read_text(template_path, encoding=None)
         except Exception as e:
             logging.exception(e)
             return None
@@ -158,6 +208,12 @@ class Utility:
         # Base64 is ASCII-safe, no need for utf-8 encode but we normalize
         return __import__("base64").b64decode(content)
 
+    def _get_cipher(self) -> Fernet:
+        # built on first use and reused: Fernet decodes and splits the key on construction
+        if self._cipher is None:
+            self._cipher = Fernet(self.encryption_key.encode('utf-8'))
+        return self._cipher
+
     def encrypt_key(self, key: str) -> str:
         if not self.encryption_key:
             raise IAToolkitException(IAToolkitException.ErrorType.CRYPT_ERROR,
@@ -167,9 +223,7 @@ class Utility:
             raise IAToolkitException(IAToolkitException.ErrorType.CRYPT_ERROR,
                                'falta la clave a encriptar')
         try:
-            cipher_suite = Fernet(self.encryption_key.encode('utf-8'))
-
-            encrypted_key = cipher_suite.encrypt(key.encode('utf-8'))
+            encrypted_key = self._get_cipher().encrypt(key.encode('utf-8'))
             encrypted_key_str = base64.urlsafe_b64encode(encrypted_key).decode('utf-8')
 
             return encrypted_key_str
@@ -189,17 +243,14 @@ class Utility:
             # transform to bytes first
             encrypted_data_from_storage_bytes = base64.urlsafe_b64decode(encrypted_key.encode('utf-8'))
 
-            cipher_suite = Fernet(self.encryption_key.encode('utf-8'))
-            decrypted_key_bytes = cipher_suite.decrypt(encrypted_data_from_storage_bytes)
+            decrypted_key_bytes = self._get_cipher().decrypt(encrypted_data_from_storage_bytes)
             return decrypted_key_bytes.decode('utf-8')
         except Exception as e:
             raise IAToolkitException(IAToolkitException.ErrorType.CRYPT_ERROR,
                                f'No se pudo desencriptar la clave: {str(e)}') from e
 
     def load_schema_from_yaml(self, file_path):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            schema = yaml.safe_load(f)
-        return schema
+        return yaml.load(_read_text(file_path), Loader=_YamlLoader)
 
     def load_yaml_from_string(self, yaml_content: str) -> dict:
         """
@@ -212,7 +263,7 @@ class Utility:
             # Normalizar tabulaciones que rompen YAML
             yaml_content = yaml_content.replace('\t', '  ')
 
-            loaded = yaml.safe_load(yaml_content)
+            loaded = yaml.load(yaml_content, Loader=_YamlLoader)
             return loaded
         except yaml.YAMLError as e:
             logging.error(f"Error parsing YAML string: {e}")
@@ -226,7 +277,8 @@ class Utility:
         try:
             # default_flow_style=False ensures lists and dicts are expanded (not inline like JSON)
             # allow_unicode=True ensures characters like accents are preserved
-            return yaml.safe_dump(config, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            return yaml.dump(config, Dumper=_YamlDumper,
+                             default_flow_style=False, allow_unicode=True, sort_keys=False)
         except yaml.YAMLError as e:
             logging.error(f"Error dumping YAML to string: {e}")
             raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR,
@@ -234,37 +286,72 @@ class Utility:
 
 
     def load_markdown_context(self, filepath: str) -> str:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
-
-    @classmethod
-    def _get_verifier(self, rut: int):
-        value = 11 - sum([int(a) * int(b) for a, b in zip(str(rut).zfill(8), '32765432')]) % 11
-        return {10: 'K', 11: '0'}.get(value, str(value))
-
-    def validate_rut(self, rut_str):
+        return _read_text(filepath)
+
+    @staticmethod
+    def _get_verifier(rut: int):
+        # modulo 11 over the 8 rightmost digits, weights 2,3,4,5,6,7,2,3 from right to left
+        while rut >= 100_000_000:
+            rut //= 10
+        total = 0
+        for weight in _RUT_WEIGHTS:
+            rut, digit = divmod(rut, 10)
+            total += digit * weight
+        value = 11 - total % 11
+        return _RUT_VERIFIER_DIGITS[value]
+
+    @staticmethod
+    def _parse_rut(rut_str):
+        # returns (number, verifier) for a well-formed rut, None otherwise
         if not rut_str or not isinstance(rut_str, str):
-            return False
-
-        rut_str = rut_str.strip().replace('.', '').upper()
-        parts = rut_str.split('-')
-        if not len(parts) == 2:
-            return False
+            return None
 
-        try:
-            rut = int(parts[0])
-        except ValueError:
-            return False
+        # <digits>-<verifier>, thousands separators removed
+        match = _RUT_PATTERN.match(rut_str.strip().replace('.', ''))
+        if not match:
+            return None
 
+        rut = int(match.group(1))
         if rut < 1000000:
-            return False
+            return None
+        return rut, match.group(2).upper()
 
-        if not len(parts[1]) == 1:
+    def validate_rut(self, rut_str):
+        parsed = self._parse_rut(rut_str)
+        if parsed is None:
             return False
 
-        digit = parts[1].upper()
+        rut, digit = parsed
         return digit == self._get_verifier(rut)
 
+    def validate_ruts(self, rut_strs) -> np.ndarray:
+        # bulk version of validate_rut: parse in python, compute all verifiers in one matrix product
+        valid = np.zeros(len(rut_strs), dtype=bool)
+        positions, numbers, digits = [], [], []
+        for position, rut_str in enumerate(rut_strs):
+            parsed = self._parse_rut(rut_str)
+            if parsed is None:
+                continue
+            rut, digit = parsed
+            while rut >= 100_000_000:
+                rut //= 10
+            positions.append(position)
+            numbers.append(rut)
+            digits.append(digit)
+
+        if not positions:
+            return valid
+
+        remaining = np.array(numbers, dtype=np.int64)
+        rut_digits = np.empty((remaining.size, len(_RUT_WEIGHTS)), dtype=np.int64)
+        for column in range(len(_RUT_WEIGHTS)):
+            remaining, rut_digits[:, column] = np.divmod(remaining, 10)
+
+        totals = rut_digits @ np.array(_RUT_WEIGHTS, dtype=np.int64)
+        verifiers = _RUT_VERIFIER_TABLE[11 - totals % 11]
+        valid[positions] = verifiers == np.array(digits)
+        return valid
+
     def get_files_by_extension(self, directory: str, extension: str, return_extension: bool = False) -> List[str]:
         try:
             # Normalizar la extensión (agregar punto si no lo tiene)
@@ -280,16 +367,18 @@ class Utility:
                 raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR,
                                    f'La ruta no es un directorio: {directory}')
 
-            # Buscar archivos con la extensión especificada
+            # Buscar archivos con la extensión especificada.
+            # scandir entries carry the file type from readdir, avoiding one stat() per file
             files = []
-            for filename in os.listdir(directory):
-                file_path = os.path.join(directory, filename)
-                if os.path.isfile(file_path) and filename.endswith(extension):
-                    if return_extension:
-                        files.append(filename)
-                    else:
-                        name_without_extension = os.path.splitext(filename)[0]
-                        files.append(name_without_extension)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if filename.endswith(extension) and entry.is_file():
+                        if return_extension:
+                            files.append(filename)
+                        else:
+                            name_without_extension = os.path.splitext(filename)[0]
+                            files.append(name_without_extension)
 
             return sorted(files)  # Retornar lista ordenada alfabéticamente
 
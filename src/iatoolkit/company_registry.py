@@ -46,6 +46,10 @@ class CompanyRegistry:
 
         company_key = name.lower()
 
+        # re-registering the same class (repeated create_app calls) is a no-op
+        if self._company_classes.get(company_key) is company_class:
+            return
+
         # --- STRICT SINGLE-TENANT ENFORCEMENT ---
         # If a company is already registered (and it's not an update to the same key)
         if len(self._company_classes) > 0 and company_key not in self._company_classes:
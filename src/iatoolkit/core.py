@@ -9,6 +9,7 @@ from flask_injector import FlaskInjector
 from flask_bcrypt import Bcrypt
 from flask_cors import CORS
 from iatoolkit.common.exceptions import IAToolkitException
+from iatoolkit.common.json_provider import configure_json_provider
 from iatoolkit.repositories.database_manager import DatabaseManager
 from iatoolkit.common.interfaces.asset_storage import AssetRepository
 from iatoolkit.common.interfaces.secret_provider import SecretProvider
@@ -18,6 +19,8 @@ from injector import Binder, Injector, singleton
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 from datetime import timedelta
+import importlib
+import threading
 import redis
 import logging
 import os
@@ -28,6 +31,13 @@ from iatoolkit.services.configuration_service import ConfigurationService
 # global variable for the unique instance of IAToolkit
 _iatoolkit_instance: Optional['IAToolkit'] = None
 
+# heavy SDKs that are only imported when the first request needs them
+# (see LLMProxy._create_client_for_provider). They are preloaded in background at boot.
+_PRELOAD_MODULES = (
+    'google.genai',
+    'anthropic',
+)
+
 def is_bound(injector: Injector, cls) -> bool:
     return cls in injector.binder._bindings
 
@@ -114,6 +124,7 @@ class IAToolkit:
         self._setup_request_globals()
         self._setup_context_processors()
         self._sync_system_tools_on_boot()
+        self._preload_modules()
 
         # register data sources
         if start:
@@ -148,9 +159,29 @@ class IAToolkit:
         except Exception as exc:
             logging.warning("⚠️ Unable to sync system tools on boot: %s", exc)
 
+    def _preload_modules(self):
+        # import the lazy SDKs in a daemon thread, while the server is still binding its socket,
+        # so the first request doesn't pay the import latency.
+        enabled = str(self._get_config_value('IATOOLKIT_PRELOAD_MODULES', 'true')).strip().lower()
+        if enabled not in {'1', 'true', 'yes', 'on'}:
+            return
+
+        def preload():
+            for module_name in _PRELOAD_MODULES:
+                try:
+                    importlib.import_module(module_name)
+                except Exception as e:
+                    logging.debug(f"Module preload skipped for '{module_name}': {e}")
+
+        threading.Thread(target=preload, name='iatoolkit-preload', daemon=True).start()
+
     def _get_config_value(self, key: str, default=None):
-        # get a value from the config dict or the environment variable
-        return self.config.get(key, os.getenv(key, default))
+        # get a value from the config dict or the environment variable.
+        # the environment is only read when the key is missing from the config dict
+        config = self.config
+        if key in config:
+            return config[key]
+        return os.environ.get(key, default)
 
     def _setup_request_globals(self):
         """
@@ -208,6 +239,7 @@ class IAToolkit:
         self.app = Flask(__name__,
                          static_folder=static_folder,
                          template_folder=template_folder)
+        configure_json_provider(self.app)
 
         self.app.config.update({
             'VERSION': self.version,
@@ -518,6 +550,18 @@ class IAToolkit:
 
     def _setup_context_processors(self):
         # Configura context processors para templates
+        def optional_url_for(endpoint: str, **kwargs):
+            if endpoint not in self.app.view_functions:
+                return None
+            return url_for(endpoint, **kwargs)
+
+        # request-independent globals, copied into every template context
+        static_globals = {
+            'url_for': url_for,
+            'app_name': 'IAToolkit',
+            'optional_url_for': optional_url_for,
+        }
+
         @self.app.context_processor
         def inject_globals():
             from iatoolkit.services.profile_service import ProfileService
@@ -534,11 +578,6 @@ class IAToolkit:
             def translate_for_template(key: str, **kwargs):
                 return i18n_service.t(key, **kwargs)
 
-            def optional_url_for(endpoint: str, **kwargs):
-                if endpoint not in self.app.view_functions:
-                    return None
-                return url_for(endpoint, **kwargs)
-
             route_company_short_name = None
             if request.view_args and request.view_args.get('company_short_name'):
                 route_company_short_name = request.view_args.get('company_short_name')
@@ -549,11 +588,10 @@ class IAToolkit:
             )
             user_profile = session_info.get('profile', {})
 
-            return {
-                'url_for': url_for,
+            template_globals = dict(static_globals)
+            template_globals.update({
                 'iatoolkit_version': f'{self.version}',
                 'license': self.license,
-                'app_name': 'IAToolkit',
                 'user_identifier': session_info.get('user_identifier'),
                 'company_short_name': route_company_short_name or session_info.get('company_short_name'),
                 'user_role': user_profile.get('user_role'),
@@ -562,10 +600,10 @@ class IAToolkit:
                 'iatoolkit_base_url': request.url_root,
                 'flashed_messages': get_flashed_messages(with_categories=True),
                 't': translate_for_template,
-                'optional_url_for': optional_url_for,
                 'google_analytics_id': self._get_config_value('GOOGLE_ANALYTICS_ID', ''),
                 'google_login_enabled': google_auth_client.is_enabled(),
-            }
+            })
+            return template_globals
 
     def _get_default_static_folder(self) -> str:
         try:
@@ -6,15 +6,48 @@
 from iatoolkit.common.exceptions import IAToolkitException
 from injector import inject
 # call_service.py
+import http.cookiejar
+import logging
+import threading
 import requests
 from typing import Optional, Dict, Any, Tuple, Union
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class CallServiceClient:
+    # keep-alive session shared by every instance, so repeated calls to the same host
+    # (e.g. an inference endpoint) reuse the TCP/TLS connection instead of a new handshake
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
     @inject
     def __init__(self):
         self.headers = {'Content-Type': 'application/json'}
 
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    # Retry only covers connection errors and idempotent methods (never POST/PATCH)
+                    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                                  raise_on_status=False)
+                    adapter = HTTPAdapter(pool_connections=cls.POOL_CONNECTIONS,
+                                          pool_maxsize=cls.POOL_MAXSIZE,
+                                          max_retries=retry)
+                    session = requests.Session()
+                    # the session serves every company and user: never store cookies, or one
+                    # tenant's Set-Cookie would be sent on another tenant's calls to the same host
+                    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    cls._session = session
+                    logging.debug("CallServiceClient: created shared HTTP session")
+        return cls._session
+
     def _merge_headers(self, extra: Optional[Dict[str, str]]) -> Dict[str, str]:
         if not extra:
             return dict(self.headers)
@@ -43,7 +76,7 @@ class CallServiceClient:
         timeout: Union[int, float, Tuple[int, int]] = 10
     ):
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 endpoint,
                 params=params,
                 headers=self._merge_headers(headers),
@@ -63,7 +96,7 @@ class CallServiceClient:
             timeout: Union[int, float, Tuple[int, int]] = 10
     ):
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 endpoint,
                 params=params,
                 json=json_dict,
@@ -85,7 +118,7 @@ class CallServiceClient:
         timeout: Union[int, float, Tuple[int, int]] = 10
     ):
         try:
-            response = requests.put(
+            response = self._get_session().put(
                 endpoint,
                 params=params,
                 json=json_dict,
@@ -105,7 +138,7 @@ class CallServiceClient:
         timeout: Union[int, float, Tuple[int, int]] = 10
     ):
         try:
-            response = requests.delete(
+            response = self._get_session().delete(
                 endpoint,
                 params=params,
                 json=json_dict,
@@ -125,7 +158,7 @@ class CallServiceClient:
         timeout: Union[int, float, Tuple[int, int]] = 10
     ):
         try:
-            response = requests.patch(
+            response = self._get_session().patch(
                 endpoint,
                 params=params,
                 json=json_dict,
@@ -151,7 +184,7 @@ class CallServiceClient:
             merged_headers.update(headers)
 
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 endpoint,
                 params=params,
                 files=data,
@@ -19,20 +19,20 @@ class LocalFileConnector(FileConnector):
         Estándar: Lista todos los archivos como diccionarios con claves 'path', 'name' y 'metadata'.
         """
         try:
-            files = [
-                os.path.join(self.directory, f)
-                for f in os.listdir(self.directory)
-                if os.path.isfile(os.path.join(self.directory, f))
-            ]
-
-            return [
-                {
-                    "path": file,  # Ruta completa al archivo local
-                    "name": os.path.basename(file),  # Nombre del archivo
-                    "metadata": {"size": os.path.getsize(file), "last_modified": os.path.getmtime(file)}
-                }
-                for file in files
-            ]
+            # scandir gives the file type without a stat call, and one stat per file
+            # gives size and mtime (instead of isfile + getsize + getmtime)
+            files = []
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    files.append({
+                        "path": os.path.join(self.directory, entry.name),  # Ruta completa al archivo local
+                        "name": entry.name,  # Nombre del archivo
+                        "metadata": {"size": stat.st_size, "last_modified": stat.st_mtime}
+                    })
+            return files
         except Exception as e:
             raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR,
                                f"Error procesando el directorio {self.directory}: {e}")
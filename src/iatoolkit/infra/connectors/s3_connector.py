@@ -4,16 +4,28 @@
 # IAToolkit is open source software.
 
 import boto3
+from botocore.config import Config
+from functools import lru_cache
 from iatoolkit.infra.connectors.file_connector import FileConnector
 from typing import List
 
 
+S3_CLIENT_CONFIG = Config(max_pool_connections=50, tcp_keepalive=True)
+
+
+@lru_cache(maxsize=32)
+def _get_s3_client(auth_items: tuple):
+    # connectors are built per request; sharing the (thread-safe) client per credentials
+    # keeps its connection pool alive instead of doing a TLS handshake on every call
+    return boto3.client('s3', config=S3_CLIENT_CONFIG, **dict(auth_items))
+
+
 class S3Connector(FileConnector):
     def __init__(self, bucket: str, prefix: str, folder: str, auth: dict):
         self.bucket = bucket
         self.prefix = prefix
         self.folder = folder
-        self.s3 = boto3.client('s3', **auth)
+        self.s3 = _get_s3_client(tuple(sorted((auth or {}).items())))
 
     def list_files(self) -> List[dict]:
         # List only real S3 objects representing files, excluding folder placeholders.
@@ -4,8 +4,14 @@ import io
 import logging
 import gc
 import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import torch
 import numpy as np
 from PIL import Image
@@ -21,6 +27,25 @@ from transformers import (
     pipeline
 )
 
+# optional: in-process audio decoding (otherwise the ASR pipeline shells out to ffmpeg)
+try:
+    import av
+except ImportError:
+    av = None
+
+WHISPER_SAMPLING_RATE = 16000
+EMBEDDING_ENCODING_FLOAT16_BASE64 = "float16_base64"
+
+# shared HTTP session: image downloads reuse pooled TCP/TLS connections
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                            max_retries=Retry(total=2, backoff_factor=0.1))
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+# (connect, read) seconds
+HTTP_TIMEOUT = (3.05, 30)
+
+
 class EndpointHandler:
     TEXT_EMBEDDING_MODEL_HINTS = (
         "minilm",
@@ -35,22 +60,55 @@ class EndpointHandler:
         "stella",
     )
 
+    # checked in order after clip / text embeddings; the first match wins
+    MODEL_TYPE_KEYWORDS = (
+        ("whisper", ("whisper",)),
+        ("text_to_image", ("stable-diffusion", "tiny-sd", "sd")),
+        ("tts", ("mms", "speech", "tts", "vibevoice")),
+        ("text_to_video", ("text-to-video",)),
+    )
+
+    # how many models stay resident; alternating between them skips from_pretrained
+    MAX_LOADED_MODELS = max(1, int(os.getenv("MAX_LOADED_MODELS", "2")))
+
     def __init__(self, path: str = ""):
         self.current_model_id = None
+        self.current_model_type = None
+        # model_id -> (model_type, model, processor, pipeline), least recently used first
+        self._models = OrderedDict()
         self.model_instance = None
         self.processor_instance = None
         self.pipeline_instance = None
+        self._cuda_copies = False
+        # per-thread CUDA stream and pinned staging buffers, so concurrent requests never share them
+        self._thread_state = threading.local()
 
         # 1. Detección Inteligente de Hardware
         if torch.cuda.is_available():
             self.device = "cuda"
             self.dtype = torch.float16 # GPU = Rápido
             logging.info("Handler initialized on CUDA (GPU) with float16")
+            # dedicated stream + pinned buffers: embedding copies run async instead of syncing per .to()/.cpu()
+            self._cuda_copies = True
         else:
             self.device = "cpu"
             self.dtype = torch.float32 # CPU = Compatible
             logging.info("Handler initialized on CPU with float32")
 
+        # pay model loading and first-kernel costs at boot instead of on the first request
+        warmup_model_ids = [m.strip() for m in os.getenv("WARMUP_MODEL_IDS", "").split(",") if m.strip()]
+        if warmup_model_ids:
+            self.warmup(warmup_model_ids)
+
+    def warmup(self, model_ids: List[str]):
+        for model_id in model_ids[-self.MAX_LOADED_MODELS:]:
+            try:
+                self._load_model(model_id)
+                if self.current_model_type in ("clip", "text_embedding"):
+                    self._HANDLERS[self.current_model_type](self, {"mode": "text", "text": "warmup"})
+            except Exception as e:
+                logging.warning(f"Warmup failed for model {model_id}: {e}")
+
     @classmethod
     def _is_text_embedding_model(cls, model_id: str) -> bool:
         if not isinstance(model_id, str):
@@ -60,50 +118,78 @@ class EndpointHandler:
             return False
         return any(hint in model_lower for hint in cls.TEXT_EMBEDDING_MODEL_HINTS)
 
-    def _clean_memory(self):
-        if self.model_instance is not None:
-            del self.model_instance
-        if self.processor_instance is not None:
-            del self.processor_instance
-        if self.pipeline_instance is not None:
-            del self.pipeline_instance
-
+    @classmethod
+    def _detect_model_type(cls, model_id: str) -> str:
+        model_lower = model_id.lower()
+        if "clip" in model_lower:
+            return "clip"
+        if cls._is_text_embedding_model(model_id):
+            return "text_embedding"
+        for model_type, keywords in cls.MODEL_TYPE_KEYWORDS:
+            if any(keyword in model_lower for keyword in keywords):
+                return model_type
+        raise ValueError(f"No handler logic defined for model: {model_id}")
+
+    def _clean_memory(self, keep: int = 0):
+        # drop the active references, then evict least recently used models beyond `keep`
+        self.current_model_id = None
+        self.current_model_type = None
         self.model_instance = None
         self.processor_instance = None
         self.pipeline_instance = None
 
-        gc.collect()
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
+        evicted = False
+        while len(self._models) > keep:
+            evicted_id, evicted_entry = self._models.popitem(last=False)
+            logging.info(f"Evicting model: {evicted_id}")
+            del evicted_entry
+            evicted = True
+
+        if evicted:
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
 
     def _load_model(self, model_id: str):
         if self.current_model_id == model_id:
             return
 
+        cached = self._models.get(model_id)
+        if cached is not None:
+            self._models.move_to_end(model_id)
+            (self.current_model_type, self.model_instance,
+             self.processor_instance, self.pipeline_instance) = cached
+            self.current_model_id = model_id
+            return
+
+        model_type = self._detect_model_type(model_id)
+
         logging.info(f"Loading new model: {model_id}...")
-        self._clean_memory()
+        # make room before loading so two large models never overlap in memory
+        self._clean_memory(keep=self.MAX_LOADED_MODELS - 1)
 
         try:
             # CLIP, text embeddings, Whisper...
-            if "clip" in model_id.lower():
+            if model_type == "clip":
                 self.processor_instance = CLIPProcessor.from_pretrained(model_id)
-                self.model_instance = CLIPModel.from_pretrained(model_id).to(self.device)
+                self.model_instance = CLIPModel.from_pretrained(model_id, torch_dtype=self.dtype).to(self.device)
                 self.model_instance.eval()
 
-            elif self._is_text_embedding_model(model_id):
+            elif model_type == "text_embedding":
                 self.processor_instance = AutoTokenizer.from_pretrained(model_id)
-                self.model_instance = AutoModel.from_pretrained(model_id).to(self.device)
+                self.model_instance = AutoModel.from_pretrained(model_id, torch_dtype=self.dtype).to(self.device)
                 self.model_instance.eval()
 
-            elif "whisper" in model_id.lower():
+            elif model_type == "whisper":
                 self.pipeline_instance = pipeline(
                     "automatic-speech-recognition",
                     model=model_id,
-                    device=self.device
+                    device=self.device,
+                    torch_dtype=self.dtype
                 )
 
             # --- GENERACIÓN DE IMAGEN (SD / TinySD) ---
-            elif any(x in model_id.lower() for x in ["stable-diffusion", "tiny-sd", "sd"]):
+            elif model_type == "text_to_image":
                 logging.info(f"Initializing Diffusion Pipeline for {model_id}")
 
                 # INTENTO 1: Carga estándar (busca safetensors por defecto en versiones nuevas)
@@ -129,7 +215,7 @@ class EndpointHandler:
                     self.pipeline_instance.enable_attention_slicing()
 
             # --- TEXT TO SPEECH ---
-            elif any(x in model_id.lower() for x in ["mms", "speech", "tts", "vibevoice"]):
+            elif model_type == "tts":
                 logging.info(f"Initializing TTS pipeline for {model_id}")
                 self.pipeline_instance = pipeline(
                     "text-to-speech",
@@ -138,7 +224,7 @@ class EndpointHandler:
                 )
 
             # --- VIDEO ---
-            elif "text-to-video" in model_id.lower():
+            elif model_type == "text_to_video":
                 logging.info(f"Initializing Video Pipeline for {model_id}")
                 self.pipeline_instance = DiffusionPipeline.from_pretrained(
                     model_id,
@@ -156,6 +242,9 @@ class EndpointHandler:
             else:
                 raise ValueError(f"No handler logic defined for model: {model_id}")
 
+            self._models[model_id] = (model_type, self.model_instance,
+                                      self.processor_instance, self.pipeline_instance)
+            self.current_model_type = model_type
             self.current_model_id = model_id
             logging.info(f"Model {model_id} loaded successfully.")
 
@@ -163,73 +252,221 @@ class EndpointHandler:
             logging.error(f"Failed to load model {model_id}: {e}")
             raise ValueError(f"Could not load model {model_id}. Error: {str(e)}")
 
-    def _handle_clip(self, inputs: dict) -> dict:
+    @staticmethod
+    def _load_image(source: dict) -> Image.Image:
+        raw_bytes = source.get("bytes")
+        url = source.get("url") or source.get("presigned_url")
+        base64_image = source.get("base64")
+
+        # already-decoded image bytes skip the base64 round-trip
+        if isinstance(raw_bytes, (bytes, bytearray)):
+            image = Image.open(io.BytesIO(raw_bytes))
+        elif url:
+            response = _http_session.get(url, timeout=HTTP_TIMEOUT, stream=True)
+            response.raise_for_status()
+            # stream the body into PIL, undoing any gzip/deflate transfer encoding
+            response.raw.decode_content = True
+            image = Image.open(response.raw)
+        elif base64_image:
+            image = Image.open(io.BytesIO(base64.b64decode(base64_image)))
+        else:
+            raise ValueError("Image bytes, URL or base64 needed")
+
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return image
+
+    def _thread_stream(self) -> torch.cuda.Stream:
+        stream = getattr(self._thread_state, "stream", None)
+        if stream is None:
+            stream = self._thread_state.stream = torch.cuda.Stream()
+        return stream
+
+    def _pinned_buffer(self, name: str, like: torch.Tensor) -> torch.Tensor:
+        # pinned allocations are slow, so each thread keeps its buffers and only grows them
+        buffers = getattr(self._thread_state, "pinned", None)
+        if buffers is None:
+            buffers = self._thread_state.pinned = {}
+
+        size = like.numel()
+        buffer = buffers.get(name)
+        if buffer is None or buffer.numel() < size or buffer.dtype != like.dtype:
+            buffer = buffers[name] = torch.empty(size, dtype=like.dtype, pin_memory=True)
+        return buffer[:size].view(like.shape)
+
+    def _device_stream(self):
+        if not self._cuda_copies:
+            return nullcontext()
+        stream = self._thread_stream()
+        # weights were moved to the GPU on the default stream
+        stream.wait_stream(torch.cuda.current_stream())
+        return torch.cuda.stream(stream)
+
+    def _to_device(self, batch) -> dict:
+        if not self._cuda_copies:
+            return batch.to(self.device)
+
+        # a request that failed before _to_host may still be copying out of this thread's buffers
+        self._thread_stream().synchronize()
+        on_device = {}
+        for key, value in batch.items():
+            if isinstance(value, torch.Tensor):
+                staging = self._pinned_buffer(f"in:{key}", value)
+                staging.copy_(value)
+                value = staging.to(self.device, non_blocking=True)
+            on_device[key] = value
+        return on_device
+
+    def _to_host(self, vectors: torch.Tensor) -> torch.Tensor:
+        # copies into this thread's pinned buffer; the result is only valid until its next request
+        if not self._cuda_copies:
+            return vectors.cpu()
+
+        host = self._pinned_buffer("out", vectors)
+        host.copy_(vectors, non_blocking=True)
+        self._thread_stream().synchronize()
+        return host
+
+    @staticmethod
+    def _embedding_response(vectors: torch.Tensor, batched: bool, parameters: dict = None) -> dict:
+        # opt-in compact encoding: little-endian float16 bytes, base64, no per-element floats
+        if (parameters or {}).get("embedding_encoding") == EMBEDDING_ENCODING_FLOAT16_BASE64:
+            vectors_np = vectors.to(torch.float16).cpu().numpy().astype("<f2", copy=False)
+            response = {
+                "dtype": "float16",
+                "dimensions": int(vectors_np.shape[-1]),
+            }
+            if batched:
+                response["embeddings_b64"] = base64.b64encode(vectors_np.tobytes()).decode("ascii")
+                response["count"] = int(vectors_np.shape[0])
+            else:
+                response["embedding_b64"] = base64.b64encode(vectors_np[0].tobytes()).decode("ascii")
+            return response
+
+        # a single input keeps the historical {"embedding": [...]} shape
+        vectors = vectors.cpu().tolist()
+        if batched:
+            return {"embeddings": vectors}
+        return {"embedding": vectors[0]}
+
+    def _handle_clip(self, inputs: dict, parameters: dict = None) -> dict:
+        # inputs.text may be a list and inputs.images a list of {url|presigned_url|base64}:
+        # the whole batch goes through a single forward pass
         mode = inputs.get("mode")
         if mode == "text":
             text = inputs.get("text")
-            inputs_pt = self.processor_instance(text=[text], return_tensors="pt", padding=True, truncation=True).to(self.device)
-            with torch.no_grad():
-                emb = self.model_instance.get_text_features(**inputs_pt)
+            batched = isinstance(text, list)
+            texts = text if batched else [text]
+            inputs_pt = self.processor_instance(text=texts, return_tensors="pt", padding=True, truncation=True)
+            with self._device_stream(), torch.inference_mode():
+                emb = self.model_instance.get_text_features(**self._to_device(inputs_pt))
+                emb = self._to_host(torch.nn.functional.normalize(emb, p=2, dim=-1))
         else:
-            url = inputs.get("url") or inputs.get("presigned_url")
-            base64_image = inputs.get("base64")
-
-            if url:
-                image = Image.open(requests.get(url, stream=True).raw)
-            elif base64_image:
-                image = Image.open(io.BytesIO(base64.b64decode(base64_image)))
-            else:
-                raise ValueError("Image URL or base64 needed")
-
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-
-            inputs_pt = self.processor_instance(images=image, return_tensors="pt").to(self.device)
-            with torch.no_grad():
+            image_sources = inputs.get("images")
+            batched = isinstance(image_sources, list)
+            images = [self._load_image(source) for source in (image_sources if batched else [inputs])]
+
+            inputs_pt = self.processor_instance(images=images, return_tensors="pt")
+            with self._device_stream(), torch.inference_mode():
+                inputs_pt = self._to_device(inputs_pt)
+                # the processor always emits float32 pixels; match the model weights (float16 on GPU)
+                inputs_pt["pixel_values"] = inputs_pt["pixel_values"].to(self.dtype)
                 emb = self.model_instance.get_image_features(**inputs_pt)
-        emb = torch.nn.functional.normalize(emb, p=2, dim=-1)
-        vec = emb[0].cpu().tolist()
-        return {"embedding": vec}
+                emb = self._to_host(torch.nn.functional.normalize(emb, p=2, dim=-1))
+        return self._embedding_response(emb, batched, parameters)
 
-    def _handle_text_embedding(self, inputs: dict) -> dict:
+    def _handle_text_embedding(self, inputs: dict, parameters: dict = None) -> dict:
         text = inputs.get("text")
-        if not isinstance(text, str) or not text.strip():
+        batched = isinstance(text, list)
+        texts = text if batched else [text]
+        if not texts or any(not isinstance(item, str) or not item.strip() for item in texts):
             raise ValueError("Expected inputs.text for text embedding generation.")
 
         encoded_input = self.processor_instance(
-            text,
+            texts,
             padding=True,
             truncation=True,
             return_tensors='pt'
-        ).to(self.device)
-        with torch.no_grad():
+        )
+        with self._device_stream(), torch.inference_mode():
+            encoded_input = self._to_device(encoded_input)
             model_output = self.model_instance(**encoded_input)
 
-        token_embeddings = model_output[0]
-        attention_mask = encoded_input['attention_mask']
-        input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
-        sentence_embeddings = torch.sum(token_embeddings * input_mask_expanded, 1) / torch.clamp(
-            input_mask_expanded.sum(1),
-            min=1e-9
-        )
-        sentence_embeddings = torch.nn.functional.normalize(sentence_embeddings, p=2, dim=1)
-        return {"embedding": sentence_embeddings[0].cpu().tolist()}
+            token_embeddings = model_output[0]
+            attention_mask = encoded_input['attention_mask']
+            input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
+            sentence_embeddings = torch.sum(token_embeddings * input_mask_expanded, 1) / torch.clamp(
+                input_mask_expanded.sum(1),
+                min=1e-9
+            )
+            sentence_embeddings = self._to_host(torch.nn.functional.normalize(sentence_embeddings, p=2, dim=1))
+        return self._embedding_response(sentence_embeddings, batched, parameters)
 
     # Backward-compatible alias: existing tests/callers may still refer to _handle_minilm
-    def _handle_minilm(self, inputs: dict) -> dict:
-        return self._handle_text_embedding(inputs)
+    def _handle_minilm(self, inputs: dict, parameters: dict = None) -> dict:
+        return self._handle_text_embedding(inputs, parameters)
+
+    @staticmethod
+    def _decode_audio(audio_bytes: bytes):
+        # decode to mono float32 at 16 kHz in-process; raw bytes are left to the pipeline
+        if av is None:
+            return audio_bytes
+
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=WHISPER_SAMPLING_RATE)
+        chunks = []
+        with av.open(io.BytesIO(audio_bytes)) as container:
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray().ravel())
+            for resampled in resampler.resample(None):
+                chunks.append(resampled.to_ndarray().ravel())
+
+        samples = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+        return {"raw": samples, "sampling_rate": WHISPER_SAMPLING_RATE}
+
+    def _handle_whisper(self, inputs: dict, parameters: dict = None) -> dict:
+        url = inputs.get("url") or inputs.get("presigned_url")
+        base64_audio = inputs.get("base64")
+        raw_bytes = inputs.get("bytes")
+
+        if isinstance(raw_bytes, (bytes, bytearray)):
+            audio_bytes = bytes(raw_bytes)
+        elif url:
+            response = _http_session.get(url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            audio_bytes = response.content
+        elif base64_audio:
+            audio_bytes = base64.b64decode(base64_audio)
+        else:
+            raise ValueError("Audio bytes, URL or base64 needed")
+
+        # long recordings are split in 30s chunks that are transcribed in batches
+        output = self.pipeline_instance(
+            self._decode_audio(audio_bytes),
+            chunk_length_s=30,
+            batch_size=8,
+            return_timestamps=False,
+        )
+        return {"text": (output.get("text") or "").strip()}
 
-    def _handle_tts(self, inputs: dict) -> dict:
+    def _handle_tts(self, inputs: dict, parameters: dict = None) -> dict:
         text = inputs.get("text")
         output = self.pipeline_instance(text)
-        audio_data = output["audio"]
+        audio_data = np.asarray(output["audio"])
         sampling_rate = output["sampling_rate"]
+        # wavfile wants (frames, channels); pipelines usually emit channel-first (1, frames)
+        if audio_data.ndim == 2:
+            if audio_data.shape[0] == 1:
+                audio_data = audio_data[0]
+            elif audio_data.shape[0] < audio_data.shape[1]:
+                audio_data = np.ascontiguousarray(audio_data.T)
         wav_buffer = io.BytesIO()
-        scipy.io.wavfile.write(wav_buffer, rate=sampling_rate, data=audio_data.T)
-        b64_out = base64.b64encode(wav_buffer.getvalue()).decode("utf-8")
+        scipy.io.wavfile.write(wav_buffer, rate=sampling_rate, data=audio_data)
+        # encode straight from the buffer memory instead of copying it out with getvalue()
+        b64_out = base64.b64encode(wav_buffer.getbuffer()).decode("ascii")
         return {"audio_base64": b64_out, "sampling_rate": sampling_rate, "content_type": "audio/wav"}
 
-    def _handle_text_to_video(self, inputs: dict) -> dict:
+    def _handle_text_to_video(self, inputs: dict, parameters: dict = None) -> dict:
         prompt = inputs.get("text")
         video_frames = self.pipeline_instance(prompt, num_inference_steps=25).frames
         with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp_file:
@@ -238,7 +475,7 @@ class EndpointHandler:
                 b64_out = base64.b64encode(f.read()).decode("utf-8")
         return {"video_base64": b64_out, "content_type": "video/mp4"}
 
-    def _handle_text_to_image(self, inputs: dict) -> dict:
+    def _handle_text_to_image(self, inputs: dict, parameters: dict = None) -> dict:
         prompt = inputs.get("text")
         if not prompt:
             raise ValueError("Expected inputs.text for image generation.")
@@ -247,7 +484,7 @@ class EndpointHandler:
 
         buffered = io.BytesIO()
         image.save(buffered, format="PNG")
-        img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
+        img_str = base64.b64encode(buffered.getbuffer()).decode("ascii")
 
         return {"image_base64": img_str, "content_type": "image/png"}
 
@@ -257,24 +494,21 @@ class EndpointHandler:
         requested_model_id = parameters.get("model_id", "openai/clip-vit-base-patch32")
 
         self._load_model(requested_model_id)
-        model_lower = requested_model_id.lower()
+        handler = self._HANDLERS[self.current_model_type]
 
         try:
-            if "clip" in model_lower:
-                return self._handle_clip(inputs)
-            elif self._is_text_embedding_model(requested_model_id):
-                return self._handle_text_embedding(inputs)
-            elif any(x in model_lower for x in ["stable-diffusion", "tiny-sd", "sd"]):
-                return self._handle_text_to_image(inputs)
-            elif any(x in model_lower for x in ["mms", "speech", "tts", "vibevoice"]):
-                return self._handle_tts(inputs)
-            elif "text-to-video" in model_lower:
-                return self._handle_text_to_video(inputs)
-            elif "whisper" in model_lower:
-                return {"text": "whisper logic here"}
-            else:
-                raise ValueError(f"No handler logic defined for model: {requested_model_id}")
+            return handler(self, inputs, parameters)
 
         except Exception as e:
             logging.error(f"Inference error: {e}")
             raise ValueError(f"Inference failed: {str(e)}")
+
+    # resolved once per loaded model in _load_model
+    _HANDLERS = {
+        "clip": _handle_clip,
+        "text_embedding": _handle_text_embedding,
+        "whisper": _handle_whisper,
+        "text_to_image": _handle_text_to_image,
+        "tts": _handle_tts,
+        "text_to_video": _handle_text_to_video,
+    }
@@ -5,11 +5,11 @@
 
 import json
 import logging
-import mimetypes
 from typing import Any, Dict, List, Optional
 
 from iatoolkit.common.exceptions import IAToolkitException
 from iatoolkit.infra.llm_response import LLMResponse, ToolCall, Usage
+from iatoolkit.infra.llm_providers.mime_types import guess_mime_type
 
 
 class AnthropicAdapter:
@@ -54,7 +54,8 @@ class AnthropicAdapter:
             }
 
             if system_prompt:
-                params["system"] = system_prompt
+                # the system prompt is the stable prefix of every call: mark it for prompt caching
+                params["system"] = [self._attach_cache_control({"type": "text", "text": system_prompt})]
 
             temperature = self._safe_float((text or {}).get("temperature"))
             if temperature is not None:
@@ -66,6 +67,8 @@ class AnthropicAdapter:
 
             tools_payload = self._prepare_tools_payload(tools or [])
             if tools_payload:
+                # tools are rendered before the system prompt, so the breakpoint on the last tool caches all of them
+                tools_payload[-1] = self._attach_cache_control(tools_payload[-1])
                 params["tools"] = tools_payload
 
                 tool_choice_payload = self._map_tool_choice(tool_choice, tools_payload)
@@ -191,9 +194,7 @@ class AnthropicAdapter:
 
         for img in images:
             filename = img.get("name", "")
-            mime_type, _ = mimetypes.guess_type(filename)
-            if not mime_type:
-                mime_type = "image/jpeg"
+            mime_type = guess_mime_type(filename) or "image/jpeg"
             blocks.append({
                 "type": "image",
                 "source": {
@@ -258,6 +259,10 @@ class AnthropicAdapter:
 
         return payload or None
 
+    @staticmethod
+    def _attach_cache_control(block: Dict) -> Dict:
+        return {**block, "cache_control": {"type": "ephemeral"}}
+
     @staticmethod
     def _map_tool_choice(tool_choice: str, tools_payload: List[Dict]) -> Optional[Dict]:
         if not tools_payload:
@@ -339,7 +344,12 @@ class AnthropicAdapter:
         usage_obj = getattr(response, "usage", None)
         input_tokens = getattr(usage_obj, "input_tokens", 0) if usage_obj else 0
         output_tokens = getattr(usage_obj, "output_tokens", 0) if usage_obj else 0
-        total_tokens = (input_tokens or 0) + (output_tokens or 0)
+        # Anthropic reports cached prefix tokens apart from input_tokens
+        cache_read_tokens = self._token_count(usage_obj, "cache_read_input_tokens")
+        input_tokens = (input_tokens or 0) + cache_read_tokens + self._token_count(usage_obj, "cache_creation_input_tokens")
+        total_tokens = input_tokens + (output_tokens or 0)
+        if cache_read_tokens:
+            logging.debug("Anthropic prompt cache: %s/%s input tokens cached", cache_read_tokens, input_tokens)
 
         status = "tool_calls" if tool_calls else "completed"
 
@@ -353,11 +363,17 @@ class AnthropicAdapter:
                 input_tokens=input_tokens or 0,
                 output_tokens=output_tokens or 0,
                 total_tokens=total_tokens or 0,
+                cached_input_tokens=cache_read_tokens,
             ),
             reasoning_content="\n".join(reasoning_fragments),
             content_parts=content_parts,
         )
 
+    @staticmethod
+    def _token_count(usage_obj: Any, field: str) -> int:
+        value = getattr(usage_obj, field, 0) if usage_obj else 0
+        return value if isinstance(value, int) else 0
+
     @staticmethod
     def _serialize_tool_output(output: Any) -> str:
         if isinstance(output, str):
@@ -79,8 +79,8 @@ class DeepseekAdapter:
                 tools_payload = None
                 tool_choice = None
 
-            logging.debug(f"[DeepseekAdapter] messages={messages}")
-            logging.debug(f"[DeepseekAdapter] tools={tools_payload}, tool_choice={tool_choice}")
+            logging.debug("[DeepseekAdapter] messages=%s", messages)
+            logging.debug("[DeepseekAdapter] tools=%s, tool_choice=%s", tools_payload, tool_choice)
 
             # Build kwargs for API call, skipping empty parameters
             call_kwargs: Dict[str, Any] = {
@@ -92,7 +92,9 @@ class DeepseekAdapter:
             if tool_choice:
                 call_kwargs["tool_choice"] = tool_choice
 
-            logging.debug(f"[DeepseekAdapter] Calling DeepSeek chat.completions API...: {json.dumps(messages, indent=2)}")
+            # serializing the whole conversation is only worth it when debug logging is on
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"[DeepseekAdapter] Calling DeepSeek chat.completions API...: {json.dumps(messages, indent=2)}")
             response = self.client.chat.completions.create(**call_kwargs)
 
             return self._map_deepseek_chat_response(response)
@@ -4,13 +4,13 @@
 # IAToolkit is open source software.
 
 from iatoolkit.infra.llm_response import LLMResponse, ToolCall, Usage
+from iatoolkit.infra.llm_providers.mime_types import guess_mime_type
 from typing import Any, Dict, List, Optional
 from google.genai import types
 from iatoolkit.common.exceptions import IAToolkitException
 import logging
 import json
 import uuid
-import mimetypes
 import re
 import base64
 
@@ -188,7 +188,7 @@ class GeminiAdapter:
                             continue
                         parts.append(types.Part.from_bytes(
                             data=image_bytes,
-                            mime_type=mimetypes.guess_type(img.get('name', ''))[0] or 'image/jpeg'
+                            mime_type=guess_mime_type(img.get('name', '')) or 'image/jpeg'
                         ))
                 if attachments and i == last_user_idx:
                     for attachment in attachments:
@@ -200,7 +200,7 @@ class GeminiAdapter:
                         mime_type = (
                             attachment.get("mime_type")
                             or attachment.get("type")
-                            or mimetypes.guess_type(filename)[0]
+                            or guess_mime_type(filename)
                             or "application/octet-stream"
                         )
                         parts.append(types.Part.from_bytes(
@@ -409,7 +409,7 @@ class GeminiAdapter:
         return config
 
     def _map_gemini_response(self, response, model: str) -> LLMResponse:
-        output_text = ""
+        text_parts = []
         tool_calls = []
         content_parts = []
 
@@ -419,9 +419,10 @@ class GeminiAdapter:
                 for idx, part in enumerate(candidate.content.parts):
 
                     # 1. Texto
-                    if part.text:
-                        output_text += part.text
-                        content_parts.append({"type": "text", "text": part.text})
+                    part_text = part.text
+                    if part_text:
+                        text_parts.append(part_text)
+                        content_parts.append({"type": "text", "text": part_text})
 
                     # 2. Llamada a Herramienta
                     elif part.function_call:
@@ -436,27 +437,20 @@ class GeminiAdapter:
 
                     # 3. Imagen Generada (Nativo Gemini / Imagen 3)
                     # El nuevo SDK suele usar part.inline_data o part.blob para esto
-                    elif hasattr(part, 'inline_data') and part.inline_data:
-                        content_parts.append({
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": part.inline_data.mime_type,
-                                "data": part.inline_data.data
-                            }
-                        })
-                        output_text += "\n[Imagen Generada]\n"
-
-                    elif hasattr(part, 'blob') and part.blob:
-                        content_parts.append({
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": part.blob.mime_type,
-                                "data": part.blob.data
-                            }
-                        })
-                        output_text += "\n[Imagen Generada]\n"
+                    else:
+                        image_data = getattr(part, 'inline_data', None) or getattr(part, 'blob', None)
+                        if image_data:
+                            content_parts.append({
+                                "type": "image",
+                                "source": {
+                                    "type": "base64",
+                                    "media_type": image_data.mime_type,
+                                    "data": image_data.data
+                                }
+                            })
+                            text_parts.append("\n[Imagen Generada]\n")
+
+        output_text = "".join(text_parts)
 
         if not output_text:
             output_text = self._extract_structured_output_text(response)
@@ -515,7 +509,8 @@ class GeminiAdapter:
         return value
 
     def _log_structured_response_debug(self, response: Any, used_response_schema: bool) -> None:
-        if not used_response_schema:
+        # probing every part is wasted work unless the debug line is actually emitted
+        if not used_response_schema or not logging.getLogger().isEnabledFor(logging.DEBUG):
             return
 
         try:
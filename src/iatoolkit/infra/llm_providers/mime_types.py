@@ -0,0 +1,30 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+import mimetypes
+import os
+from functools import lru_cache
+from typing import Optional
+
+# extensions of nearly every image/attachment sent to the providers, resolved without the mimetypes db
+_COMMON_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+    ".pdf": "application/pdf",
+}
+
+
+def guess_mime_type(filename: str) -> Optional[str]:
+    """mimetypes.guess_type(filename)[0], with a fast path for common extensions and an LRU cache."""
+    filename = filename or ""
+    return _COMMON_MIME_TYPES.get(os.path.splitext(filename)[1].lower()) or _guess_mime_type(filename)
+
+
+@lru_cache(maxsize=256)
+def _guess_mime_type(filename: str) -> Optional[str]:
+    return mimetypes.guess_type(filename)[0]
@@ -3,21 +3,54 @@
 #
 # IAToolkit is open source software.
 
+import asyncio
 import logging
 from typing import Dict, List, Optional
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from iatoolkit.infra.llm_response import LLMResponse, ToolCall, Usage
+from iatoolkit.infra.llm_response_cache import LLMResponseCache, SemanticLLMResponseCache, make_cache_key
+from iatoolkit.infra.rate_limiter import RateLimiter, estimate_tokens
+from iatoolkit.infra.llm_providers.mime_types import guess_mime_type
 from iatoolkit.common.exceptions import IAToolkitException
 from typing import List
-import mimetypes
 import re
-import base64
+
+
+# standard alphabet with optional padding; the length is checked separately
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
 
 
 class OpenAIAdapter:
     """Adaptador para la API de OpenAI"""
 
-    def __init__(self, openai_client):
+    # keep-alive pool shared by the concurrent calls of acreate_response
+    ASYNC_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+    def __init__(self,
+                 openai_client,
+                 async_client=None,
+                 response_cache: Optional[LLMResponseCache] = None,
+                 response_cache_scope: str = "",
+                 semantic_cache: Optional[SemanticLLMResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         self.client = openai_client
+        self.async_client = async_client
+        self.response_cache = response_cache
+        # the exact cache may be shared by several API keys (or processes, with Redis)
+        self.response_cache_scope = response_cache_scope
+        self.semantic_cache = semantic_cache
+        self.rate_limiter = rate_limiter
+
+    def _get_async_client(self):
+        # built lazily from the sync client's credentials, so only async callers pay for it
+        if self.async_client is None:
+            self.async_client = AsyncOpenAI(
+                api_key=self.client.api_key,
+                base_url=self.client.base_url,
+                http_client=DefaultAsyncHttpxClient(limits=self.ASYNC_HTTP_LIMITS),
+            )
+        return self.async_client
 
     def create_response(self,
                         model: str,
@@ -29,40 +62,49 @@ class OpenAIAdapter:
                         reasoning: Optional[Dict] = None,
                         tool_choice: str = "auto",
                         images: Optional[List[Dict]] = None,
-                        attachments: Optional[List[Dict]] = None) -> LLMResponse:
+                        attachments: Optional[List[Dict]] = None,
+                        request_timeout: Optional[float] = None,
+                        max_retries: Optional[int] = None) -> LLMResponse:
         """Llamada a la API de OpenAI y mapeo a estructura común"""
         try:
-            # Handle multimodal input if images are present
-            if images or attachments:
-                input = self._prepare_multimodal_input(input, images or [], attachments or [])
-
-            # Preparar parámetros para OpenAI
-            params = {
-                'model': model,
-                'input': input
-            }
-
-            # add image generation tool
-            if tools:
-                tools.append({"type": "image_generation"})
-
-            if previous_response_id:
-                params['previous_response_id'] = previous_response_id
-            if tools:
-                params['tools'] = tools
-            if text:
-                params['text'] = text
-            if reasoning:
-                params['reasoning'] = reasoning
-            tool_choice_payload = self._map_tool_choice(tool_choice, tools or [])
-            if tool_choice_payload is not None:
-                params['tool_choice'] = tool_choice_payload
+            params = self._build_params(model, input, previous_response_id, tools, text,
+                                        reasoning, tool_choice, images, attachments)
+
+            # stateless requests (no previous_response_id) can be answered from the cache
+            cache_key = None
+            if self.response_cache is not None and not previous_response_id:
+                cache_key = make_cache_key(params, self.response_cache_scope)
+                cached_response = self.response_cache.get(cache_key)
+                if cached_response is not None:
+                    return cached_response
+
+            # paraphrase matching needs a stateless turn (no previous_response_id); tools are part of the scope
+            semantic_scope, semantic_text, semantic_vector = None, "", None
+            if self.semantic_cache is not None and not previous_response_id:
+                semantic_scope, semantic_text = self.semantic_cache.split_input(params)
+                # the embedding call is only paid when a cached paraphrase can exist in this scope
+                if semantic_text and self.semantic_cache.has_entries(semantic_scope):
+                    semantic_vector = self._embed_for_semantic_cache(semantic_text)
+                    if semantic_vector is not None:
+                        cached_response = self.semantic_cache.lookup(semantic_scope, semantic_vector)
+                        if cached_response is not None:
+                            return cached_response
 
             # Llamar a la API de OpenAI
-            openai_response = self.client.responses.create(**params)
+            openai_response = self._client_with_options(request_timeout, max_retries).responses.create(**params)
 
             # Mapear la respuesta a estructura común
-            return self._map_openai_response(openai_response)
+            response = self._map_openai_response(openai_response)
+            if response.status == 'completed':
+                if cache_key is not None:
+                    self.response_cache.set(cache_key, response)
+                # tool calls depend on the exact wording, only final answers are reused for paraphrases
+                if semantic_text and not response.output:
+                    if semantic_vector is None:
+                        semantic_vector = self._embed_for_semantic_cache(semantic_text)
+                    if semantic_vector is not None:
+                        self.semantic_cache.store(semantic_scope, semantic_vector, response)
+            return response
 
         except Exception as e:
             error_message = f"Error calling OpenAI API: {str(e)}"
@@ -70,6 +112,97 @@ class OpenAIAdapter:
 
             raise IAToolkitException(IAToolkitException.ErrorType.LLM_ERROR, error_message)
 
+    def _embed_for_semantic_cache(self, text: str):
+        try:
+            return self.semantic_cache.embed(text)
+        except Exception as e:
+            logging.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+    def _client_with_options(self, request_timeout: Optional[float], max_retries: Optional[int]):
+        # the SDK already retries timeouts and connection errors with exponential backoff;
+        # per-call options only bound how long each attempt may take and how many there are
+        options = {}
+        if request_timeout:
+            options['timeout'] = request_timeout
+        if max_retries is not None:
+            options['max_retries'] = max_retries
+        return self.client.with_options(**options) if options else self.client
+
+    async def acreate_response(self,
+                               model: str,
+                               input: List[Dict],
+                               previous_response_id: Optional[str] = None,
+                               context_history: Optional[List[Dict]] = None,
+                               tools: Optional[List[Dict]] = None,
+                               text: Optional[Dict] = None,
+                               reasoning: Optional[Dict] = None,
+                               tool_choice: str = "auto",
+                               images: Optional[List[Dict]] = None,
+                               attachments: Optional[List[Dict]] = None,
+                               request_timeout: Optional[float] = None) -> LLMResponse:
+        """Async version of create_response, so several calls can be awaited together."""
+        try:
+            params = self._build_params(model, input, previous_response_id, tools, text,
+                                        reasoning, tool_choice, images, attachments)
+
+            if self.rate_limiter:
+                # wait for budget here rather than being rejected with 429 and backing off
+                await self.rate_limiter.acquire(estimate_tokens(params['input'], model))
+
+            call = self._get_async_client().responses.create(**params)
+            if request_timeout:
+                openai_response = await asyncio.wait_for(call, timeout=request_timeout)
+            else:
+                openai_response = await call
+
+            return self._map_openai_response(openai_response)
+
+        except Exception as e:
+            error_message = f"Error calling OpenAI API: {str(e) or type(e).__name__}"
+            logging.error(error_message)
+
+            raise IAToolkitException(IAToolkitException.ErrorType.LLM_ERROR, error_message)
+
+    def _build_params(self,
+                      model: str,
+                      input: List[Dict],
+                      previous_response_id: Optional[str],
+                      tools: Optional[List[Dict]],
+                      text: Optional[Dict],
+                      reasoning: Optional[Dict],
+                      tool_choice: str,
+                      images: Optional[List[Dict]],
+                      attachments: Optional[List[Dict]]) -> Dict:
+        """Arma los parámetros de la Responses API, comunes a la llamada sync y async."""
+        # Handle multimodal input if images are present
+        if images or attachments:
+            input = self._prepare_multimodal_input(input, images or [], attachments or [])
+
+        # Preparar parámetros para OpenAI
+        params = {
+            'model': model,
+            'input': input
+        }
+
+        # add image generation tool
+        if tools:
+            tools.append({"type": "image_generation"})
+
+        if previous_response_id:
+            params['previous_response_id'] = previous_response_id
+        if tools:
+            params['tools'] = tools
+        if text:
+            params['text'] = text
+        if reasoning:
+            params['reasoning'] = reasoning
+        tool_choice_payload = self._map_tool_choice(tool_choice, tools or [])
+        if tool_choice_payload is not None:
+            params['tool_choice'] = tool_choice_payload
+
+        return params
+
     @staticmethod
     def _map_tool_choice(tool_choice: str, tools_payload: List[Dict]) -> Optional[Dict | str]:
         if tool_choice in ("", None, "auto"):
@@ -118,9 +251,7 @@ class OpenAIAdapter:
         # Agregar partes de imagen (Responses API)
         for img in images:
             filename = img.get('name', '')
-            mime_type, _ = mimetypes.guess_type(filename)
-            if not mime_type:
-                mime_type = 'image/jpeg'
+            mime_type = guess_mime_type(filename) or 'image/jpeg'
 
             base64_data = img.get('base64', '')
             url = f"data:{mime_type};base64,{base64_data}"
@@ -136,7 +267,7 @@ class OpenAIAdapter:
             mime_type = str(
                 attachment.get("mime_type")
                 or attachment.get("type")
-                or mimetypes.guess_type(filename)[0]
+                or guess_mime_type(filename)
                 or "application/octet-stream"
             ).strip().lower()
             base64_data = str(attachment.get("base64") or attachment.get("content") or "").strip()
@@ -167,25 +298,29 @@ class OpenAIAdapter:
         payload = str(base64_data or "").strip()
         if payload.lower().startswith("data:") and "," in payload:
             return payload
-        try:
-            # Validate base64 quickly; preserve original payload if valid.
-            base64.b64decode(payload, validate=True)
+        # Validate base64 without decoding (attachments can be MBs); preserve original payload if valid.
+        if len(payload) % 4 == 0 and _BASE64_RE.fullmatch(payload):
             return f"data:{mime_type};base64,{payload}"
-        except Exception:
-            # If it already includes non-standard wrapping, pass as-is.
-            return payload
+        # If it already includes non-standard wrapping, pass as-is.
+        return payload
 
     def _map_openai_response(self, openai_response) -> LLMResponse:
         """Mapear respuesta de OpenAI (Responses API) a estructura común."""
         tool_calls: List[ToolCall] = []
         content_parts: List[Dict] = []
-        output_text = ""
+        text_parts: List[str] = []
+        reasoning_list: List[str] = []
 
         output_items = getattr(openai_response, "output", None) or []
 
+        # single pass over the output items; text is joined once at the end
         for item in output_items:
             item_type = getattr(item, "type", "") or ""
 
+            if item_type == "reasoning":
+                reasoning_list.extend(self._extract_reasoning_texts(item))
+                continue
+
             # 1) Tool calls: function_call
             if item_type == "function_call":
                 tool_calls.append(ToolCall(
@@ -222,10 +357,12 @@ class OpenAIAdapter:
                     if part_type in ("output_text", "text"):
                         text_content = getattr(part, "text", "") or ""
                         if text_content:
-                            output_text += text_content
+                            text_parts.append(text_content)
                             content_parts.append({"type": "text", "text": text_content})
                 continue
 
+        output_text = "".join(text_parts)
+
         # Fallback: si la API rellenó output_text directo
         if not output_text:
             output_text = getattr(openai_response, "output_text", "") or ""
@@ -235,10 +372,13 @@ class OpenAIAdapter:
         usage = Usage(
             input_tokens=openai_response.usage.input_tokens if openai_response.usage else 0,
             output_tokens=openai_response.usage.output_tokens if openai_response.usage else 0,
-            total_tokens=openai_response.usage.total_tokens if openai_response.usage else 0
+            total_tokens=openai_response.usage.total_tokens if openai_response.usage else 0,
+            cached_input_tokens=self._cached_input_tokens(openai_response.usage),
         )
+        if usage.cached_input_tokens:
+            logging.debug("OpenAI prompt cache: %s/%s input tokens cached",
+                          usage.cached_input_tokens, usage.input_tokens)
 
-        reasoning_list = self._extract_reasoning_content(openai_response)
         reasoning_str = "\n".join(reasoning_list)
 
         return LLMResponse(
@@ -252,9 +392,17 @@ class OpenAIAdapter:
             content_parts=content_parts
         )
 
-    def _extract_reasoning_content(self, openai_response) -> List[str]:
+    @staticmethod
+    def _cached_input_tokens(usage) -> int:
+        # OpenAI caches long shared prompt prefixes automatically; usage reports the hit size
+        details = getattr(usage, "input_tokens_details", None) if usage else None
+        cached = getattr(details, "cached_tokens", 0) if details else 0
+        return cached if isinstance(cached, int) else 0
+
+    @staticmethod
+    def _extract_reasoning_texts(item) -> List[str]:
         """
-        Extract reasoning summaries (preferred) or reasoning content fragments from Responses API output.
+        Extract reasoning summaries (preferred) or reasoning content fragments from a Responses API reasoning item.
 
         Format required by caller:
           1. reason is ...
@@ -262,24 +410,19 @@ class OpenAIAdapter:
         """
         reasons: List[str] = []
 
-        output_items = getattr(openai_response, "output", None) or []
-        for item in output_items:
-            if getattr(item, "type", None) != "reasoning":
-                continue
+        # 1) Preferred: reasoning summaries (requires reasoning={"summary":"auto"} or similar)
+        summary = getattr(item, "summary", None) or []
+        for s in summary:
+            text = getattr(s, "text", None)
+            if text:
+                reasons.append(str(text).strip())
 
-            # 1) Preferred: reasoning summaries (requires reasoning={"summary":"auto"} or similar)
-            summary = getattr(item, "summary", None) or []
-            for s in summary:
-                text = getattr(s, "text", None)
-                if text:
-                    reasons.append(str(text).strip())
-
-            # 2) Fallback: some responses may carry reasoning content in "content"
-            # (e.g., content parts like {"type":"reasoning_text","text":"..."}).
-            content = getattr(item, "content", None) or []
-            for c in content:
-                text = getattr(c, "text", None)
-                if text:
-                    reasons.append(str(text).strip())
+        # 2) Fallback: some responses may carry reasoning content in "content"
+        # (e.g., content parts like {"type":"reasoning_text","text":"..."}).
+        content = getattr(item, "content", None) or []
+        for c in content:
+            text = getattr(c, "text", None)
+            if text:
+                reasons.append(str(text).strip())
 
         return reasons
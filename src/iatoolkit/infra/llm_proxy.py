@@ -12,6 +12,13 @@ from iatoolkit.infra.llm_providers.anthropic_adapter import AnthropicAdapter
 from iatoolkit.common.exceptions import IAToolkitException
 from iatoolkit.common.util import Utility
 from iatoolkit.infra.llm_response import LLMResponse
+from iatoolkit.infra.llm_response_cache import (
+    InMemoryLLMResponseCache,
+    RedisLLMResponseCache,
+    SemanticLLMResponseCache,
+    make_cache_scope,
+)
+from iatoolkit.infra.rate_limiter import get_rate_limiter
 from iatoolkit.common.model_registry import ModelRegistry
 from iatoolkit.common.interfaces.secret_provider import SecretProvider
 from iatoolkit.common.secret_resolver import resolve_secret
@@ -19,6 +26,7 @@ from iatoolkit.common.secret_resolver import resolve_secret
 from openai import OpenAI         # For OpenAI and xAI (OpenAI-compatible)
 
 from typing import Dict, List, Any, Tuple
+import os
 import threading
 from injector import inject
 
@@ -32,6 +40,14 @@ class LLMProxy:
     _clients_cache: Dict[Tuple[str, str], Any] = {}
     _clients_cache_lock = threading.Lock()
 
+    # Optional exact-match response cache, shared by all adapters (LLM_RESPONSE_CACHE=memory|redis)
+    _response_cache = None
+    _response_cache_lock = threading.Lock()
+
+    # Optional paraphrase caches (LLM_SEMANTIC_CACHE=true), one per provider + API key, kept
+    # at class level like the clients so they outlive the per-request proxies and adapters
+    _semantic_caches: Dict[Tuple[str, str], SemanticLLMResponseCache] = {}
+
     # Provider identifiers
     PROVIDER_OPENAI = "openai"
     PROVIDER_GEMINI = "gemini"
@@ -82,6 +98,9 @@ class LLMProxy:
             company_short_name=company_short_name,
         )
 
+        if provider == self.PROVIDER_OPENAI:
+            kwargs = {**self._get_request_options(company_short_name), **kwargs}
+
         # Delegate to the adapter (OpenAI, Gemini, DeepSeek, xAI, Anthropic, etc.)
         return adapter.create_response(model=model, input=input, **kwargs)
 
@@ -134,7 +153,12 @@ class LLMProxy:
 
         # Wrap client with the correct adapter
         if provider == self.PROVIDER_OPENAI:
-            adapter = OpenAIAdapter(client)
+            llm_config = self.configuration_service.get_configuration(company_short_name, "llm") or {}
+            adapter = OpenAIAdapter(client,
+                                    response_cache=self._get_response_cache(),
+                                    response_cache_scope=make_cache_scope(provider, api_key),
+                                    semantic_cache=self._get_semantic_cache(adapter_cache_key, client),
+                                    rate_limiter=get_rate_limiter(adapter_cache_key, llm_config.get("rate_limit")))
         elif provider == self.PROVIDER_GEMINI:
             adapter = GeminiAdapter(client)
         elif provider == self.PROVIDER_DEEPSEEK:
@@ -150,6 +174,36 @@ class LLMProxy:
         self.adapters[adapter_cache_key] = adapter
         return adapter
 
+    @classmethod
+    def _get_response_cache(cls):
+        backend = os.getenv("LLM_RESPONSE_CACHE", "").strip().lower()
+        if backend not in ("memory", "redis"):
+            return None
+
+        with cls._response_cache_lock:
+            if cls._response_cache is None:
+                ttl = int(os.getenv("LLM_RESPONSE_CACHE_TTL", "3600"))
+                if backend == "redis":
+                    cls._response_cache = RedisLLMResponseCache(ttl=ttl)
+                else:
+                    cls._response_cache = InMemoryLLMResponseCache(ttl=ttl)
+            return cls._response_cache
+
+    @classmethod
+    def _get_semantic_cache(cls, cache_key: Tuple[str, str], client):
+        # paraphrase cache (LLM_SEMANTIC_CACHE=true); embeddings use the same OpenAI client
+        if os.getenv("LLM_SEMANTIC_CACHE", "").strip().lower() not in ("1", "true", "yes"):
+            return None
+
+        with cls._response_cache_lock:
+            if cache_key not in cls._semantic_caches:
+                cls._semantic_caches[cache_key] = SemanticLLMResponseCache(
+                    client,
+                    threshold=float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0.92")),
+                    ttl=int(os.getenv("LLM_RESPONSE_CACHE_TTL", "3600")),
+                )
+            return cls._semantic_caches[cache_key]
+
     # -------------------------------------------------------------------------
     # Client cache
     # -------------------------------------------------------------------------
@@ -273,10 +327,25 @@ class LLMProxy:
 
         return api_key_value
 
+    def _get_request_options(self, company_short_name: str) -> Dict[str, Any]:
+        """
+        Optional per-company limits for a single LLM call (llm.request_timeout in seconds, llm.max_retries).
+        """
+        llm_config = self.configuration_service.get_configuration(company_short_name, "llm") or {}
+        options = {}
+        if llm_config.get("request_timeout"):
+            options["request_timeout"] = float(llm_config["request_timeout"])
+        if llm_config.get("max_retries") is not None:
+            options["max_retries"] = int(llm_config["max_retries"])
+        return options
+
     @classmethod
     def clear_low_level_clients_cache(cls):
         with cls._clients_cache_lock:
             cls._clients_cache.clear()
+        # the paraphrase caches embed with those clients and hold answers of the old configuration
+        with cls._response_cache_lock:
+            cls._semantic_caches.clear()
 
     def clear_runtime_cache(self):
         self.adapters.clear()
@@ -21,6 +21,7 @@ class Usage:
     input_tokens: int
     output_tokens: int
     total_tokens: int
+    cached_input_tokens: int = 0  # parte de input_tokens servida desde el prompt cache del proveedor
 
 
 @dataclass
@@ -0,0 +1,232 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from iatoolkit.infra.llm_response import LLMResponse, ToolCall, Usage
+from iatoolkit.infra.redis_session_manager import RedisSessionManager
+
+
+def make_cache_key(params: Dict[str, Any], scope: str = "") -> str:
+    """SHA-256 of the request parameters, independent of dict ordering, within a cache scope."""
+    payload = json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(f"{scope}\n{payload}".encode('utf-8')).hexdigest()
+
+
+def make_cache_scope(provider: str, api_key: str) -> str:
+    """
+    Scope of cached responses: a response id only exists for the provider account (API key)
+    that created it, so other keys must not reuse it as previous_response_id.
+    The key is hashed, since scopes end up in shared stores such as Redis.
+    """
+    return hashlib.sha256(f"{provider}:{api_key or ''}".encode('utf-8')).hexdigest()[:32]
+
+
+def response_to_dict(response: LLMResponse) -> Dict[str, Any]:
+    return asdict(response)
+
+
+def response_from_dict(data: Dict[str, Any]) -> LLMResponse:
+    return LLMResponse(
+        id=data['id'],
+        model=data['model'],
+        status=data['status'],
+        output_text=data['output_text'],
+        output=[ToolCall(**call) for call in data.get('output') or []],
+        usage=Usage(**data['usage']),
+        reasoning_content=data.get('reasoning_content'),
+        content_parts=data.get('content_parts'),
+    )
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache of LLM responses, keyed by make_cache_key(request params).
+    Subclasses implement _get/_set; hit/miss counters are kept here.
+    """
+    LOG_EVERY = 100
+
+    def __init__(self, ttl: int = 3600):
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        try:
+            data = self._get(key)
+        except Exception as e:
+            logging.warning(f"LLM response cache read failed: {e}")
+            data = None
+        self._count("hits" if data is not None else "misses")
+        return response_from_dict(data) if data is not None else None
+
+    def set(self, key: str, response: LLMResponse, ttl: Optional[int] = None):
+        try:
+            self._set(key, response_to_dict(response), ttl or self.ttl)
+        except Exception as e:
+            logging.warning(f"LLM response cache write failed: {e}")
+
+    def _count(self, field: str):
+        with self._stats_lock:
+            self.stats[field] += 1
+            lookups = self.stats["hits"] + self.stats["misses"]
+            if lookups % self.LOG_EVERY == 0:
+                logging.info(f"LLM response cache: {self.stats['hits']} hits / {lookups} lookups")
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _set(self, key: str, data: Dict[str, Any], ttl: int):
+        raise NotImplementedError
+
+
+class InMemoryLLMResponseCache(LLMResponseCache):
+    """Per-process LRU cache; entries are evicted by size and expire after their ttl."""
+
+    def __init__(self, max_entries: int = 512, ttl: int = 3600):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        # key -> (monotonic expiry time, response data)
+        self._entries: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _set(self, key: str, data: Dict[str, Any], ttl: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class RedisLLMResponseCache(LLMResponseCache):
+    """Cache shared by all workers through the application's Redis."""
+    KEY_PREFIX = "llm_response_cache:"
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = RedisSessionManager.get(self.KEY_PREFIX + key, default=None)
+        return json.loads(value) if value else None
+
+    def _set(self, key: str, data: Dict[str, Any], ttl: int):
+        RedisSessionManager.set(self.KEY_PREFIX + key, json.dumps(data), ex=ttl)
+
+
+class SemanticLLMResponseCache:
+    """
+    Reuses a response when a new prompt is a paraphrase of a cached one: the user text is
+    embedded and compared (cosine similarity) against the prompts cached in the same scope.
+    The scope is the exact-match key of everything except the user messages, so model,
+    instructions, tools and output settings must be identical for a hit.
+    Entries expire after `ttl` seconds; at most `max_scopes` scopes (least recently used
+    evicted first) of `max_entries` prompts each are kept.
+    """
+
+    def __init__(self,
+                 embed_client,
+                 threshold: float = 0.92,
+                 max_entries: int = 1000,
+                 max_scopes: int = 256,
+                 ttl: int = 3600,
+                 embedding_model: str = "text-embedding-3-small"):
+        self.embed_client = embed_client
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_scopes = max_scopes
+        self.ttl = ttl
+        self.embedding_model = embedding_model
+        self.stats = {"hits": 0, "misses": 0}
+        # scope -> (normalized vectors matrix, responses, stored_at), oldest first; scopes in LRU order
+        self._entries: OrderedDict[str, Tuple[np.ndarray, List[Dict[str, Any]], np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def split_input(params: Dict[str, Any]) -> Tuple[str, str]:
+        """Returns (scope, user_text) for a request; user_text is empty when there is nothing to embed."""
+        user_texts, other_messages = [], []
+        for message in params.get('input') or []:
+            if isinstance(message, dict) and message.get('role') == 'user':
+                content = message.get('content')
+                if not isinstance(content, str):
+                    # multimodal content is never matched semantically
+                    return "", ""
+                user_texts.append(content)
+            else:
+                other_messages.append(message)
+
+        scope_params = {key: value for key, value in params.items() if key != 'input'}
+        scope_params['input'] = other_messages
+        return make_cache_key(scope_params), "\n".join(user_texts).strip()
+
+    def embed(self, text: str) -> np.ndarray:
+        result = self.embed_client.embeddings.create(model=self.embedding_model, input=text)
+        vector = np.asarray(result.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def has_entries(self, scope: str) -> bool:
+        """True when a lookup in `scope` can hit, so callers embed only when it is worth it."""
+        with self._lock:
+            self._expire(scope)
+            return scope in self._entries
+
+    def lookup(self, scope: str, vector: np.ndarray) -> Optional[LLMResponse]:
+        with self._lock:
+            self._expire(scope)
+            entry = self._entries.get(scope)
+            match = None
+            if entry is not None:
+                self._entries.move_to_end(scope)
+                scores = entry[0] @ vector
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    match = entry[1][best]
+            self.stats["hits" if match is not None else "misses"] += 1
+        return response_from_dict(match) if match is not None else None
+
+    def store(self, scope: str, vector: np.ndarray, response: LLMResponse):
+        with self._lock:
+            self._expire(scope)
+            vectors, responses, stored_at = self._entries.pop(
+                scope, (np.empty((0, vector.size), dtype=np.float32), [], np.empty(0)))
+            vectors = np.vstack([vectors, vector])[-self.max_entries:]
+            responses = (responses + [response_to_dict(response)])[-self.max_entries:]
+            stored_at = np.append(stored_at, time.monotonic())[-self.max_entries:]
+            self._entries[scope] = (vectors, responses, stored_at)
+            while len(self._entries) > self.max_scopes:
+                self._entries.popitem(last=False)
+
+    def _expire(self, scope: str):
+        # caller holds the lock; entries are stored oldest first, so the fresh ones are a suffix
+        entry = self._entries.get(scope)
+        if entry is None:
+            return
+        vectors, responses, stored_at = entry
+        fresh = stored_at > time.monotonic() - self.ttl
+        if fresh.all():
+            return
+        if not fresh.any():
+            del self._entries[scope]
+            return
+        first = int(np.argmax(fresh))
+        self._entries[scope] = (vectors[first:], responses[first:], stored_at[first:])
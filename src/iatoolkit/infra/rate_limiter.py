@@ -0,0 +1,146 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import tiktoken
+
+DEFAULT_ENCODING_MODEL = "gpt-4o"
+
+
+class RateLimiter:
+    """
+    Token bucket that keeps callers just under a requests/tokens per minute limit,
+    instead of letting the provider reject them with 429 and retrying with backoff.
+    Both budgets refill continuously at limit/60 per second; a limit of None is not enforced.
+    The state is guarded by a thread lock, so one limiter can be shared by several event loops.
+    """
+
+    def __init__(self, requests_per_min: Optional[float] = None, tokens_per_min: Optional[float] = None):
+        self.requests_per_min = requests_per_min
+        self.tokens_per_min = tokens_per_min
+        self._requests = float(requests_per_min or 0)
+        self._tokens = float(tokens_per_min or 0)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int = 0):
+        """Waits until one request of `tokens` tokens fits in the budget, and consumes it."""
+        while True:
+            wait = self._try_consume(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _try_consume(self, tokens: int) -> float:
+        """Consumes the budget and returns 0, or returns the seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._updated_at = now - self._updated_at, now
+
+            wait = 0.0
+            if self.requests_per_min:
+                self._requests = min(self.requests_per_min, self._requests + elapsed * self.requests_per_min / 60)
+                wait = max(wait, (1 - self._requests) * 60 / self.requests_per_min)
+            if self.tokens_per_min:
+                # a request larger than the whole bucket waits for a full bucket, not forever
+                tokens = min(tokens, self.tokens_per_min)
+                self._tokens = min(self.tokens_per_min, self._tokens + elapsed * self.tokens_per_min / 60)
+                wait = max(wait, (tokens - self._tokens) * 60 / self.tokens_per_min)
+
+            if wait > 0:
+                return wait
+
+            if self.requests_per_min:
+                self._requests -= 1
+            if self.tokens_per_min:
+                self._tokens -= tokens
+            return 0.0
+
+
+_limiters: Dict[Tuple, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(scope: Tuple, config: Optional[Dict[str, Any]]) -> Optional[RateLimiter]:
+    """
+    Returns the limiter shared by every caller of `scope` (e.g. provider + api key),
+    built from a {requests_per_min, tokens_per_min} config; None when no limit is configured.
+    """
+    if not isinstance(config, dict):
+        return None
+    requests_per_min = config.get('requests_per_min')
+    tokens_per_min = config.get('tokens_per_min')
+    if not requests_per_min and not tokens_per_min:
+        return None
+
+    if tokens_per_min:
+        # load the encoding now, not on the first estimate_tokens of a request
+        warm_encoding(DEFAULT_ENCODING_MODEL)
+
+    key = (*scope, requests_per_min, tokens_per_min)
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter(
+                float(requests_per_min) if requests_per_min else None,
+                float(tokens_per_min) if tokens_per_min else None,
+            )
+        return _limiters[key]
+
+# model -> tiktoken encoding, or None when it could not be loaded
+_encodings: Dict[str, Any] = {}
+_encodings_loading: set = set()
+_encodings_lock = threading.Lock()
+
+
+def warm_encoding(model: str):
+    """Loads the tiktoken encoding of `model` in a background thread, once."""
+    with _encodings_lock:
+        if model in _encodings or model in _encodings_loading:
+            return
+        _encodings_loading.add(model)
+    threading.Thread(target=_load_encoding, args=(model,), name='iat-tiktoken-load', daemon=True).start()
+
+
+def _load_encoding(model: str):
+    # encodings are downloaded on first use; when that fails, None is kept and a rough estimate is used
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logging.warning(f"tiktoken encoding unavailable for rate limiting, using length estimate: {e}")
+        encoding = None
+
+    with _encodings_lock:
+        _encodings[model] = encoding
+        _encodings_loading.discard(model)
+
+
+def _get_encoding(model: str):
+    # callers run on the event loop, so they never wait for a download: None until it is loaded
+    with _encodings_lock:
+        if model in _encodings:
+            return _encodings[model]
+    warm_encoding(model)
+    return None
+
+
+def estimate_tokens(payload: Any, model: Optional[str] = None) -> int:
+    """
+    Token count of a prompt (string or JSON-serializable input) for rate limiting purposes.
+    Until the model's encoding is loaded, it is estimated from the text length.
+    """
+    text = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False, default=str)
+    encoding = _get_encoding(model or DEFAULT_ENCODING_MODEL)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
@@ -15,6 +15,11 @@ import logging
 
 
 class DatabaseManager(DatabaseProvider):
+    FETCH_BATCH_SIZE = 1000
+    # compiled SQL cached per engine (SQLAlchemy default: 500); the repositories,
+    # relationship loaders and bulk statements together exceed the default and evict each other
+    QUERY_CACHE_SIZE = 1200
+
     _POSTGRES_BOOTSTRAP_PATCHES = (
     )
 
@@ -39,7 +44,7 @@ class DatabaseManager(DatabaseProvider):
         self.url = make_url(database_url)
 
         if database_url.startswith('sqlite'):
-            raw_engine = create_engine(database_url, echo=False)
+            raw_engine = create_engine(database_url, echo=False, query_cache_size=self.QUERY_CACHE_SIZE)
         else:
             raw_engine = create_engine(
                 database_url,
@@ -50,6 +55,7 @@ class DatabaseManager(DatabaseProvider):
                 pool_recycle=1800,
                 pool_pre_ping=True,
                 pool_use_lifo=True,
+                query_cache_size=self.QUERY_CACHE_SIZE,
                 connect_args={
                     "keepalives": 1,
                     "keepalives_idle": 30,
@@ -162,9 +168,13 @@ class DatabaseManager(DatabaseProvider):
             session.commit()
 
         if result.returns_rows:
-            # Convert SQLAlchemy rows to list of dicts immediately
-            cols = result.keys()
-            return [dict(zip(cols, row)) for row in result.fetchall()]
+            # Convert SQLAlchemy rows to dicts batch by batch, so the full list of
+            # Row objects is never held in memory next to the list of dicts
+            cols = tuple(result.keys())
+            rows = []
+            while batch := result.fetchmany(self.FETCH_BATCH_SIZE):
+                rows.extend(dict(zip(cols, row)) for row in batch)
+            return rows
 
         return {'rowcount': result.rowcount}
 
@@ -177,15 +187,29 @@ class DatabaseManager(DatabaseProvider):
     # -- schema methods ----
     def get_database_structure(self) -> dict:
         inspector = inspect(self._engine)
+
+        # reflect columns and primary keys for every table in one pass,
+        # instead of two catalog round-trips per table
+        try:
+            multi_columns = inspector.get_multi_columns(schema=self.schema)
+            multi_pks = inspector.get_multi_pk_constraint(schema=self.schema)
+        except Exception as e:
+            logging.debug(f"Batch reflection unavailable for schema {self.schema}: {e}")
+            multi_columns, multi_pks = None, None
+
         structure = {}
         for table in inspector.get_table_names(schema=self.schema):
             columns_data = []
 
             # get columns
             try:
-                columns = inspector.get_columns(table, schema=self.schema)
-                # Obtener PKs para marcarlas
-                pks = inspector.get_pk_constraint(table, schema=self.schema).get('constrained_columns', [])
+                if multi_columns is not None:
+                    columns = self._get_reflected(multi_columns, table) or []
+                    pks = (self._get_reflected(multi_pks, table) or {}).get('constrained_columns', [])
+                else:
+                    columns = inspector.get_columns(table, schema=self.schema)
+                    # Obtener PKs para marcarlas
+                    pks = inspector.get_pk_constraint(table, schema=self.schema).get('constrained_columns', [])
 
                 for col in columns:
                     columns_data.append({
@@ -202,3 +226,10 @@ class DatabaseManager(DatabaseProvider):
             }
 
         return structure
+
+    def _get_reflected(self, reflected: dict, table: str):
+        # multi-reflection keys are (schema, table); the schema is None for the default one
+        value = reflected.get((self.schema, table))
+        if value is None:
+            value = reflected.get((None, table))
+        return value
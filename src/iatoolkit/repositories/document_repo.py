@@ -48,7 +48,8 @@ class DocumentRepo:
         if not document_id:
             return None
 
-        return self.session.query(Document).filter_by(id=document_id).first()
+        # primary key lookups go through the identity map and skip SQL when already loaded
+        return self.session.get(Document, document_id)
 
     def get_collection_id_by_name(self, company_short_name: str, collection_name: str) -> Optional[int]:
         if not collection_name:
@@ -96,7 +97,7 @@ class DocumentRepo:
         if not collection_id:
             return None
 
-        return self.session.query(CollectionType).filter_by(id=collection_id).first()
+        return self.session.get(CollectionType, collection_id)
 
     def list_documents_by_collection(self, company_id: int, collection_id: int) -> List[Document]:
         if not company_id or not collection_id:
@@ -1,5 +1,6 @@
 from iatoolkit.common.interfaces.asset_storage import AssetRepository, AssetType
 from pathlib import Path
+import logging
 
 
 class FileSystemAssetRepository(AssetRepository):
@@ -24,6 +25,23 @@ class FileSystemAssetRepository(AssetRepository):
             files = [f for f in files if f.endswith(extension)]
         return files
 
+    def read_many(self, company_short_name: str, asset_type: AssetType, extension: str = None) -> dict[str, str]:
+        # one directory scan, then plain reads: no per-file path checks as with list_files + read_text
+        directory = self._get_path(company_short_name, asset_type)
+        if not directory.exists():
+            return {}
+
+        contents = {}
+        for f in directory.iterdir():
+            if extension and not f.name.endswith(extension):
+                continue
+            try:
+                if f.is_file():
+                    contents[f.name] = f.read_text(encoding="utf-8")
+            except Exception as e:
+                logging.warning(f"Error reading {asset_type.value} file {f.name}: {e}")
+        return contents
+
     def write_text(self, company_short_name: str, asset_type: AssetType, filename: str, content: str) -> None:
         path = self._get_path(company_short_name, asset_type, filename)
         # Ensure the directory exists (e.g. creating a new company structure)
@@ -109,14 +109,7 @@ class LLMQueryRepo:
             tool = self.session.query(Tool).filter_by(company_id=new_tool.company_id, name=new_tool.name).first()
 
         if tool:
-            tool.name = new_tool.name
-            tool.description = new_tool.description
-            tool.parameters = new_tool.parameters
-            tool.execution_config = new_tool.execution_config
-            tool.tool_type = new_tool.tool_type
-            tool.source = new_tool.source
-            if new_tool.is_active is not None:
-                tool.is_active = new_tool.is_active
+            self._copy_tool_fields(tool, new_tool)
         else:
             self.session.add(new_tool)
             tool = new_tool
@@ -124,6 +117,44 @@ class LLMQueryRepo:
         self.session.commit()
         return tool
 
+    def create_or_update_system_tools(self, new_tools: list[Tool]) -> list[Tool]:
+        # bulk version of create_or_update_tool for system tools:
+        # a single lookup for all the names and a single commit
+        names = [new_tool.name for new_tool in new_tools]
+        existing_by_name = {}
+        if names:
+            existing_by_name = {
+                tool.name: tool
+                for tool in self.session.query(Tool).filter(
+                    Tool.tool_type == Tool.TYPE_SYSTEM,
+                    Tool.name.in_(names),
+                ).all()
+            }
+
+        tools = []
+        for new_tool in new_tools:
+            tool = existing_by_name.get(new_tool.name)
+            if tool:
+                self._copy_tool_fields(tool, new_tool)
+            else:
+                self.session.add(new_tool)
+                tool = new_tool
+            tools.append(tool)
+
+        self.session.commit()
+        return tools
+
+    @staticmethod
+    def _copy_tool_fields(tool: Tool, new_tool: Tool):
+        tool.name = new_tool.name
+        tool.description = new_tool.description
+        tool.parameters = new_tool.parameters
+        tool.execution_config = new_tool.execution_config
+        tool.tool_type = new_tool.tool_type
+        tool.source = new_tool.source
+        if new_tool.is_active is not None:
+            tool.is_active = new_tool.is_active
+
     def delete_tool(self, tool: Tool):
         self.session.delete(tool)
         self.session.commit()
@@ -167,6 +198,24 @@ class LLMQueryRepo:
     def create_or_update_prompt(self, new_prompt: Prompt):
         prompt = self.session.query(Prompt).filter_by(company_id=new_prompt.company_id,
                                                  name=new_prompt.name).first()
+        prompt = self._merge_prompt(prompt, new_prompt)
+        self.session.commit()
+        return prompt
+
+    def upsert_prompts(self, company_id: int, new_prompts: List[Prompt]) -> List[Prompt]:
+        """
+        Creates or updates several prompts of a company with a single SELECT.
+        Nothing is committed: the caller commits (or rolls back) the whole sync at once.
+        """
+        existing = {p.name: p for p in self.session.query(Prompt).filter_by(company_id=company_id).all()}
+        persisted = []
+        for new_prompt in new_prompts:
+            prompt = self._merge_prompt(existing.get(new_prompt.name), new_prompt)
+            existing[prompt.name] = prompt
+            persisted.append(prompt)
+        return persisted
+
+    def _merge_prompt(self, prompt: Prompt | None, new_prompt: Prompt) -> Prompt:
         if prompt:
             prompt.category_id = new_prompt.category_id
             prompt.description = new_prompt.description
@@ -200,7 +249,6 @@ class LLMQueryRepo:
             self.session.add(new_prompt)
             prompt = new_prompt
 
-        self.session.commit()
         return prompt
 
     def delete_prompt(self, prompt: Prompt):
@@ -226,3 +274,21 @@ class LLMQueryRepo:
 
         self.session.commit()
         return category
+
+    def upsert_prompt_categories(self, company_id: int,
+                                 new_categories: List[PromptCategory]) -> dict[str, PromptCategory]:
+        """
+        Creates or updates several categories of a company with a single SELECT and flush
+        (so new categories get their ids), without committing. Returns them by name.
+        """
+        existing = {c.name: c for c in self.session.query(PromptCategory).filter_by(company_id=company_id).all()}
+        for new_category in new_categories:
+            category = existing.get(new_category.name)
+            if category:
+                category.order = new_category.order
+            else:
+                self.session.add(new_category)
+                existing[new_category.name] = new_category
+
+        self.session.flush()
+        return {c.name: existing[c.name] for c in new_categories}
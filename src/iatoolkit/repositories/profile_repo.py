@@ -6,6 +6,7 @@
 from iatoolkit.repositories.models import (User, Company, user_company,
                                            UserFeedback, AccessLog)
 from injector import inject
+from flask import g, has_request_context
 from iatoolkit.repositories.database_manager import DatabaseManager
 from sqlalchemy import select, func, and_
 from sqlalchemy.exc import OperationalError
@@ -72,6 +73,27 @@ class ProfileRepo:
         return self.session.query(Company).filter_by(id=company_id).first()
 
     def get_company_by_short_name(self, short_name: str) -> Company:
+        # The same company is resolved several times per request (auth, views, services),
+        # so found companies are memoized for the request; they belong to its scoped session.
+        request_cache = self._get_request_company_cache()
+        if request_cache is not None:
+            company = request_cache.get(short_name)
+            # a close() of the session (e.g. by VSRepo.query) detaches it: look it up again
+            if company is not None and company in self.session:
+                return company
+
+        company = self._query_company_by_short_name(short_name)
+        if request_cache is not None and company is not None:
+            request_cache[short_name] = company
+        return company
+
+    @staticmethod
+    def _get_request_company_cache() -> dict | None:
+        if not has_request_context():
+            return None
+        return g.setdefault('_iat_companies_by_short_name', {})
+
+    def _query_company_by_short_name(self, short_name: str) -> Company:
         # Retry once for transient SSL/network disconnects from pooled connections.
         for attempt in (1, 2):
             try:
@@ -82,6 +104,9 @@ class ProfileRepo:
                 except Exception:
                     pass
                 self.db_manager.remove_session()
+                # companies memoized for this request belonged to the removed session
+                if has_request_context():
+                    g.pop('_iat_companies_by_short_name', None)
 
                 if attempt == 1:
                     logging.warning(
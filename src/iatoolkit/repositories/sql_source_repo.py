@@ -39,6 +39,20 @@ class SqlSourceRepo:
         self.session.commit()
         return persisted
 
+    def save_all(self, upserts: list[SqlSource], deletes: list[SqlSource]) -> list[SqlSource]:
+        """Persists a batch of upserts and deletes in a single transaction (one commit)."""
+        persisted = []
+        for source in upserts:
+            if source.id:
+                persisted.append(self.session.merge(source))
+            else:
+                self.session.add(source)
+                persisted.append(source)
+        for source in deletes:
+            self.session.delete(source)
+        self.session.commit()
+        return persisted
+
     def delete(self, source: SqlSource) -> None:
         self.session.delete(source)
         self.session.commit()
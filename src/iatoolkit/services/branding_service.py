@@ -6,6 +6,63 @@
 from iatoolkit.repositories.models import Company
 from iatoolkit.services.configuration_service import ConfigurationService
 from injector import inject
+from types import MappingProxyType
+
+
+# Default branding styles for the application, shared read-only by every BrandingService.
+_DEFAULT_BRANDING = MappingProxyType({
+    # --- Estilos del Encabezado Principal ---
+    "header_background_color": None,
+    "header_text_color": None,
+    "primary_font_weight": "600",
+    "primary_font_size": "1.2rem",
+    "secondary_font_weight": "400",
+    "secondary_font_size": "0.9rem",
+    "tertiary_font_weight": "300",
+    "tertiary_font_size": "0.8rem",
+    "tertiary_opacity": "0.7",
+
+    # headings
+    "brand_text_heading_color": "#334155",  # Gris pizarra por defecto
+
+    # Estilos Globales de la Marca ---
+    "brand_primary_color": "#0d6efd",  # Azul de Bootstrap por defecto
+    "brand_secondary_color": "#6c757d",  # Gris de Bootstrap por defecto
+    "brand_text_on_primary": "#FFFFFF",  # Texto blanco sobre color primario
+    "brand_text_on_secondary": "#FFFFFF",  # Texto blanco sobre color secundario
+
+    # Estilos para Alertas de Error ---
+    "brand_danger_color": "#dc3545",  # Rojo principal para alertas
+    "brand_danger_bg": "#f8d7da",  # Fondo rojo pálido
+    "brand_danger_text": "#000000",
+    "brand_danger_border": "#f5c2c7",  # Borde rojo intermedio
+
+    # Estilos para Alertas Informativas ---
+    "brand_info_bg": "#F0F4F8",         # Un fondo de gris azulado muy pálido
+    "brand_info_text": "#0d6efd",       # Texto en el color primario
+    "brand_info_border": "#D9E2EC",     # Borde de gris azulado pálido
+
+    # Estilos para el Asistente de Prompts ---
+    "prompt_assistant_bg": "#f8f9fa",
+    "prompt_assistant_border": "#dee2e6",
+    "prompt_assistant_button_bg": "#FFFFFF",
+    "prompt_assistant_button_text": "#495057",
+    "prompt_assistant_button_border": "#ced4da",
+    "prompt_assistant_dropdown_bg": "#f8f9fa",
+    "prompt_assistant_header_bg": "#e9ecef",
+    "prompt_assistant_header_text": "#495057",
+
+    # this use the primary by default
+    "prompt_assistant_icon_color": None,
+    "prompt_assistant_item_hover_bg": None,
+    "prompt_assistant_item_hover_text": None,
+
+    # Color para el botón de Enviar ---
+    "send_button_color": "#212529",          # Gris oscuro/casi negro por defecto
+
+    # Loading spinner color in chat query flow (fallback to primary brand color)
+    "loading_spinner_color": None
+})
 
 
 class BrandingService:
@@ -15,69 +72,14 @@ class BrandingService:
     @inject
     def __init__(self, config_service: ConfigurationService):
         self.config_service = config_service
-        """
-        Define los estilos de branding por defecto para la aplicación.
-        """
-        self._default_branding = {
-            # --- Estilos del Encabezado Principal ---
-            "header_background_color": None,
-            "header_text_color": None,
-            "primary_font_weight": "600",
-            "primary_font_size": "1.2rem",
-            "secondary_font_weight": "400",
-            "secondary_font_size": "0.9rem",
-            "tertiary_font_weight": "300",
-            "tertiary_font_size": "0.8rem",
-            "tertiary_opacity": "0.7",
-
-            # headings
-            "brand_text_heading_color": "#334155",  # Gris pizarra por defecto
-
-            # Estilos Globales de la Marca ---
-            "brand_primary_color": "#0d6efd",  # Azul de Bootstrap por defecto
-            "brand_secondary_color": "#6c757d",  # Gris de Bootstrap por defecto
-            "brand_text_on_primary": "#FFFFFF",  # Texto blanco sobre color primario
-            "brand_text_on_secondary": "#FFFFFF",  # Texto blanco sobre color secundario
-
-            # Estilos para Alertas de Error ---
-            "brand_danger_color": "#dc3545",  # Rojo principal para alertas
-            "brand_danger_bg": "#f8d7da",  # Fondo rojo pálido
-            "brand_danger_text": "#000000",
-            "brand_danger_border": "#f5c2c7",  # Borde rojo intermedio
-
-            # Estilos para Alertas Informativas ---
-            "brand_info_bg": "#F0F4F8",         # Un fondo de gris azulado muy pálido
-            "brand_info_text": "#0d6efd",       # Texto en el color primario
-            "brand_info_border": "#D9E2EC",     # Borde de gris azulado pálido
-
-            # Estilos para el Asistente de Prompts ---
-            "prompt_assistant_bg": "#f8f9fa",
-            "prompt_assistant_border": "#dee2e6",
-            "prompt_assistant_button_bg": "#FFFFFF",
-            "prompt_assistant_button_text": "#495057",
-            "prompt_assistant_button_border": "#ced4da",
-            "prompt_assistant_dropdown_bg": "#f8f9fa",
-            "prompt_assistant_header_bg": "#e9ecef",
-            "prompt_assistant_header_text": "#495057",
-
-            # this use the primary by default
-            "prompt_assistant_icon_color": None,
-            "prompt_assistant_item_hover_bg": None,
-            "prompt_assistant_item_hover_text": None,
-
-            # Color para el botón de Enviar ---
-            "send_button_color": "#212529",          # Gris oscuro/casi negro por defecto
-
-            # Loading spinner color in chat query flow (fallback to primary brand color)
-            "loading_spinner_color": None
-        }
+        self._default_branding = _DEFAULT_BRANDING
 
     def get_company_branding(self, company_short_name: str) -> dict:
         """
         Retorna los estilos de branding finales para una compañía,
         fusionando los valores por defecto con los personalizados.
         """
-        final_branding_values = self._default_branding.copy()
+        final_branding_values = dict(self._default_branding)
         branding_data = self.config_service.get_configuration(company_short_name, 'branding')
         if isinstance(branding_data, dict):
             final_branding_values.update(branding_data)
@@ -7,6 +7,7 @@ from iatoolkit.common.util import Utility
 from iatoolkit.common.interfaces.asset_storage import AssetRepository, AssetType
 from iatoolkit.services.sql_source_service import SqlSourceService
 from iatoolkit.services.sql_service import SqlService
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import yaml
 from injector import inject
@@ -92,14 +93,14 @@ class CompanyContextService:
                     continue
 
                 # 2. Build Header for this Database
-                db_context = f"***Database (`database_key`)***: {db_name}\n"
+                db_parts = [f"***Database (`database_key`)***: {db_name}\n"]
 
                 # Optional: Add DB description from config if available (useful context)
                 db_desc = source.get('description', '')
                 if db_desc:
-                    db_context += f"**Description:** {db_desc}\n"
+                    db_parts.append(f"**Description:** {db_desc}\n")
 
-                db_context += (
+                db_parts.append(
                     f"IMPORTANT: To query this database you MUST use the service/tool "
                     f"**iat_sql_query**, with `database_key='{db_name}'`.\n"
                 )
@@ -110,11 +111,11 @@ class CompanyContextService:
                     columns = table_data.get('columns', [])
 
                     # Table Header
-                    table_str = f"\nTable: **{table_name}**"
+                    db_parts.append(f"\nTable: **{table_name}**")
                     if table_desc:
-                        table_str += f"\nDescription: {table_desc}"
+                        db_parts.append(f"\nDescription: {table_desc}")
 
-                    table_str += "\nColumns:"
+                    db_parts.append("\nColumns:")
 
                     # Format Columns
                     for col in columns:
@@ -123,18 +124,14 @@ class CompanyContextService:
                         col_desc = col.get('description', '')
                         col_props = col.get('properties') # Nested JSONB structure
 
-                        col_line = f"\n  - `{col_name}` ({col_type})"
+                        db_parts.append(f"\n  - `{col_name}` ({col_type})")
                         if col_desc:
-                            col_line += f": {col_desc}"
-
-                        table_str += col_line
+                            db_parts.append(f": {col_desc}")
 
                         # If it has nested properties (JSONB enriched from YAML), format them
                         if col_props:
-                            table_str += "\n"
-                            table_str += self._format_json_schema(col_props, 2) # Indent level 2
-
-                    db_context += table_str
+                            db_parts.append("\n")
+                            db_parts.append(self._format_json_schema(col_props, 2)) # Indent level 2
 
                     # collect the table names for later use
                     db_tables.append(
@@ -143,7 +140,7 @@ class CompanyContextService:
                          }
                     )
 
-                context_output.append(db_context)
+                context_output.append("".join(db_parts))
 
             except Exception as e:
                 logging.warning(f"Could not generate enriched SQL context for '{db_name}': {e}")
@@ -157,28 +154,33 @@ class CompanyContextService:
 
     def _get_yaml_schema_context(self, company_short_name: str, db_tables: List[Dict]) -> str:
         # Get context from .yaml schema files using the repository
-        yaml_schema_context = ''
+        yaml_schema_parts = []
 
         try:
             # 1. List yaml files in the schema "folder"
             schema_files = self.asset_repo.list_files(company_short_name, AssetType.SCHEMA, extension='.yaml')
 
+            # tables already in the SQL context, as a set: one lookup per file instead of a scan
+            sql_tables = {(item["db_name"], item["table_name"]) for item in db_tables}
+
+            pending_files = []
             for filename in schema_files:
                 # skip tables that are already in the SQL context
                 if '-' in filename:
                     dbname, f = filename.split("-", 1)
                     table_name = f.split('.')[0]
 
-                    exists = any(
-                        item["db_name"] == dbname and item["table_name"] == table_name
-                        for item in db_tables
-                    )
-                    if exists:
+                    if (dbname, table_name) in sql_tables:
                         continue
+                pending_files.append(filename)
+
+            # 2. Read content
+            contents = self._read_assets(company_short_name, AssetType.SCHEMA, pending_files)
 
+            for filename, content in zip(pending_files, contents):
                 try:
-                    # 2. Read content
-                    content = self.asset_repo.read_text(company_short_name, AssetType.SCHEMA, filename)
+                    if isinstance(content, Exception):
+                        raise content
 
                     # 3. Parse YAML content into a dict
                     schema_dict = self.utility.load_yaml_from_string(content)
@@ -186,7 +188,7 @@ class CompanyContextService:
                     # 4. Generate markdown description from the dict
                     if schema_dict:
                         # We use generate_schema_table which accepts a dict directly
-                        yaml_schema_context += self.generate_schema_table(schema_dict)
+                        yaml_schema_parts.append(self.generate_schema_table(schema_dict))
 
                 except Exception as e:
                     logging.warning(f"Error processing schema file {filename}: {e}")
@@ -194,7 +196,7 @@ class CompanyContextService:
         except Exception as e:
             logging.warning(f"Error listing schema files for {company_short_name}: {e}")
 
-        return yaml_schema_context
+        return "".join(yaml_schema_parts)
 
     def generate_schema_table(self, schema: dict) -> str:
         if not schema or not isinstance(schema, dict):
@@ -231,10 +233,15 @@ class CompanyContextService:
 
     def _format_json_schema(self, properties: dict, indent_level: int) -> str:
         output = []
+        self._append_json_schema_lines(properties, indent_level, output)
+        return "\n".join(output)
+
+    def _append_json_schema_lines(self, properties: dict, indent_level: int, output: list[str]):
+        # nested levels append to the caller's list, so the text is joined only once
         indent_str = '  ' * indent_level
 
         if not isinstance(properties, dict):
-            return ""
+            return
 
         for name, details in properties.items():
             if not isinstance(details, dict): continue
@@ -267,33 +274,49 @@ class CompanyContextService:
                     children = items.get('properties', items.get('fields'))
 
             if children:
-                output.append(self._format_json_schema(children, indent_level + 1))
-
-        return "\n".join(output)
+                lines_before = len(output)
+                self._append_json_schema_lines(children, indent_level + 1, output)
+                if len(output) == lines_before:
+                    # an empty nested block still renders as a blank line
+                    output.append("")
 
 
     def _get_static_file_context(self, company_short_name: str) -> str:
         # Get context from .md files using the repository
-        static_context = ''
+        static_parts = []
 
         try:
-            # 1. List markdown files in the context "folder"
-            # Note: The repo handles where this folder actually is (FS or DB)
-            md_files = self.asset_repo.list_files(company_short_name, AssetType.CONTEXT, extension='.md')
+            # 1. Read all markdown files in the context "folder" in one call
+            # Note: The repo handles where this folder actually is (FS or DB); unreadable files are skipped
+            md_files = self.asset_repo.read_many(company_short_name, AssetType.CONTEXT, extension='.md')
 
-            for filename in md_files:
-                try:
-                    # 2. Read content
-                    content = self.asset_repo.read_text(company_short_name, AssetType.CONTEXT, filename)
-                    static_context += content + "\n"  # Append content
-                except Exception as e:
-                    logging.warning(f"Error reading context file {filename}: {e}")
+            for content in md_files.values():
+                static_parts.append(content + "\n")  # Append content
 
         except Exception as e:
-            # If listing fails (e.g. folder doesn't exist), just log and return empty
-            logging.warning(f"Error listing context files for {company_short_name}: {e}")
+            # If reading fails (e.g. storage is down), just log and return empty
+            logging.warning(f"Error reading context files for {company_short_name}: {e}")
+
+        return "".join(static_parts)
+
+    def _read_assets(self, company_short_name: str, asset_type: AssetType, filenames: List[str]) -> list:
+        """
+        Reads the given assets in order; a file that fails yields the exception raised.
+        Like AssetRepository.read_many, reads run on the caller's thread unless the
+        repository opts into read_many_workers threads.
+        """
+        def read(filename: str):
+            try:
+                return self.asset_repo.read_text(company_short_name, asset_type, filename)
+            except Exception as e:
+                return e
+
+        workers = getattr(self.asset_repo, 'read_many_workers', 1)
+        if not isinstance(workers, int) or workers <= 1 or len(filenames) <= 1:
+            return [read(filename) for filename in filenames]
 
-        return static_context
+        with ThreadPoolExecutor(max_workers=min(len(filenames), workers)) as executor:
+            return list(executor.map(read, filenames))
 
     @staticmethod
     def _normalize_identifier(value: str) -> str:
@@ -393,13 +416,19 @@ class CompanyContextService:
             logging.debug(f"🔍 [CompanyContextService] Enriching schema for {db_name}. Files found: {len(files_map)}")
 
             # 3. fusion between physical structure and YAML files
+            matched_tables = []
             for table_name, table_data in structure.items():
                 real_filename = self._resolve_schema_filename_for_table(files_map, table_name)
-                if not real_filename:
-                    continue
+                if real_filename:
+                    matched_tables.append((table_name, table_data, real_filename))
+
+            contents = self._read_assets(company_short_name, AssetType.SCHEMA,
+                                         [real_filename for _, _, real_filename in matched_tables])
 
+            for (table_name, table_data, real_filename), content in zip(matched_tables, contents):
                 try:
-                    content = self.asset_repo.read_text(company_short_name, AssetType.SCHEMA, real_filename)
+                    if isinstance(content, Exception):
+                        raise content
                     if not content:
                         continue
 
@@ -10,6 +10,7 @@ from iatoolkit.repositories.profile_repo import ProfileRepo
 from iatoolkit.common.util import Utility
 from iatoolkit.services.structured_output_service import StructuredOutputService
 from injector import inject
+import copy
 import logging
 import os
 from urllib.parse import urlparse
@@ -34,6 +35,7 @@ class ConfigurationService:
         self.utility = utility
         self.secret_provider = secret_provider
         self._loaded_configs = {}   # cache for store loaded configurations
+        self._parsed_config_files = {}  # (company, filename) -> (yaml text, parsed config)
 
     def _ensure_config_loaded(self, company_short_name: str):
         """
@@ -786,22 +788,37 @@ class ConfigurationService:
                 }
 
         # read text and parse
-        yaml_content = self.asset_repo.read_text(company_short_name, AssetType.CONFIG, main_config_filename)
-        config = self.utility.load_yaml_from_string(yaml_content)
+        config = self._load_config_file(company_short_name, main_config_filename)
         if not config:
             return {}
 
         # Load and merge supplementary content files (e.g., onboarding_cards)
         for key, filename in config.get('help_files', {}).items():
             if self.asset_repo.exists(company_short_name, AssetType.CONFIG, filename):
-                supp_content = self.asset_repo.read_text(company_short_name, AssetType.CONFIG, filename)
-                config[key] = self.utility.load_yaml_from_string(supp_content)
+                config[key] = self._load_config_file(company_short_name, filename)
             else:
                 logging.warning(f"⚠️  Warning: Content file not found: {filename}")
                 config[key] = None
 
         return config
 
+    def _load_config_file(self, company_short_name: str, filename: str):
+        """
+        Reads and parses a configuration YAML file. The parsed result is kept with the text it
+        came from, so reloading an unchanged file (every load_configuration or validation call)
+        costs a read and a copy instead of a YAML parse; any edit changes the text and reparses.
+        """
+        yaml_content = self.asset_repo.read_text(company_short_name, AssetType.CONFIG, filename)
+
+        cache_key = (company_short_name, filename)
+        cached = self._parsed_config_files.get(cache_key)
+        if cached is None or cached[0] != yaml_content:
+            cached = (yaml_content, self.utility.load_yaml_from_string(yaml_content))
+            self._parsed_config_files[cache_key] = cached
+
+        # callers add keys and objects (e.g. config['company']) to the result
+        return copy.deepcopy(cached[1])
+
     def _get_prompt_config(self, config):
         prompts_config = config.get('prompts', {})
         if isinstance(prompts_config, dict):
@@ -6,6 +6,7 @@
 from iatoolkit.infra.connectors.file_connector import FileConnector
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Callable, Dict
 from iatoolkit.repositories.models import Company
 
@@ -19,7 +20,8 @@ class FileProcessorConfig:
         continue_on_error: bool = True,
         log_file: str = 'file_processor.log',
         echo: bool = False,
-        context: dict = None
+        context: dict = None,
+        max_workers: int = 1
     ):
         """
         Initializes the FileProcessor configuration.
@@ -33,6 +35,8 @@ class FileProcessorConfig:
             log_file (str): The path to the log file.
             echo (bool): If True, prints progress to the console.
             context (dict): A context dictionary passed to the action function.
+            max_workers (int): Files processed concurrently (download + callback).
+                Values above 1 require a thread-safe callback.
         """
         self.filters = filters
         self.callback = callback
@@ -40,6 +44,7 @@ class FileProcessorConfig:
         self.log_file = log_file
         self.echo = echo
         self.context = context or {}
+        self.max_workers = max(1, int(max_workers or 1))
 
 class FileProcessor:
     """
@@ -63,32 +68,47 @@ class FileProcessor:
             logging.error(f"Error fetching files: {e}")
             return False
 
-        for file_info in files:
-            file_path = file_info['path']
-            file_name = file_info['name']
-            if not file_name:
-                continue
+        pending = [file_info for file_info in files if file_info['name']]
 
+        if self.config.max_workers == 1 or len(pending) < 2:
+            for file_info in pending:
+                self.processed_files += self._process_file(file_info)
+            return
+
+        # parsing (e.g. docling) dominates each file, so files are spread over a thread pool
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = [executor.submit(self._process_file, file_info) for file_info in pending]
             try:
-                if not self._apply_filters(file_name):
-                    continue
-
-                content = self.connector.get_file_content(file_path)
-
-                # execute the callback function
-                filename = os.path.basename(file_name)
-                metadata = file_info.get('metadata', {})
-                self.config.callback(company=self.config.context.get('company'),
-                                     filename=filename,
-                                     content=content,
-                                     metadata=metadata,
-                                     context=self.config.context)
-                self.processed_files += 1
-
-            except Exception as e:
-                logging.error(f"Error processing {file_path}: {e}")
-                if not self.config.continue_on_error:
-                    raise e
+                for future in as_completed(futures):
+                    self.processed_files += future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _process_file(self, file_info: dict) -> int:
+        file_path = file_info['path']
+        try:
+            if not self._apply_filters(file_info['name']):
+                return 0
+
+            content = self.connector.get_file_content(file_path)
+
+            # execute the callback function
+            filename = os.path.basename(file_info['name'])
+            metadata = file_info.get('metadata', {})
+            self.config.callback(company=self.config.context.get('company'),
+                                 filename=filename,
+                                 content=content,
+                                 metadata=metadata,
+                                 context=self.config.context)
+            return 1
+
+        except Exception as e:
+            logging.error(f"Error processing {file_path}: {e}")
+            if not self.config.continue_on_error:
+                raise e
+            return 0
 
     def _apply_filters(self, file_path: str) -> bool:
         filters = self.config.filters
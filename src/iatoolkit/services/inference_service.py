@@ -2,16 +2,21 @@
 # Copyright (c) 2024 Fernando Libedinsky
 # Product: IAToolkit
 
+import asyncio
 import logging
 import base64
+import os
 import uuid
-from typing import Optional, Dict, Any
+import httpx
+import numpy as np
+from typing import Optional, Dict, Any, List
 from injector import inject
 from iatoolkit.common.interfaces.secret_provider import SecretProvider
 from iatoolkit.common.secret_resolver import resolve_secret
 from iatoolkit.services.configuration_service import ConfigurationService
 from iatoolkit.services.i18n_service import I18nService
 from iatoolkit.infra.call_service import CallServiceClient
+from iatoolkit.infra.rate_limiter import estimate_tokens, get_rate_limiter
 from iatoolkit.services.storage_service import StorageService
 
 
@@ -52,6 +57,161 @@ class InferenceService:
         Returns:
             Dict containing the model's response or formatted result.
         """
+        endpoint_url, api_key, parameters = self._resolve_endpoint(company_short_name, tool_name)
+
+        # 3. Construct the payload
+        payload = {
+            "inputs": input_data
+        }
+        if parameters:
+            payload["parameters"] = parameters
+
+        # 4. Execute Call
+        logging.debug(f"Called inference tool {tool_name} with model {parameters.get('model_id')}.")
+        response_data = self._call_endpoint(
+            endpoint_url,
+            api_key,
+            payload,
+            suppress_error_logging=suppress_error_logging,
+        )
+
+        # 5. Post-Processing
+        return self._process_response(company_short_name, response_data)
+
+    def predict_batch(
+            self,
+            company_short_name: str,
+            tool_name: str,
+            inputs: List[Dict[str, Any]],
+            max_batch: int = 32,
+    ) -> List[Dict[str, Any]]:
+        """
+        Embeds many inputs with one HTTP request per group of up to max_batch items.
+
+        Consecutive text inputs ({"mode": "text", "text": str}) and image inputs
+        ({"mode": "image", "url"|"base64": ...}) are merged into the list form the endpoint
+        handler embeds in a single forward pass. Anything else, or a group the endpoint
+        rejects, falls back to one predict() per item. Results are aligned with inputs.
+        """
+        endpoint_url, api_key, parameters = self._resolve_endpoint(company_short_name, tool_name)
+
+        results: List[Dict[str, Any]] = []
+        for group in self._group_batchable_inputs(inputs, max_batch):
+            if len(group) == 1 or group[0].get("mode") not in ("text", "image"):
+                results.extend(self.predict(company_short_name, tool_name, item) for item in group)
+                continue
+
+            if group[0]["mode"] == "text":
+                batch_input = {"mode": "text", "text": [item["text"] for item in group]}
+            else:
+                batch_input = {"mode": "image", "images": [
+                    {key: item[key] for key in ("url", "presigned_url", "base64") if item.get(key)}
+                    for item in group
+                ]}
+
+            payload = {"inputs": batch_input}
+            if parameters:
+                payload["parameters"] = parameters
+
+            try:
+                # the read timeout grows with the batch: one forward pass, but len(group) times the work
+                response_data = self._call_endpoint(
+                    endpoint_url, api_key, payload,
+                    suppress_error_logging=True,
+                    timeout=(5, 300.0 + 10.0 * len(group)),
+                )
+                response_data = self._process_response(company_short_name, response_data)
+                embeddings = response_data.get("embeddings") if isinstance(response_data, dict) else None
+                if not isinstance(embeddings, list) or len(embeddings) != len(group):
+                    raise ValueError("Endpoint did not return one embedding per input.")
+            except Exception as e:
+                logging.warning(f"Batch inference failed for tool {tool_name} ({e}); falling back to single calls.")
+                results.extend(self.predict(company_short_name, tool_name, item) for item in group)
+                continue
+
+            dimensions = response_data.get("dimensions")
+            for embedding in embeddings:
+                result = {"embedding": embedding}
+                if dimensions is not None:
+                    result["dimensions"] = dimensions
+                results.append(result)
+
+        return results
+
+    async def apredict(
+            self,
+            company_short_name: str,
+            tool_name: str,
+            input_data: Dict[str, Any],
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> Dict[str, Any]:
+        """Async version of predict(); pass a shared client to reuse its connections."""
+        if client is None:
+            async with httpx.AsyncClient() as own_client:
+                return await self.apredict(company_short_name, tool_name, input_data, own_client)
+
+        endpoint_url, api_key, parameters = self._resolve_endpoint(company_short_name, tool_name)
+        payload = {"inputs": input_data}
+        if parameters:
+            payload["parameters"] = parameters
+
+        rate_limit = self._get_tool_config(company_short_name, tool_name).get('rate_limit')
+        limiter = get_rate_limiter(("inference", company_short_name, tool_name), rate_limit)
+        if limiter:
+            text = input_data.get("text")
+            await limiter.acquire(estimate_tokens(text) if limiter.tokens_per_min and text else 0)
+
+        response_data = await self._acall_endpoint(client, endpoint_url, api_key, payload)
+        return self._process_response(company_short_name, response_data)
+
+    async def apredict_many(
+            self,
+            company_short_name: str,
+            tool_name: str,
+            inputs: List[Dict[str, Any]],
+            max_concurrency: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Any]:
+        """
+        Runs one apredict() per input concurrently, at most max_concurrency (HF_MAX_ASYNC, default 8)
+        in flight, over a single keep-alive connection pool.
+        Results are aligned with inputs; a failed input yields its exception instead of a result.
+        """
+        if client is None:
+            async with httpx.AsyncClient() as own_client:
+                return await self.apredict_many(company_short_name, tool_name, inputs, max_concurrency, own_client)
+
+        semaphore = asyncio.Semaphore(max_concurrency or int(os.getenv("HF_MAX_ASYNC", "8")))
+
+        async def predict_one(input_data: Dict[str, Any]):
+            async with semaphore:
+                return await self.apredict(company_short_name, tool_name, input_data, client)
+
+        return await asyncio.gather(*(predict_one(item) for item in inputs), return_exceptions=True)
+
+    @staticmethod
+    def _is_batchable(item: Dict[str, Any]) -> bool:
+        mode = item.get("mode")
+        if mode == "text":
+            return isinstance(item.get("text"), str)
+        if mode == "image":
+            return any(item.get(key) for key in ("url", "presigned_url", "base64"))
+        return False
+
+    @classmethod
+    def _group_batchable_inputs(cls, inputs: List[Dict[str, Any]], max_batch: int) -> List[List[Dict[str, Any]]]:
+        # consecutive batchable items of the same mode share a group; anything else is a group of one
+        groups: List[List[Dict[str, Any]]] = []
+        for item in inputs:
+            previous = groups[-1] if groups else None
+            if (previous is not None and cls._is_batchable(item) and cls._is_batchable(previous[0])
+                    and previous[0].get("mode") == item.get("mode") and len(previous) < max_batch):
+                previous.append(item)
+            else:
+                groups.append([item])
+        return groups
+
+    def _resolve_endpoint(self, company_short_name: str, tool_name: str) -> tuple[str, str, Dict[str, Any]]:
         # 1. Load configuration for the specific tool
         config = self._get_tool_config(company_short_name, tool_name)
 
@@ -74,11 +234,6 @@ class InferenceService:
         if not api_key:
             raise ValueError(f"Secret reference '{api_key_ref}' is not set.")
 
-        # 3. Construct the payload
-        payload = {
-            "inputs": input_data
-        }
-
         # Optional enrichment
         parameters = {}
         if model_id:
@@ -87,20 +242,9 @@ class InferenceService:
         if model_parameters:
             parameters.update(model_parameters)
 
-        if parameters:
-            payload["parameters"] = parameters
-
-        # 4. Execute Call
-        logging.debug(f"Called inference tool {tool_name} with model {model_id}.")
-        response_data = self._call_endpoint(
-            endpoint_url,
-            api_key,
-            payload,
-            suppress_error_logging=suppress_error_logging,
-        )
-
-        # 5. Post-Processing
+        return endpoint_url, api_key, parameters
 
+    def _process_response(self, company_short_name: str, response_data: Any) -> Any:
         # CASO A: Audio Base64 (TTS)
         if isinstance(response_data, dict) and "audio_base64" in response_data:
             try:
@@ -128,8 +272,29 @@ class InferenceService:
                 logging.error(f"Error decoding image: {e}")
                 return {"error": True, "message": "Failed to decode image."}
 
+        # CASO D: Embeddings compactos (model_parameters.embedding_encoding: float16_base64)
+        if isinstance(response_data, dict) and (
+                "embedding_b64" in response_data or "embeddings_b64" in response_data):
+            return self._decode_embedding_response(response_data)
+
         return response_data
 
+    @staticmethod
+    def _decode_embedding_response(response_data: dict) -> dict:
+        """Expands base64 float16 embeddings back into the plain {"embedding": [...]} shape."""
+        dtype = np.dtype(response_data.get("dtype", "float16")).newbyteorder("<")
+        dimensions = response_data.get("dimensions")
+
+        decoded = {k: v for k, v in response_data.items()
+                   if k not in ("embedding_b64", "embeddings_b64", "dtype", "count")}
+        if "embedding_b64" in response_data:
+            vector = np.frombuffer(base64.b64decode(response_data["embedding_b64"]), dtype=dtype)
+            decoded["embedding"] = vector.astype(np.float32).tolist()
+        else:
+            vectors = np.frombuffer(base64.b64decode(response_data["embeddings_b64"]), dtype=dtype)
+            decoded["embeddings"] = vectors.astype(np.float32).reshape(-1, dimensions).tolist()
+        return decoded
+
     def _handle_binary_response(self, company_short_name: str, content: bytes, mime_type: str) -> dict:
         """Sube el contenido binario y retorna la estructura con el HTML tag adecuado."""
         # Determinar extensión y tipo de asset
@@ -178,6 +343,39 @@ class InferenceService:
             logging.exception(f"Error saving binary response: {e}")
             return {"error": True, "message": "Failed to save generated content."}
 
+    async def _acall_endpoint(
+            self,
+            client: httpx.AsyncClient,
+            url: str,
+            api_key: str,
+            payload: dict,
+            timeout: tuple = (5, 300.0)
+    ) -> Any:
+        """Async counterpart of _call_endpoint."""
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        resp = await client.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+        )
+        try:
+            data = resp.json()
+        except ValueError:
+            data = resp.text
+
+        if resp.status_code != 200:
+            error_msg = f"Inference Endpoint Error {resp.status_code}"
+            if isinstance(data, dict) and 'error' in data:
+                error_msg += f": {data['error']}"
+            logging.error(f"{error_msg} | Payload keys: {list(payload.keys())}")
+            raise ValueError(error_msg)
+
+        return data
+
     def _get_tool_config(self, company_short_name: str, tool_name: str) -> dict:
         """
         Helper to safely extract and resolve tool configuration from company.yaml.
@@ -225,7 +423,8 @@ class InferenceService:
             url: str,
             api_key: str,
             payload: dict,
-            suppress_error_logging: bool = False
+            suppress_error_logging: bool = False,
+            timeout: tuple = (5, 300.0)
     ) -> Any:
         """Performs the POST request to the HF Endpoint."""
         headers = {
@@ -238,7 +437,7 @@ class InferenceService:
                 url,
                 json_dict=payload,
                 headers=headers,
-                timeout=(5, 300.0)
+                timeout=timeout
             )
 
             if status != 200:
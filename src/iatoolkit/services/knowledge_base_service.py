@@ -15,6 +15,7 @@ from iatoolkit.services.parsers.parsing_service import ParsingService
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from iatoolkit.services.visual_kb_service import VisualKnowledgeBaseService
 from sqlalchemy import desc
+from sqlalchemy.orm import joinedload
 from typing import Any
 import json
 from iatoolkit.common.exceptions import IAToolkitException
@@ -134,7 +135,7 @@ class KnowledgeBaseService:
                 return existing_doc
 
 
-        # 3. Storage creation record with PENDING status
+        # 3. Storage creation record, already in PROCESSING status (it is processed right away)
         try:
             # Upload to Storage immediately instead of saving b64 to DB
             # Determine basic mime type for upload
@@ -158,7 +159,7 @@ class KnowledgeBaseService:
                 user_identifier=user_identifier,
                 storage_key=storage_key,        # Reference to cloud storage
                 meta=metadata,
-                status=DocumentStatus.PENDING
+                status=DocumentStatus.PROCESSING
             )
 
             self.document_repo.insert(new_doc)
@@ -187,9 +188,10 @@ class KnowledgeBaseService:
         session = self.document_repo.session
 
         try:
-            # A. Update status to PROCESSING
-            document.status = DocumentStatus.PROCESSING
-            session.commit()
+            # A. Update status to PROCESSING (skipped when the document was inserted with it)
+            if document.status != DocumentStatus.PROCESSING:
+                document.status = DocumentStatus.PROCESSING
+                session.commit()
 
             # B. Provider-based parsing (docling/basic/custom)
             parse_result = self.parsing_service.parse_document(
@@ -585,8 +587,12 @@ class KnowledgeBaseService:
         """
         session = self.document_repo.session
 
-        # Start building the query
-        query = session.query(Document).join(Company).filter(Company.short_name == company_short_name)
+        # Start building the query; collection_type is loaded in the same query
+        # because the grid shows it for every row (avoids one lazy SELECT per document)
+        query = (session.query(Document)
+                 .options(joinedload(Document.collection_type))
+                 .join(Company)
+                 .filter(Company.short_name == company_short_name))
 
         # Filter by status (single string or list)
         if status:
@@ -722,6 +728,7 @@ class KnowledgeBaseService:
                     existing.description = description
 
         session.commit()
+        self.parsing_service.clear_provider_cache()
 
     @staticmethod
     def _normalize_collection_config_entries(categories_config: list) -> list[dict]:
@@ -405,41 +405,50 @@ class llmClient:
         if not response.content_parts:
             return
 
-        for part in response.content_parts:
-            if part.get('type') == 'image':
-                source = part.get('source', {})
-                if source.get('type') in ['base64', 'url']:
-                    try:
-                        if source.get('type') == 'url':
-                            url = source.get('url')
-                            storage_key = None
-                        else:
-                            # upload image to S3
-                            result = self.storage_service.store_generated_image(
-                                company_short_name,
-                                source.get('data'),
-                                source.get('media_type', 'image/png')
-                            )
-                            url = result['url']
-                            storage_key = result['storage_key']
-
-                        # Update content_part: Now it's a remote reference, not base64 anymore.
-                        # We keep 'url' for the frontend to display it itself, and storage_key for internal reference.
-                        part['source'] = {
-                            'type': 'url',
-                            'url': url,
-                            'storage_key': storage_key,
-                            'media_type': source.get('media_type')
-                        }
-
-                        # clean data
-                        logging.info(f"Imagen procesada y subida: {url}")
+        image_parts = [
+            part for part in response.content_parts
+            if part.get('type') == 'image' and part.get('source', {}).get('type') in ['base64', 'url']
+        ]
+        # base64 images are uploaded together (concurrently, through one storage connector)
+        base64_parts = [part for part in image_parts if part['source']['type'] == 'base64']
+        stored = {}
+        if base64_parts:
+            results = self.storage_service.store_generated_images(
+                company_short_name,
+                [(part['source'].get('data'), part['source'].get('media_type', 'image/png')) for part in base64_parts]
+            )
+            stored = {id(part): result for part, result in zip(base64_parts, results)}
 
-                    except Exception as e:
-                        logging.error(f"Fallo al subir imagen generada: {e}")
+        for part in image_parts:
+            source = part['source']
+            try:
+                if source.get('type') == 'url':
+                    url = source.get('url')
+                    storage_key = None
+                else:
+                    result = stored[id(part)]
+                    if isinstance(result, Exception):
+                        raise result
+                    url = result['url']
+                    storage_key = result['storage_key']
+
+                # Update content_part: Now it's a remote reference, not base64 anymore.
+                # We keep 'url' for the frontend to display it itself, and storage_key for internal reference.
+                part['source'] = {
+                    'type': 'url',
+                    'url': url,
+                    'storage_key': storage_key,
+                    'media_type': source.get('media_type')
+                }
+
+                # clean data
+                logging.info(f"Imagen procesada y subida: {url}")
+
+            except Exception as e:
+                logging.error(f"Fallo al subir imagen generada: {e}")
 
-                        # Fallback: keep the base64 and signal the error
-                        part['error'] = "Failed to upload image"
+                # Fallback: keep the base64 and signal the error
+                part['error'] = "Failed to upload image"
 
 
     def decode_response(self, response) -> dict:
@@ -12,6 +12,8 @@ from typing import Any
 
 from injector import inject
 
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
 
 @dataclass(frozen=True)
 class MemoryLookupPolicyDecision:
@@ -186,4 +188,4 @@ class MemoryLookupPolicyService:
     def _tokenize(value: str | None) -> list[str]:
         normalized = unicodedata.normalize("NFKD", str(value or "").strip().lower())
         normalized = "".join(char for char in normalized if not unicodedata.combining(char))
-        return re.findall(r"[a-z0-9_]+", normalized)
+        return _TOKEN_RE.findall(normalized)
@@ -31,6 +31,10 @@ from iatoolkit.services.memory_lint_service import MemoryLintService
 from iatoolkit.services.memory_wiki_service import MemoryWikiService
 from iatoolkit.services.storage_service import StorageService
 
+# compiled once: both run for every candidate during memory ranking
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
 
 class MemoryService:
     TOOL_NATIVE_ATTACHMENTS_KEY = "__native_attachments__"
@@ -1025,13 +1029,13 @@ class MemoryService:
     def _normalize_text(value: str | None) -> str:
         normalized = unicodedata.normalize("NFKD", str(value or "").strip().lower())
         normalized = "".join(char for char in normalized if not unicodedata.combining(char))
-        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = _WHITESPACE_RE.sub(" ", normalized)
         return normalized.strip()
 
     def _tokenize(self, value: str | None) -> list[str]:
         normalized = self._normalize_text(value)
         return [
-            token for token in re.findall(r"[a-z0-9_]+", normalized)
+            token for token in _TOKEN_RE.findall(normalized)
             if len(token) >= 3
         ]
 
@@ -34,6 +34,9 @@ class ParsingService:
     def warmup(self):
         logging.info("ParsingService warmup skipped: Docling is lazy-loaded.")
 
+    def clear_provider_cache(self):
+        self.provider_resolver.clear_cache()
+
     def parse_document(self,
                        company_short_name: str,
                        filename: str,
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 from injector import inject, singleton
+import time
 
 from iatoolkit.services.configuration_service import ConfigurationService
 from iatoolkit.repositories.document_repo import DocumentRepo
@@ -15,6 +16,9 @@ from iatoolkit.services.parsers.provider_factory import ParsingProviderFactory
 
 @singleton
 class ParsingProviderResolver:
+    # a sync clears the cache of its own worker only; the others pick the change up after this
+    COLLECTION_PROVIDER_TTL = 300
+
     @inject
     def __init__(self,
                  config_service: ConfigurationService,
@@ -23,6 +27,13 @@ class ParsingProviderResolver:
         self.config_service = config_service
         self.document_repo = document_repo
         self.provider_factory = provider_factory
+        # (company, collection) -> (monotonic time, normalized parser_provider of the collection or None),
+        # so a batch ingestion hits the DB once per collection instead of once per file.
+        self._collection_providers: dict[tuple[str, str], tuple[float, str | None]] = {}
+
+    def clear_cache(self):
+        # called whenever collection types are synced, since parser_provider may have changed
+        self._collection_providers.clear()
 
     def resolve(self, request: ParseRequest):
         provider_name = self.resolve_provider_name(request)
@@ -80,14 +91,19 @@ class ParsingProviderResolver:
         if not collection_name:
             return None
 
-        collection = self.document_repo.get_collection_by_name(company_short_name, collection_name)
-        if not collection:
-            return None
+        cache_key = (company_short_name, collection_name)
+        cached = self._collection_providers.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.COLLECTION_PROVIDER_TTL:
+            return cached[1]
 
-        parser_provider = getattr(collection, "parser_provider", None)
+        provider_name = None
+        collection = self.document_repo.get_collection_by_name(company_short_name, collection_name)
+        parser_provider = getattr(collection, "parser_provider", None) if collection else None
         if isinstance(parser_provider, str) and parser_provider.strip():
-            return self._normalize_provider_alias(parser_provider.strip().lower())
-        return None
+            provider_name = self._normalize_provider_alias(parser_provider.strip().lower())
+
+        self._collection_providers[cache_key] = (time.monotonic(), provider_name)
+        return provider_name
 
     @staticmethod
     def _normalize_provider_alias(provider_name: str) -> str:
@@ -5,9 +5,12 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import os
+import shutil
 import tempfile
+import threading
 from typing import Any, Optional
 
 from injector import inject, singleton
@@ -25,6 +28,9 @@ class DoclingParsingProvider:
     name = "docling"
     version = "1.0"
 
+    # chunk size used when copying the document into the temp file docling reads from
+    COPY_CHUNK_SIZE = 1024 * 1024
+
     @inject
     def __init__(self,
                  i18n_service: I18nService,
@@ -34,8 +40,14 @@ class DoclingParsingProvider:
         self.enabled = True
         self.converter = None
         self._converter_cache: dict[tuple[bool, bool], Any] = {}
+        # serializes model loading, so concurrent first requests share one converter per profile
+        self._init_lock = threading.Lock()
 
     def init(self, *, use_ocr: bool = False, detect_tables: bool = False):
+        with self._init_lock:
+            self._init_converter(use_ocr=use_ocr, detect_tables=detect_tables)
+
+    def _init_converter(self, *, use_ocr: bool, detect_tables: bool):
         if not self.enabled:
             logging.info("DoclingParsingProvider is unavailable because a previous initialization failed.")
             return
@@ -97,6 +109,9 @@ class DoclingParsingProvider:
             self.enabled = False
 
     def supports(self, request: ParseRequest) -> bool:
+        # a provider whose models failed to load supports nothing, so callers skip it up front
+        if not self.enabled:
+            return False
         filename = request.filename
         if not filename:
             return False
@@ -111,7 +126,9 @@ class DoclingParsingProvider:
                 if self.i18n_service else "Docling is disabled"
             )
 
-        detect_tables = self._resolve_detect_tables(request)
+        text_only = self._resolve_text_only(request)
+        # a text-only parse never looks at tables, so it uses the lighter converter profile
+        detect_tables = self._resolve_detect_tables(request) and not text_only
         use_ocr = self._should_enable_ocr(request)
         cache_key = (use_ocr, detect_tables)
 
@@ -126,9 +143,7 @@ class DoclingParsingProvider:
                     "Docling converter failed to initialize."
                 )
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(request.filename)[1]) as tmp:
-            tmp.write(request.content)
-            tmp_path = tmp.name
+        tmp_path = self._write_temp_file(request.content, suffix=os.path.splitext(request.filename)[1])
 
         try:
             self.converter = converter
@@ -141,15 +156,31 @@ class DoclingParsingProvider:
             except Exception:
                 markdown = ""
 
+            if text_only:
+                # export_to_dict materializes every node; plain-text callers only need the markdown
+                return ParseResult(
+                    provider=self.name,
+                    provider_version=self.version,
+                    texts=self._extract_texts({}, markdown),
+                    metrics={
+                        "used_ocr": use_ocr,
+                        "detect_tables": False,
+                        "text_only": True,
+                        "ocr_engine": "docling" if use_ocr else None,
+                    },
+                )
+
             doc_dict: dict[str, Any] = {}
             try:
                 doc_dict = doc.export_to_dict()
             except Exception:
                 doc_dict = {}
 
-            texts = self._extract_texts(doc_dict, markdown)
-            tables = self._extract_tables(doc, doc_dict) if detect_tables else []
-            images = self._extract_images(doc, request.filename, doc_dict)
+            # one walk over the exported tree feeds the texts and the table/image caption fallback
+            doc_texts, caption_entries = self._scan_doc_dict(doc_dict)
+            texts = self._extract_texts(doc_dict, markdown, doc_texts)
+            tables = self._extract_tables(doc, doc_dict, caption_entries) if detect_tables else []
+            images = self._extract_images(doc, request.filename, doc_dict, caption_entries)
 
             return ParseResult(
                 provider=self.name,
@@ -169,52 +200,112 @@ class DoclingParsingProvider:
             except Exception:
                 pass
 
-    def _extract_texts(self, doc_dict: dict, markdown: str) -> list[ParsedText]:
+    def _write_temp_file(self, content, suffix: str) -> str:
+        """
+        Copies the document (bytes or a binary file object) to a temp file in COPY_CHUNK_SIZE chunks,
+        so file objects are never fully loaded in memory. DOCLING_TMP_DIR (e.g. /dev/shm) overrides the directory.
+        """
+        source = io.BytesIO(content) if isinstance(content, (bytes, bytearray, memoryview)) else content
+        tmp_dir = os.getenv("DOCLING_TMP_DIR") or None
+        if tmp_dir and not os.path.isdir(tmp_dir):
+            logging.warning("DOCLING_TMP_DIR=%r does not exist. Using the system temp dir.", tmp_dir)
+            tmp_dir = None
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=tmp_dir) as tmp:
+            shutil.copyfileobj(source, tmp, self.COPY_CHUNK_SIZE)
+            return tmp.name
+
+    def _extract_texts(self,
+                       doc_dict: dict,
+                       markdown: str,
+                       doc_texts: list[ParsedText] | None = None) -> list[ParsedText]:
         if not doc_dict:
             return [ParsedText(text=markdown, meta={"source_type": "text", "source_label": "markdown"})] if markdown else []
 
-        texts: list[ParsedText] = []
-        current_section_title = None
-
-        for item in self._walk_items(doc_dict):
-            if not isinstance(item, dict):
-                continue
-
-            label = (item.get("label") or item.get("type") or "").lower()
-            text = item.get("text") or item.get("content") or ""
-            if not text:
-                continue
-
-            if label in ("title", "section_header", "page_header", "header"):
-                current_section_title = text
-
-            if label not in ("text", "paragraph", "body_text", "title"):
-                continue
-
-            page_start, page_end = self._extract_pages(item.get("prov", []))
-
-            meta = {
-                "source_type": "text",
-                "source_label": label,
-                "page_start": page_start,
-                "page_end": page_end,
-                "section_title": current_section_title,
-                "caption_text": None,
-                "caption_source": "none",
-            }
-            meta.update(self._extract_meta(item, exclude_keys={"text", "content", "prov", "orig", "children"}))
-            texts.append(ParsedText(text=text, meta=meta))
+        texts = list(doc_texts) if doc_texts is not None else self._scan_doc_dict(doc_dict)[0]
 
         if not texts and markdown:
             texts.append(ParsedText(text=markdown, meta={"source_type": "text", "source_label": "markdown"}))
 
         return texts
 
-    def _extract_tables(self, doc, doc_dict: dict | None = None) -> list[ParsedTable]:
+    def _scan_doc_dict(self, doc_dict: dict) -> tuple[list[ParsedText], list[dict]]:
+        """Single pass over the exported document: body texts and caption entries, in document order."""
+        texts: list[ParsedText] = []
+        caption_entries: list[dict] = []
+        current_section_title = None
+
+        for pos, item in enumerate(self._walk_items(doc_dict or {})):
+            label = str(item.get("label") or item.get("type") or "").lower()
+            current_section_title = self._maybe_text(item, label, current_section_title, texts)
+            self._maybe_caption(item, label, pos, caption_entries)
+
+        return texts, caption_entries
+
+    def _maybe_text(self,
+                    item: dict,
+                    label: str,
+                    current_section_title: Optional[str],
+                    texts: list[ParsedText]) -> Optional[str]:
+        """Appends the item to texts if it is body text; returns the section title in effect after it."""
+        text = item.get("text") or item.get("content") or ""
+        if not text:
+            return current_section_title
+
+        if label in ("title", "section_header", "page_header", "header"):
+            current_section_title = text
+
+        if label not in ("text", "paragraph", "body_text", "title"):
+            return current_section_title
+
+        page_start, page_end = self._extract_pages(item.get("prov", []))
+
+        meta = {
+            "source_type": "text",
+            "source_label": label,
+            "page_start": page_start,
+            "page_end": page_end,
+            "section_title": current_section_title,
+            "caption_text": None,
+            "caption_source": "none",
+        }
+        meta.update(self._extract_meta(item, exclude_keys={"text", "content", "prov", "orig", "children"}))
+        texts.append(ParsedText(text=text, meta=meta))
+        return current_section_title
+
+    def _maybe_caption(self, item: dict, label: str, pos: int, caption_entries: list[dict]):
+        if "caption" not in label:
+            return
+
+        text_candidate = self._extract_caption_from_mapping(
+            item,
+            candidate_fields=("caption_text", "caption", "text", "content")
+        )
+        if not text_candidate:
+            return
+
+        kind = "unknown"
+        if "table" in label:
+            kind = "table"
+        elif any(token in label for token in ("figure", "image", "picture")):
+            kind = "image"
+
+        caption_entries.append({
+            "text": text_candidate,
+            "page": self._extract_page_from_prov(item.get("prov")),
+            "kind": kind,
+            "pos": pos,
+            "used": False,
+        })
+
+    def _extract_tables(self,
+                        doc,
+                        doc_dict: dict | None = None,
+                        caption_entries: list[dict] | None = None) -> list[ParsedTable]:
         tables: list[ParsedTable] = []
         if not hasattr(doc, "tables"):
             return []
-        caption_finder = self._build_caption_finder(doc_dict or {})
+        caption_finder = self._build_caption_finder(doc_dict or {}, caption_entries)
 
         for index, tbl in enumerate(doc.tables, start=1):
             try:
@@ -261,13 +352,17 @@ class DoclingParsingProvider:
 
         return tables
 
-    def _extract_images(self, doc, filename: str, doc_dict: dict | None = None) -> list[ParsedImage]:
+    def _extract_images(self,
+                        doc,
+                        filename: str,
+                        doc_dict: dict | None = None,
+                        caption_entries: list[dict] | None = None) -> list[ParsedImage]:
         images: list[ParsedImage] = []
         base_name, _ = os.path.splitext(filename)
 
         if not hasattr(doc, "pictures"):
             return []
-        caption_finder = self._build_caption_finder(doc_dict or {})
+        caption_finder = self._build_caption_finder(doc_dict or {}, caption_entries)
 
         for i, pic in enumerate(doc.pictures, start=1):
             try:
@@ -370,37 +465,11 @@ class DoclingParsingProvider:
 
         return None, "none"
 
-    def _build_caption_finder(self, doc_dict: dict):
-        caption_entries = []
-        for pos, item in enumerate(self._walk_items(doc_dict)):
-            if not isinstance(item, dict):
-                continue
-
-            label = str(item.get("label") or item.get("type") or "").lower()
-            text_candidate = self._extract_caption_from_mapping(
-                item,
-                candidate_fields=("caption_text", "caption", "text", "content")
-            )
-            if not text_candidate:
-                continue
-
-            if "caption" not in label:
-                continue
-
-            page_no = self._extract_page_from_prov(item.get("prov"))
-            kind = "unknown"
-            if "table" in label:
-                kind = "table"
-            elif any(token in label for token in ("figure", "image", "picture")):
-                kind = "image"
-
-            caption_entries.append({
-                "text": text_candidate,
-                "page": page_no,
-                "kind": kind,
-                "pos": pos,
-                "used": False,
-            })
+    def _build_caption_finder(self, doc_dict: dict, caption_entries: list[dict] | None = None):
+        if caption_entries is None:
+            caption_entries = self._scan_doc_dict(doc_dict)[1]
+        # each finder marks its own entries as used
+        caption_entries = [dict(entry) for entry in caption_entries]
 
         def _find(kind: str, page_no: Optional[int], item_index: int) -> Optional[str]:
             if not caption_entries:
@@ -511,13 +580,16 @@ class DoclingParsingProvider:
         return meta
 
     def _walk_items(self, node: Any):
-        if isinstance(node, dict):
-            yield node
-            for value in node.values():
-                yield from self._walk_items(value)
-        elif isinstance(node, list):
-            for value in node:
-                yield from self._walk_items(value)
+        # iterative pre-order walk: no generator chain per level and no RecursionError on deep trees.
+        # children are pushed reversed so dicts come out in document order (section titles depend on it)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                yield current
+                stack.extend(reversed(current.values()))
+            elif isinstance(current, list):
+                stack.extend(reversed(current))
 
     def _should_enable_ocr(self, request: ParseRequest) -> bool:
         if not str(getattr(request, "filename", "") or "").strip().lower().endswith(".pdf"):
@@ -531,6 +603,10 @@ class DoclingParsingProvider:
         value = (getattr(request, "provider_config", None) or {}).get("detect_tables")
         return self._parse_bool_value(value, default=False)
 
+    def _resolve_text_only(self, request: ParseRequest) -> bool:
+        value = (getattr(request, "provider_config", None) or {}).get("text_only")
+        return self._parse_bool_value(value, default=False)
+
     def _pdf_needs_ocr(self, content: bytes) -> bool:
         decision = analyze_pdf_ocr_need(content)
         logging.info(
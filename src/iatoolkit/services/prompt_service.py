@@ -17,7 +17,45 @@ from iatoolkit.repositories.models import (Prompt, PromptCategory,
 from iatoolkit.common.exceptions import IAToolkitException
 from iatoolkit.services.system_prompt_catalog import build_system_prompt_payload
 from iatoolkit.services.structured_output_service import StructuredOutputService
+from typing import Any
+import threading
 import logging
+import time
+
+# Prompt API responses cached per process as (encoded JSON, etag), keyed by (company, ...):
+# the {"meta", "content"} of a prompt under (company, prompt_name), and the prompt tree under
+# (company, None, include_all). Every PromptService write drops the company's entries;
+# other workers see them after the ttl.
+PROMPT_CACHE_TTL = 60
+PROMPT_CACHE_MAX_ENTRIES = 1024
+_prompt_cache: dict[tuple, tuple[float, Any]] = {}
+_prompt_cache_lock = threading.Lock()
+
+
+def get_cached_prompt_response(key: tuple) -> Any:
+    with _prompt_cache_lock:
+        entry = _prompt_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > PROMPT_CACHE_TTL:
+            del _prompt_cache[key]
+            return None
+        return entry[1]
+
+
+def cache_prompt_response(key: tuple, payload: Any):
+    with _prompt_cache_lock:
+        if key not in _prompt_cache and len(_prompt_cache) >= PROMPT_CACHE_MAX_ENTRIES:
+            # dicts keep insertion order, so this drops the oldest entry
+            del _prompt_cache[next(iter(_prompt_cache))]
+        _prompt_cache[key] = (time.monotonic(), payload)
+
+
+def invalidate_prompt_cache(company_short_name: str):
+    with _prompt_cache_lock:
+        for key in [key for key in _prompt_cache if key[0] == company_short_name]:
+            del _prompt_cache[key]
+
 
 class PromptService:
     OUTPUT_SCHEMA_MODE_BEST_EFFORT = "best_effort"
@@ -168,11 +206,32 @@ class PromptService:
             "attachment_fallback": self._normalize_attachment_fallback(llm_config.get("default_attachment_fallback")),
         }
 
-    def _normalize_llm_model(self, company_short_name: str, llm_model: str | None) -> str | None:
+    def _normalize_llm_model(self,
+                             company_short_name: str,
+                             llm_model: str | None,
+                             allowed_models: set[str] | None = None) -> str | None:
         candidate = str(llm_model or "").strip()
         if not candidate:
             return None
 
+        if allowed_models is None:
+            allowed_models = self._get_allowed_llm_models(company_short_name)
+
+        if candidate in allowed_models:
+            return candidate
+
+        if not allowed_models:
+            raise IAToolkitException(
+                IAToolkitException.ErrorType.INVALID_PARAMETER,
+                "Cannot assign llm_model because the company has no configured models.",
+            )
+
+        raise IAToolkitException(
+            IAToolkitException.ErrorType.INVALID_PARAMETER,
+            f"Unsupported llm_model '{candidate}'. Allowed values: {sorted(allowed_models)}",
+        )
+
+    def _get_allowed_llm_models(self, company_short_name: str) -> set[str]:
         default_llm_model, available_llm_models = self.configuration_service.get_llm_configuration(company_short_name)
         allowed_models = set()
 
@@ -189,19 +248,7 @@ class PromptService:
                 if model_id:
                     allowed_models.add(model_id)
 
-        if candidate in allowed_models:
-            return candidate
-
-        if not allowed_models:
-            raise IAToolkitException(
-                IAToolkitException.ErrorType.INVALID_PARAMETER,
-                "Cannot assign llm_model because the company has no configured models.",
-            )
-
-        raise IAToolkitException(
-            IAToolkitException.ErrorType.INVALID_PARAMETER,
-            f"Unsupported llm_model '{candidate}'. Allowed values: {sorted(allowed_models)}",
-        )
+        return allowed_models
 
     def get_prompts(self, company_short_name: str, include_all: bool = False) -> dict:
         try:
@@ -314,6 +361,23 @@ class PromptService:
             logging.exception("Error loading prompt definition for '%s': %s", prompt_name, e)
             return None
 
+    def validate_prompt_data(self, company_short_name: str, data: dict):
+        """
+        Runs the checks of save_prompt that do not write anything, so a save can be
+        rejected before it is queued.
+        """
+        if not isinstance(data, dict):
+            raise IAToolkitException(IAToolkitException.ErrorType.INVALID_PARAMETER,
+                                     "Prompt data must be an object.")
+
+        company = self.profile_repo.get_company_by_short_name(company_short_name)
+        if not company:
+            raise IAToolkitException(IAToolkitException.ErrorType.INVALID_NAME,
+                                     f"Company {company_short_name} not found")
+
+        self._extract_output_schema_payload(data)
+        self._normalize_llm_model(company_short_name, data.get("llm_model"))
+
     def save_prompt(self, company_short_name: str, prompt_name: str, data: dict):
         """
         Create or Update a prompt.
@@ -369,6 +433,7 @@ class PromptService:
             llm_model=self._normalize_llm_model(company_short_name, data.get("llm_model")),
         )
         self.llm_query_repo.create_or_update_prompt(new_prompt)
+        invalidate_prompt_cache(company_short_name)
 
     def delete_prompt(self, company_short_name: str, prompt_name: str):
         """
@@ -386,6 +451,7 @@ class PromptService:
 
         # 1. Remove from DB
         self.llm_query_repo.delete_prompt(prompt_db)
+        invalidate_prompt_cache(company_short_name)
 
     def _resolve_system_prompt_capabilities(self, company_short_name: str) -> set[str]:
         capabilities: set[str] = set()
@@ -474,22 +540,23 @@ class PromptService:
             return
 
         try:
-            # 1. Sync Categories
-            category_map = {}
-
-            for i, category_name in enumerate(categories_config):
-                category_obj = PromptCategory(
-                    company_id=company.id,
-                    name=category_name,
-                    order=i + 1
-                )
-                # Persist and get back the object with ID
-                persisted_cat = self.llm_query_repo.create_or_update_prompt_category(category_obj)
-                category_map[category_name] = persisted_cat
+            # 1. Sync Categories (one SELECT + flush, so prompts can reference their ids)
+            category_map = self.llm_query_repo.upsert_prompt_categories(company.id, [
+                PromptCategory(company_id=company.id, name=category_name, order=i + 1)
+                for i, category_name in enumerate(categories_config)
+            ])
 
             # 2. Sync Prompts
             defined_prompt_names = set()
+            new_prompts = []
             company_default_policy = self._get_company_default_attachment_policy(company_short_name)
+            # loop invariants: the allowed models are resolved once, not once per prompt
+            allowed_llm_models = (
+                self._get_allowed_llm_models(company_short_name)
+                if any(p.get("llm_model") for p in prompt_list) else set()
+            )
+            default_attachment_mode = company_default_policy["attachment_mode"]
+            default_attachment_fallback = company_default_policy["attachment_fallback"]
 
             for prompt_data in prompt_list:
                 category_name = prompt_data.get('category')
@@ -520,18 +587,23 @@ class PromptService:
                     output_schema_mode=self._normalize_output_schema_mode(prompt_data.get("output_schema_mode")),
                     output_response_mode=self._normalize_output_response_mode(prompt_data.get("output_response_mode")),
                     attachment_mode=self._normalize_attachment_mode(
-                        prompt_data.get("attachment_mode", company_default_policy["attachment_mode"])
+                        prompt_data.get("attachment_mode", default_attachment_mode)
                     ),
                     attachment_parser_provider=self._normalize_attachment_parser_provider(
                         prompt_data.get("attachment_parser_provider")
                     ),
                     attachment_fallback=self._normalize_attachment_fallback(
-                        prompt_data.get("attachment_fallback", company_default_policy["attachment_fallback"])
+                        prompt_data.get("attachment_fallback", default_attachment_fallback)
+                    ),
+                    llm_model=self._normalize_llm_model(
+                        company_short_name, prompt_data.get("llm_model"), allowed_llm_models
                     ),
-                    llm_model=self._normalize_llm_model(company_short_name, prompt_data.get("llm_model")),
                 )
 
-                self.llm_query_repo.create_or_update_prompt(new_prompt)
+                new_prompts.append(new_prompt)
+
+            # all prompts are upserted with one SELECT and committed below, together with the cleanup
+            self.llm_query_repo.upsert_prompts(company.id, new_prompts)
 
             # 3. Cleanup: Delete prompts present in DB but not in Config
             existing_prompts = self.llm_query_repo.get_prompts(company, include_all=True)
@@ -541,6 +613,7 @@ class PromptService:
                     self.llm_query_repo.session.delete(p)
 
             self.llm_query_repo.commit()
+            invalidate_prompt_cache(company_short_name)
 
         except IAToolkitException:
             self.llm_query_repo.rollback()
@@ -588,6 +661,7 @@ class PromptService:
                     self.llm_query_repo.session.delete(cat)
 
             self.llm_query_repo.commit()
+            invalidate_prompt_cache(company_short_name)
 
         except Exception as e:
             self.llm_query_repo.rollback()
@@ -10,8 +10,10 @@ from iatoolkit.common.exceptions import IAToolkitException
 from iatoolkit.common.util import Utility
 from injector import inject, singleton
 from typing import Callable
+import copy
 import json
 import logging
+import time
 
 
 @singleton
@@ -20,6 +22,8 @@ class SqlService:
     Manages database connections and executes SQL statements.
     It maintains a cache of named DatabaseManager instances to avoid reconnecting.
     """
+    # seconds an introspected database structure is reused before the database is inspected again
+    DB_STRUCTURE_CACHE_TTL = 600
 
     @inject
     def __init__(self,
@@ -35,6 +39,10 @@ class SqlService:
         # cache for database schemas. Key is tuple: (company_short_name, db_name)
         self._db_schemas: dict[tuple[str, str], str] = {}
 
+        # cache for introspected database structures. Key is tuple: (company_short_name, db_name)
+        # Value is (monotonic time of the introspection, structure)
+        self._db_structures: dict[tuple[str, str], tuple[float, dict]] = {}
+
         # Registry of factory functions.
         # Format: {'connection_type': function(config_dict) -> DatabaseProvider}
         self._provider_factories: dict[str, Callable[[dict], DatabaseProvider]] = {}
@@ -79,11 +87,17 @@ class SqlService:
 
             # save the db_schema
             self._db_schemas[key] = config.get('schema', 'public')
+
+            # a new connection may point to a different database: introspect again
+            self._db_structures.pop(key, None)
         except Exception as e:
             logging.error(f"Failed to register DB '{db_name}': {e}")
             # We don't raise here to allow other DBs to load if one fails
 
     def clear_company_connections(self, company_short_name: str):
+        # a config reload may follow a migration: introspect the databases again
+        self.refresh_database_structure(company_short_name)
+
         keys_to_clear = [key for key in self._db_connections if key[0] == company_short_name]
         for key in keys_to_clear:
             provider = self._db_connections.pop(key, None)
@@ -133,6 +147,7 @@ class SqlService:
             raise IAToolkitException(IAToolkitException.ErrorType.DATABASE_ERROR,
                                      'missing database_name in call to exec_sql')
 
+        provider = None
         try:
             # 1. Get the abstract provider (could be Direct or Bridge)
             provider = self.get_database_provider(company_short_name, database_name)
@@ -152,9 +167,8 @@ class SqlService:
         except IAToolkitException:
             raise
         except Exception as e:
-            # Attempt rollback if supported/needed
+            # Roll back the same provider (and session) that ran the failing statement
             try:
-                provider = self.get_database_provider(company_short_name, database_name)
                 if provider:
                     provider.rollback()
             except Exception:
@@ -168,6 +182,20 @@ class SqlService:
             raise IAToolkitException(IAToolkitException.ErrorType.DATABASE_ERROR,
                                      error_message) from e
 
+    def refresh_database_structure(self, company_short_name: str, db_name: str | None = None):
+        """
+        Drops the cached database structures of a company (or a single database),
+        e.g. after a migration, so the next call introspects the database again.
+        Config reloads call it through clear_company_connections; other workers
+        introspect again once DB_STRUCTURE_CACHE_TTL has passed.
+        """
+        keys_to_clear = [
+            key for key in self._db_structures
+            if key[0] == company_short_name and (db_name is None or key[1] == db_name)
+        ]
+        for key in keys_to_clear:
+            self._db_structures.pop(key, None)
+
     def commit(self, company_short_name: str, database_name: str):
         """
         Commits the current transaction for a registered database provider.
@@ -190,10 +218,20 @@ class SqlService:
         """
         Introspects the specified database and returns its structure (Tables & Columns).
         Used for the Schema Editor 2.0
+        The introspection result is cached per database; callers get their own copy,
+        so they can enrich it without touching the cache.
         """
+        key = (company_short_name, db_name)
         try:
-            provider = self.get_database_provider(company_short_name, db_name)
-            return provider.get_database_structure()
+            cached = self._db_structures.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.DB_STRUCTURE_CACHE_TTL:
+                structure = cached[1]
+            else:
+                provider = self.get_database_provider(company_short_name, db_name)
+                structure = provider.get_database_structure()
+                self._db_structures[key] = (time.monotonic(), structure)
+
+            return copy.deepcopy(structure)
         except IAToolkitException:
             raise
         except Exception as e:
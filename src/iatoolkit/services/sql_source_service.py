@@ -217,7 +217,8 @@ class SqlSourceService:
         by_database = {self._normalize_database(row.database): row for row in existing_rows}
 
         desired_yaml_dbs: set[str] = set()
-        upserted = 0
+        # rows are collected and persisted in one transaction at the end
+        upserts: dict[str, SqlSource] = {}
         skipped = 0
 
         for raw in sources_from_yaml:
@@ -273,19 +274,18 @@ class SqlSourceService:
             target.source = SqlSource.SOURCE_YAML
             target.is_active = bool(raw.get("is_active", True))
 
-            persisted = self.sql_source_repo.create_or_update(target)
-            by_database[database] = persisted
-            upserted += 1
-
-        deleted = 0
-        for row in list(by_database.values()):
-            database = self._normalize_database(row.database)
-            if row.source != SqlSource.SOURCE_YAML:
-                continue
-            if database in desired_yaml_dbs:
-                continue
-            self.sql_source_repo.delete(row)
-            deleted += 1
+            by_database[database] = target
+            upserts[database] = target
+
+        deletes = [
+            row for row in by_database.values()
+            if row.source == SqlSource.SOURCE_YAML
+            and self._normalize_database(row.database) not in desired_yaml_dbs
+        ]
+        if upserts or deletes:
+            self.sql_source_repo.save_all(list(upserts.values()), deletes)
+        upserted = len(upserts)
+        deleted = len(deletes)
 
         return {
             "upserted": upserted,
@@ -8,8 +8,10 @@ import uuid
 import logging
 import mimetypes
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from injector import inject
-from typing import Dict
+from typing import Dict, List, Tuple, Union
 from flask import current_app, has_app_context
 from itsdangerous import URLSafeSerializer, BadSignature
 
@@ -20,6 +22,12 @@ from iatoolkit.common.interfaces.secret_provider import SecretProvider
 from iatoolkit.services.configuration_service import ConfigurationService
 
 DOWNLOAD_TOKEN_SALT = "iatoolkit-download-token-v1"
+MAX_IMAGE_UPLOAD_WORKERS = 8
+
+
+@lru_cache(maxsize=64)
+def _guess_extension(mime_type: str) -> str:
+    return mimetypes.guess_extension(mime_type) or ".png"
 
 
 class StorageService:
@@ -70,35 +78,69 @@ class StorageService:
         Saves an LLM generated image (Base64) to storage.
         """
         try:
-            # 1. Clean and Decode Base64
-            if "base64," in base64_data:
-                base64_data = base64_data.split("base64,")[1]
-            image_bytes = base64.b64decode(base64_data)
-
-            # 2. Generate path
-            ext = mimetypes.guess_extension(mime_type) or ".png"
-            filename = f"{uuid.uuid4()}{ext}"
-            storage_key = f"companies/{company_short_name}/generated_images/{filename}"
-
-            # 3. Use abstract connector
             connector = self._get_connector(company_short_name)
-            connector.upload_file(
-                file_path=storage_key,
-                content=image_bytes,
-                content_type=mime_type
-            )
-
-            logging.info(f"Generated image saved at: {storage_key}")
-
-            return {
-                "storage_key": storage_key,
-                "url": connector.generate_presigned_url(storage_key)
-            }
+            return self._upload_generated_image(connector, company_short_name, base64_data, mime_type)
+        except Exception as e:
+            raise self._image_storage_error(e)
 
+    def store_generated_images(self,
+                               company_short_name: str,
+                               images: List[Tuple[str, str]]) -> List[Union[Dict[str, str], IAToolkitException]]:
+        """
+        Saves several LLM generated images, given as (base64_data, mime_type), through one
+        connector, uploading them concurrently. Returns one result per image, in order: its
+        {storage_key, url}, or the IAToolkitException raised for it.
+        """
+        try:
+            connector = self._get_connector(company_short_name)
         except Exception as e:
-            error_msg = f"Error saving image to Storage: {str(e)}"
-            logging.error(error_msg)
-            raise IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR, error_msg)
+            error = self._image_storage_error(e)
+            return [error] * len(images)
+
+        def store(image: Tuple[str, str]):
+            try:
+                return self._upload_generated_image(connector, company_short_name, *image)
+            except Exception as e:
+                return self._image_storage_error(e)
+
+        if len(images) <= 1:
+            return [store(image) for image in images]
+        with ThreadPoolExecutor(max_workers=min(len(images), MAX_IMAGE_UPLOAD_WORKERS)) as executor:
+            return list(executor.map(store, images))
+
+    def _upload_generated_image(self,
+                                connector: FileConnector,
+                                company_short_name: str,
+                                base64_data: str,
+                                mime_type: str) -> Dict[str, str]:
+        # 1. Clean and Decode Base64
+        if "base64," in base64_data:
+            base64_data = base64_data.split("base64,")[1]
+        image_bytes = base64.b64decode(base64_data)
+
+        # 2. Generate path
+        filename = f"{uuid.uuid4().hex}{_guess_extension(mime_type)}"
+        storage_key = f"companies/{company_short_name}/generated_images/{filename}"
+
+        # 3. Use abstract connector; presigned urls are signed locally, without a round-trip
+        connector.upload_file(
+            file_path=storage_key,
+            content=image_bytes,
+            content_type=mime_type
+        )
+
+        logging.info(f"Generated image saved at: {storage_key}")
+
+        return {
+            "storage_key": storage_key,
+            "url": connector.generate_presigned_url(storage_key)
+        }
+
+    @staticmethod
+    def _image_storage_error(e: Exception) -> IAToolkitException:
+        error_msg = f"Error saving image to Storage: {str(e)}"
+        logging.error(error_msg)
+        return IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR, error_msg)
 
     def generate_presigned_url(self, company_short_name: str, storage_key: str) -> str:
         """Gets a fresh signed URL using the configured connector."""
@@ -13,6 +13,22 @@ from typing import Any
 import yaml
 
 
+def _is_integer(instance: Any) -> bool:
+    return isinstance(instance, int) and not isinstance(instance, bool)
+
+
+# JSON schema type -> instance predicate, used by _matches_type
+_TYPE_CHECKS = {
+    "null": lambda instance: instance is None,
+    "object": lambda instance: isinstance(instance, dict),
+    "array": lambda instance: isinstance(instance, list),
+    "string": lambda instance: isinstance(instance, str),
+    "integer": _is_integer,
+    "number": lambda instance: _is_integer(instance) or isinstance(instance, float),
+    "boolean": lambda instance: isinstance(instance, bool),
+}
+
+
 class StructuredOutputService:
     """Helpers for prompt output schema parsing, normalization and validation."""
 
@@ -466,22 +482,8 @@ class StructuredOutputService:
 
         allowed_types = schema_type if isinstance(schema_type, list) else [schema_type]
         for expected in allowed_types:
-            if expected == "null":
-                if instance is None:
-                    return True
-            elif expected == "object" and isinstance(instance, dict):
-                return True
-            elif expected == "array" and isinstance(instance, list):
-                return True
-            elif expected == "string" and isinstance(instance, str):
-                return True
-            elif expected == "integer" and isinstance(instance, int) and not isinstance(instance, bool):
-                return True
-            elif expected == "number" and (
-                (isinstance(instance, int) and not isinstance(instance, bool)) or isinstance(instance, float)
-            ):
-                return True
-            elif expected == "boolean" and isinstance(instance, bool):
+            check = _TYPE_CHECKS.get(expected) if isinstance(expected, str) else None
+            if check is not None and check(instance):
                 return True
         return False
 
@@ -152,7 +152,23 @@ def load_system_tools_definitions() -> list[dict]:
     return _parse_system_tools_catalog(catalog_text)
 
 
+def build_system_tool_templates(definitions: list[dict]) -> tuple[tuple[str, str, dict], ...]:
+    # (function_name, description, parameters) per tool, ready to build the Tool rows
+    return tuple(
+        (item["function_name"], item["description"], item["parameters"])
+        for item in definitions
+    )
+
+
 SYSTEM_TOOLS_DEFINITIONS = load_system_tools_definitions()
+SYSTEM_TOOLS_TEMPLATES = build_system_tool_templates(SYSTEM_TOOLS_DEFINITIONS)
+
+
+def get_system_tool_templates(definitions: list[dict]) -> tuple[tuple[str, str, dict], ...]:
+    # the catalog loaded at import time is served from the precomputed templates
+    if definitions is SYSTEM_TOOLS_DEFINITIONS:
+        return SYSTEM_TOOLS_TEMPLATES
+    return build_system_tool_templates(definitions)
 
 
 def get_system_tools_catalog_source() -> str:
@@ -23,11 +23,15 @@ from iatoolkit.services.mail_service import MailService
 from iatoolkit.services.visual_tool_service import VisualToolService
 from iatoolkit.services.system_tools import (
     SYSTEM_TOOLS_DEFINITIONS,
+    get_system_tool_templates,
     get_system_tools_catalog_source,
 )
 from iatoolkit import current_iatoolkit
 
 
+_QUERY_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
 class ToolService:
     HTTP_ALLOWED_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
     HTTP_ALLOWED_BODY_MODES = {"none", "json_map", "full_args"}
@@ -258,7 +262,7 @@ class ToolService:
     def _memory_search_should_attach_native_files(cls, query: str | None) -> bool:
         normalized_query = unicodedata.normalize("NFKD", str(query or "").lower())
         normalized_query = "".join(char for char in normalized_query if not unicodedata.combining(char))
-        tokens = set(re.findall(r"[a-z0-9]+", normalized_query))
+        tokens = set(_QUERY_TOKEN_RE.findall(normalized_query))
         return any(hint in tokens for hint in cls.MEMORY_NATIVE_ATTACHMENT_QUERY_HINTS)
 
     def _handle_memory_get_page_tool(self,
@@ -632,17 +636,19 @@ class ToolService:
             self._validate_configured_system_handlers(SYSTEM_TOOLS_DEFINITIONS)
 
             # Upsert configured system tools. This is idempotent and avoids destructive deletes.
-            for function in SYSTEM_TOOLS_DEFINITIONS:
-                new_tool = Tool(
+            new_tools = [
+                Tool(
                     company_id=None,
-                    name=function['function_name'],
-                    description=function['description'],
-                    parameters=function['parameters'],
+                    name=name,
+                    description=description,
+                    parameters=parameters,
                     tool_type=Tool.TYPE_SYSTEM,
                     source=Tool.SOURCE_SYSTEM,
                     is_active=True,
                 )
-                self.llm_query_repo.create_or_update_tool(new_tool)
+                for name, description, parameters in get_system_tool_templates(SYSTEM_TOOLS_DEFINITIONS)
+            ]
+            self.llm_query_repo.create_or_update_system_tools(new_tools)
 
             self.llm_query_repo.commit()
         except IAToolkitException:
@@ -680,13 +686,20 @@ class ToolService:
             and (tool.parameters or {}) == (definition.get("parameters") or {})
         )
 
+    @staticmethod
+    def _system_tool_names(definitions: list[dict]) -> set[str]:
+        desired_names = {str(item.get("function_name") or "").strip() for item in definitions}
+        desired_names.discard("")
+        return desired_names
+
     def _system_tools_catalog_has_drift(
         self,
         definitions: list[dict],
         existing_by_name: dict[str, Tool],
+        desired_names: set[str] | None = None,
     ) -> bool:
-        desired_names = {str(item.get("function_name") or "").strip() for item in definitions}
-        desired_names.discard("")
+        if desired_names is None:
+            desired_names = self._system_tool_names(definitions)
 
         for name, tool in existing_by_name.items():
             if name not in desired_names and bool(tool.is_active):
@@ -711,7 +724,9 @@ class ToolService:
             existing_system_tools = self.llm_query_repo.list_system_tools() or []
             existing_by_name = {tool.name: tool for tool in existing_system_tools if tool and tool.name}
 
-            if not self._system_tools_catalog_has_drift(definitions, existing_by_name):
+            desired_names = self._system_tool_names(definitions)
+
+            if not self._system_tools_catalog_has_drift(definitions, existing_by_name, desired_names):
                 return {
                     "data": {
                         "status": "skipped",
@@ -743,8 +758,6 @@ class ToolService:
                 self.llm_query_repo.create_or_update_tool(new_tool)
                 upserted_tools += 1
 
-            desired_names = {str(item.get("function_name") or "").strip() for item in definitions}
-            desired_names.discard("")
             deactivated_tools = 0
             for name, tool in existing_by_name.items():
                 if name in desired_names or not bool(tool.is_active):
@@ -28,11 +28,14 @@ class UserSessionContextService:
         """Clears LLM-related context for a user (history and response IDs), preserving profile_data."""
         session_key = self._get_session_key(company_short_name, user_identifier, model=model)
         if session_key:
-            # 'profile_data' should not be deleted
-            RedisSessionManager.hdel(session_key, "context_version")
-            RedisSessionManager.hdel(session_key, "context_history")
-            RedisSessionManager.hdel(session_key, "last_response_id")
-            RedisSessionManager.hdel(session_key, "selected_system_prompt_keys")
+            # 'profile_data' should not be deleted; one HDEL (one round-trip) for all fields
+            RedisSessionManager.hdel(
+                session_key,
+                "context_version",
+                "context_history",
+                "last_response_id",
+                "selected_system_prompt_keys",
+            )
 
     def clear_llm_history(self, company_short_name: str, user_identifier: str, model: str = None):
         """Clears only LLM history fields (last_response_id and context_history)."""
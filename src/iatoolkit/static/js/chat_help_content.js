@@ -20,16 +20,17 @@ $(document).ready(function () {
         helpModal.show();
 
         try {
-            const helpContent = await callToolkit('/api/help-content', {}, "POST");
+            const response = await callToolkit('/api/help-content', {}, "POST");
 
-            if (!helpContent) {
+            if (!response) {
                 toastr.error('No se pudo cargar la guía de uso. Por favor, intente más tarde.');
                 spinner.hide();
                 helpModal.hide();
                 return;
             }
 
-            // Construir el HTML del acordeón y mostrarlo
+            // Cachear el contenido y construir el HTML del acordeón una sola vez
+            helpContent = response;
             buildHelpAccordion(helpContent);
             spinner.hide();
             accordionContainer.show();
@@ -6,11 +6,42 @@
 from flask.views import MethodView
 from flask import request, jsonify
 from injector import inject
+import threading
+import logging
 import base64
+import os
 
 from iatoolkit.services.knowledge_base_service import KnowledgeBaseService
 from iatoolkit.services.auth_service import AuthService
 from iatoolkit.repositories.profile_repo import ProfileRepo
+from iatoolkit.common.background_tasks import get_executor, submit_in_app_context
+
+
+# one slot per ingestion running or waiting in the executor, whose own queue is unbounded
+_ingest_slots: threading.BoundedSemaphore | None = None
+_ingest_slots_lock = threading.Lock()
+
+
+def _get_int_env(name: str, default: int) -> int:
+    value = os.getenv(name, str(default))
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logging.warning(f"Invalid {name}={value!r}. Using {default}.")
+        return default
+
+
+def _get_ingest_executor():
+    # shared by all requests, so queued ingestions never hold a web worker
+    return get_executor('ingest', max_workers=_get_int_env('IATOOLKIT_INGEST_POOL', 4))
+
+
+def _get_ingest_slots() -> threading.BoundedSemaphore:
+    global _ingest_slots
+    with _ingest_slots_lock:
+        if _ingest_slots is None:
+            _ingest_slots = threading.BoundedSemaphore(_get_int_env('IATOOLKIT_INGEST_QUEUE', 32))
+        return _ingest_slots
 
 
 class LoadDocumentApiView(MethodView):
@@ -50,6 +81,20 @@ class LoadDocumentApiView(MethodView):
             # get the file content from base64
             content = base64.b64decode(base64_content)
 
+            # optional: queue the ingestion and answer right away instead of
+            # holding the request until parsing and embedding are done
+            if req_data.get('async'):
+                if not self._queue_ingestion(company_short_name, filename, content, metadata):
+                    # each queued request keeps its whole file in memory: push back instead
+                    response = jsonify({"error": "La cola de ingesta está llena, reintente más tarde"})
+                    response.status_code = 503
+                    response.headers['Retry-After'] = '30'
+                    return response
+                return jsonify({
+                    "filename": filename,
+                    "status": "queued"
+                }), 202
+
             # Use KnowledgeBaseService for ingestion
             new_document = self.knowledge_base_service.ingest_document_sync(
                 company=company,
@@ -68,3 +113,29 @@ class LoadDocumentApiView(MethodView):
             response.status_code = 500
 
             return response
+
+    def _queue_ingestion(self, company_short_name: str, filename: str, content: bytes, metadata: dict) -> bool:
+        """Submits a background ingestion; False when IATOOLKIT_INGEST_QUEUE of them are already pending."""
+        slots = _get_ingest_slots()
+        if not slots.acquire(blocking=False):
+            return False
+
+        try:
+            future = submit_in_app_context(_get_ingest_executor(), self._ingest_in_background,
+                                           company_short_name, filename, content, metadata,
+                                           description=f"ingestion of '{filename}' for '{company_short_name}'")
+        except Exception:
+            slots.release()
+            raise
+        # the slot is freed once the ingestion has run (or was cancelled)
+        future.add_done_callback(lambda _: slots.release())
+        return True
+
+    def _ingest_in_background(self, company_short_name: str, filename: str, content: bytes, metadata: dict):
+        company = self.profile_repo.get_company_by_short_name(company_short_name)
+        self.knowledge_base_service.ingest_document_sync(
+            company=company,
+            filename=filename,
+            content=content,
+            metadata=metadata
+        )
@@ -3,14 +3,44 @@
 #
 # IAToolkit is open source software.
 
-from flask import jsonify, request
+from flask import Response, current_app, jsonify, request
 from flask.views import MethodView
-from iatoolkit.services.prompt_service import PromptService
+from iatoolkit.services.prompt_service import PromptService, get_cached_prompt_response, cache_prompt_response
 from iatoolkit.services.profile_service import ProfileService
 from iatoolkit.repositories.llm_query_repo import LLMQueryRepo
 from iatoolkit.services.auth_service import AuthService
+from iatoolkit.common.exceptions import IAToolkitException
+from iatoolkit.common.background_tasks import get_executor, submit_in_app_context
 from injector import inject
+import hashlib
 import logging
+import threading
+
+def _encode_payload(payload: dict) -> tuple[bytes, str]:
+    # same bytes as jsonify (compact separators, or indented in debug mode)
+    body = current_app.json.response(payload).get_data()
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _json_bytes_response(body: bytes, etag: str) -> Response:
+    response = Response(body, status=200, mimetype="application/json")
+    response.set_etag(etag)
+    # clients keep their copy but revalidate it on every use
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    # a request whose If-None-Match matches gets a 304 with no body
+    return response.make_conditional(request)
+
+
+# saves sent with ?async=true: one worker, so queued saves run in submission order.
+# A save queued again before it starts only replaces the data (the last edit wins), and a
+# synchronous write of the prompt drops it. This ordering holds within one process only.
+_pending_prompt_saves: dict[tuple[str, str], dict] = {}
+_prompt_save_lock = threading.Lock()
+
+
+def _get_prompt_save_executor():
+    return get_executor('prompt-save', max_workers=1)
 
 
 class PromptApiView(MethodView):
@@ -36,6 +66,14 @@ class PromptApiView(MethodView):
             if not auth_result.get("success"):
                 return jsonify(auth_result), auth_result.get('status_code')
 
+            # Check for query param to include all prompts (admin view)
+            include_all = request.args.get('all', 'false').lower() == 'true'
+
+            cache_key = (company_short_name, prompt_name) if prompt_name else (company_short_name, None, include_all)
+            cached = get_cached_prompt_response(cache_key)
+            if cached is not None:
+                return _json_bytes_response(*cached)
+
             company = self.profile_service.get_company_by_short_name(company_short_name)
             if not company:
                  return jsonify({"error": "Company not found"}), 404
@@ -49,16 +87,22 @@ class PromptApiView(MethodView):
                 # get the prompt content
                 content = self.prompt_service.get_prompt_content(company, prompt_name)
 
-                return jsonify({
+                encoded = _encode_payload({
                     "meta": prompt_obj.to_dict(),
                     "content": content
                 })
+                cache_prompt_response(cache_key, encoded)
+                return _json_bytes_response(*encoded)
             else:
-                # Check for query param to include all prompts (admin view)
-                include_all = request.args.get('all', 'false').lower() == 'true'
-
                 # return prompts based on filter
-                return jsonify(self.prompt_service.get_prompts(company_short_name, include_all=include_all))
+                prompts = self.prompt_service.get_prompts(company_short_name, include_all=include_all)
+                if 'error' in prompts:
+                    return jsonify(prompts)
+
+                # the tree is kept already encoded, so a hit skips the service and the encoder
+                encoded = _encode_payload(prompts)
+                cache_prompt_response(cache_key, encoded)
+                return _json_bytes_response(*encoded)
 
         except Exception as e:
             logging.exception(
@@ -73,7 +117,20 @@ class PromptApiView(MethodView):
 
             data = request.get_json()
 
+            # optional: queue the save and answer right away (e.g. editor auto-save)
+            if request.args.get('async', 'false').lower() == 'true':
+                # reject what save_prompt would reject, since the client gets no later error
+                try:
+                    self.prompt_service.validate_prompt_data(company_short_name, data)
+                except IAToolkitException as e:
+                    status_code = 404 if e.error_type == IAToolkitException.ErrorType.INVALID_NAME else 400
+                    return jsonify({"status": "error", "message": str(e)}), status_code
+
+                self._queue_save(company_short_name, prompt_name, data)
+                return jsonify({"status": "queued"}), 202
+
             # The service handles file magic and YAML sync
+            self._drop_queued_save(company_short_name, prompt_name)
             self.prompt_service.save_prompt(company_short_name, prompt_name, data)
 
             return jsonify({"status": "success"})
@@ -81,6 +138,30 @@ class PromptApiView(MethodView):
             logging.exception(f"Error saving prompt {prompt_name}: {e}")
             return jsonify({"status": "error", "message": str(e)}), 500
 
+    def _queue_save(self, company_short_name: str, prompt_name: str, data: dict):
+        key = (company_short_name, prompt_name)
+        with _prompt_save_lock:
+            already_queued = key in _pending_prompt_saves
+            _pending_prompt_saves[key] = data
+        if not already_queued:
+            submit_in_app_context(_get_prompt_save_executor(), self._save_in_background, key,
+                                  description=f"save of prompt '{prompt_name}' for '{company_short_name}'")
+
+    def _save_in_background(self, key: tuple[str, str]):
+        with _prompt_save_lock:
+            data = _pending_prompt_saves.pop(key, None)
+        if data is None:
+            # a synchronous write of this prompt came after it and replaced it
+            return
+
+        self.prompt_service.save_prompt(key[0], key[1], data)
+
+    @staticmethod
+    def _drop_queued_save(company_short_name: str, prompt_name: str):
+        # a synchronous write is newer than the data queued for that prompt
+        with _prompt_save_lock:
+            _pending_prompt_saves.pop((company_short_name, prompt_name), None)
+
     def post(self, company_short_name, prompt_name=None):
         """Creates a new prompt."""
         try:
@@ -96,6 +177,7 @@ class PromptApiView(MethodView):
                 return jsonify({"status": "error", "message": "Prompt name is required"}), 400
 
             # Reuse save_prompt logic which handles create/update
+            self._drop_queued_save(company_short_name, target_name)
             self.prompt_service.save_prompt(company_short_name, target_name, data)
 
             return jsonify({"status": "success"})
@@ -110,6 +192,7 @@ class PromptApiView(MethodView):
             if not auth_result.get("success"):
                 return jsonify(auth_result), 401
 
+            self._drop_queued_save(company_short_name, prompt_name)
             self.prompt_service.delete_prompt(company_short_name, prompt_name)
 
             return jsonify({"status": "success"})
@@ -0,0 +1,63 @@
+import threading
+from unittest.mock import MagicMock
+
+from iatoolkit.common.interfaces.asset_storage import AssetRepository, AssetType
+
+
+class InMemoryAssetRepository(AssetRepository):
+    """Minimal repository that only implements the abstract methods."""
+
+    def __init__(self, files):
+        self.files = files
+        self.read_text_calls = MagicMock()
+        self.read_threads = set()
+
+    def exists(self, company_short_name, asset_type, filename):
+        return filename in self.files
+
+    def read_text(self, company_short_name, asset_type, filename):
+        self.read_text_calls(filename)
+        self.read_threads.add(threading.get_ident())
+        content = self.files[filename]
+        if isinstance(content, Exception):
+            raise content
+        return content
+
+    def list_files(self, company_short_name, asset_type, extension=None):
+        return [name for name in self.files if not extension or name.endswith(extension)]
+
+    def write_text(self, company_short_name, asset_type, filename, content):
+        self.files[filename] = content
+
+    def delete(self, company_short_name, asset_type, filename):
+        self.files.pop(filename, None)
+
+
+class TestAssetRepositoryReadMany:
+
+    def test_default_read_many_keeps_listing_order_and_skips_unreadable_files(self):
+        files = {f'part{i}.md': f'PART{i}' for i in range(5)}
+        files['part2.md'] = FileNotFoundError('part2.md')
+        files['notes.txt'] = 'ignored'
+        repo = InMemoryAssetRepository(files)
+
+        result = repo.read_many('acme', AssetType.CONTEXT, extension='.md')
+
+        assert list(result.items()) == [('part0.md', 'PART0'), ('part1.md', 'PART1'),
+                                        ('part3.md', 'PART3'), ('part4.md', 'PART4')]
+        assert repo.read_text_calls.call_count == 5
+        # sequential by default: reads stay on the caller's thread and app context
+        assert repo.read_threads == {threading.get_ident()}
+
+    def test_default_read_many_uses_threads_when_repository_opts_in(self):
+        files = {f'part{i}.md': f'PART{i}' for i in range(5)}
+        repo = InMemoryAssetRepository(files)
+        repo.read_many_workers = 4
+
+        result = repo.read_many('acme', AssetType.CONTEXT, extension='.md')
+
+        assert list(result) == list(files)
+        assert threading.get_ident() not in repo.read_threads
+
+    def test_default_read_many_with_no_files(self):
+        assert InMemoryAssetRepository({}).read_many('acme', AssetType.CONTEXT) == {}
@@ -0,0 +1,49 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+from unittest.mock import MagicMock, patch
+from flask import Flask, current_app
+
+from iatoolkit.common import background_tasks
+from iatoolkit.common.background_tasks import get_executor, run_in_app_context, submit_in_app_context
+
+
+class TestBackgroundTasks:
+
+    def setup_method(self):
+        self.app = Flask(__name__)
+
+    def test_get_executor_is_shared_per_name(self):
+        with patch.dict(background_tasks._executors, clear=True):
+            first = get_executor('test', max_workers=1)
+
+            assert get_executor('test', max_workers=4) is first
+            assert get_executor('other', max_workers=1) is not first
+            first.shutdown()
+            background_tasks._executors['other'].shutdown()
+
+    def test_task_runs_in_app_context_and_errors_are_logged_not_raised(self):
+        seen_apps = []
+
+        def task(value):
+            seen_apps.append(current_app._get_current_object())
+            raise Exception(f"failed with {value}")
+
+        with patch('iatoolkit.common.background_tasks.logging') as mock_logging:
+            run_in_app_context(self.app, task, 1, description="test task")
+
+        assert seen_apps == [self.app]
+        mock_logging.exception.assert_called_once()
+        assert "Background test task failed" in mock_logging.exception.call_args.args[0]
+
+    def test_submit_passes_the_current_app_to_the_worker(self):
+        executor = MagicMock()
+        task = MagicMock()
+
+        with self.app.app_context():
+            submit_in_app_context(executor, task, "a", description="test task")
+
+        executor.submit.assert_called_once_with(run_in_app_context, self.app, task, "a",
+                                                description="test task")
@@ -0,0 +1,53 @@
+import json
+import math
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from iatoolkit.common import json_provider
+from iatoolkit.common.json_provider import ORJSONProvider, configure_json_provider
+
+pytest.importorskip("orjson")
+
+
+class TestORJSONProvider:
+
+    def setup_method(self):
+        self.app = Flask(__name__)
+        configure_json_provider(self.app)
+
+    def test_configure_installs_orjson_provider_only_when_available(self, monkeypatch):
+        assert isinstance(self.app.json, ORJSONProvider)
+
+        monkeypatch.setattr(json_provider, "orjson", None)
+        app = Flask(__name__)
+        configure_json_provider(app)
+        assert type(app.json) is DefaultJSONProvider
+
+    def test_jsonify_matches_default_provider(self):
+        payload = {"b": 1, "a": {2: "dos"}, "when": datetime(2024, 5, 1, 12, 30),
+                   "amount": Decimal("10.50"), "name": "Año"}
+
+        with self.app.app_context():
+            body = jsonify(payload).get_data(as_text=True)
+        default = DefaultJSONProvider(self.app)
+
+        assert json.loads(body) == json.loads(default.dumps(payload))
+        assert body.index('"a"') < body.index('"b"')
+
+    def test_falls_back_to_stdlib_for_unsupported_values_and_options(self):
+        provider = self.app.json
+
+        assert provider.dumps({"n": 2 ** 70}) == '{"n": 1180591620717411303424}'
+        assert provider.dumps({"a": 1}, indent=4) == '{\n    "a": 1\n}'
+
+    def test_loads_keeps_values_orjson_cannot_decode_exactly(self):
+        provider = self.app.json
+
+        assert provider.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert provider.loads('{"n": 1180591620717411303424}') == {"n": 2 ** 70}
+        assert math.isnan(provider.loads('[NaN]')[0])
+        assert provider.loads('[Infinity]') == [math.inf]
@@ -7,7 +7,7 @@ import pytest
 from unittest.mock import MagicMock, patch, mock_open
 from iatoolkit.common.exceptions import IAToolkitException
 import os
-from iatoolkit.common.util import Utility
+from iatoolkit.common.util import Utility, _read_text_file
 from datetime import datetime, date
 from decimal import Decimal
 from cryptography.fernet import Fernet
@@ -30,6 +30,7 @@ class TestUtil:
         self.client = self.app.test_client()
 
         self.util = Utility()
+        _read_text_file.cache_clear()
 
         # minimal route to invoke request context and test Utility.get_template_by_language()
         @self.app.route("/template")
@@ -37,6 +38,17 @@ class TestUtil:
             # call the function under test with template base "index"
             return self.util.get_template_by_language("index")
 
+    @staticmethod
+    def _set_scandir_entries(mock_scandir, names, is_file, directory='/test/directory'):
+        entries = []
+        for name in names:
+            entry = MagicMock()
+            entry.name = name
+            entry.path = os.path.join(directory, name)
+            entry.is_file.return_value = is_file(entry.path)
+            entries.append(entry)
+        mock_scandir.return_value.__enter__.return_value = iter(entries)
+
     @patch("jinja2.Environment.get_template")
     def test_util_when_jinja_error(self, mock_get_template):
         mock_template = MagicMock()
@@ -66,6 +78,18 @@ class TestUtil:
         # Validar que la excepción es la esperada
         assert "a large prompt" == prompt
 
+    def test_render_prompt_from_string_reuses_compiled_template(self):
+        from iatoolkit.common.util import _compile_string_template
+        template_string = "Hola {{ name }} (reuse test)"
+
+        first = self.util.render_prompt_from_string(template_string, name="Ana")
+        hits_before = _compile_string_template.cache_info().hits
+        second = self.util.render_prompt_from_string(template_string, name="Luis")
+
+        assert first == "Hola Ana (reuse test)"
+        assert second == "Hola Luis (reuse test)"
+        assert _compile_string_template.cache_info().hits == hits_before + 1
+
     def test_serialize_datetime(self):
         """Test serialización de datetime"""
         test_datetime = datetime(2024, 1, 1, 12, 0, 0)
@@ -155,7 +179,8 @@ class TestUtil:
         assert excinfo.value.error_type == IAToolkitException.ErrorType.FILE_IO_ERROR
         assert "Failed to generate YAML" in str(excinfo.value)
 
-    def test_load_schema_from_yaml(self):
+    @patch('os.stat', return_value=MagicMock(st_mtime_ns=1, st_size=10))
+    def test_load_schema_from_yaml(self, mock_stat):
         mock_yaml_content = """
         field1: "Descripción del campo 1"
         field2: "Descripción del campo 2"
@@ -172,7 +197,8 @@ class TestUtil:
             mock_file.assert_called_once_with("fake_path/schema.yaml", 'r', encoding='utf-8')
 
 
-    def test_markdown_context(self):
+    @patch('os.stat', return_value=MagicMock(st_mtime_ns=1, st_size=10))
+    def test_markdown_context(self, mock_stat):
         md_content = "ejemplo de md context"
         with patch("builtins.open", mock_open(read_data=md_content)) as mock_file:
             context = self.util.load_markdown_context("company_content.md")
@@ -182,6 +208,19 @@ class TestUtil:
             # test file was open
             mock_file.assert_called_once_with("company_content.md", 'r', encoding='utf-8')
 
+    def test_markdown_context_is_cached_until_file_changes(self):
+        stat = MagicMock(st_mtime_ns=1, st_size=10)
+        with patch('os.stat', return_value=stat), \
+                patch("builtins.open", mock_open(read_data="v1")) as mock_file:
+            assert self.util.load_markdown_context("company_content.md") == "v1"
+            assert self.util.load_markdown_context("company_content.md") == "v1"
+            assert mock_file.call_count == 1
+
+            stat.st_mtime_ns = 2
+            mock_file.return_value.read.return_value = "v2"
+            assert self.util.load_markdown_context("company_content.md") == "v2"
+            assert mock_file.call_count == 2
+
     def test_encrypt_decrypt_key_successful(self):
         """Testa encriptación y desencriptación exitosa de una clave."""
         env_vars = {'FERNET_KEY': ACTUAL_FERNET_KEY_FOR_ENV}
@@ -290,103 +329,113 @@ class TestUtil:
         status = self.util.validate_rut("opensoft")
         assert status == False
 
+    def test_validate_rut_with_dots_and_lowercase_k(self):
+        assert self.util.validate_rut("31.456.455-3") is True
+        assert self.util.validate_rut("10.000.013-k") is True
+        assert self.util.validate_rut("10.000.013-K") is True
+        assert self.util.validate_rut("10000013-KK") is False
+        assert self.util.validate_rut("10000013-1-K") is False
+
+    def test_validate_ruts_matches_validate_rut(self):
+        ruts = ["31.456.455-3", "10.000.013-k", "123456789", "opensoft", None, "999999-9",
+                "31456455-4", "6.000.000-K", "123.456.789-2"]
+        result = self.util.validate_ruts(ruts)
+        assert result.tolist() == [self.util.validate_rut(rut) for rut in ruts]
+        assert result[:2].all()
+        assert self.util.validate_ruts([]).tolist() == []
+
+    def test_get_verifier_special_digits(self):
+        assert Utility._get_verifier(31456455) == '3'
+        assert Utility._get_verifier(6) == 'K'
+        assert Utility._get_verifier(0) == '0'
+
     def test_validate_rut_when_ok(self):
         assert self.util.validate_rut("31456455-3") == True
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    def test_get_files_by_extension_success_with_extension(self, mock_isfile, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_success_with_extension(self, mock_scandir, mock_isdir, mock_exists):
         """Test obtener archivos con extensión, retornando nombres con extensión"""
         # Setup mocks
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.txt', 'file2.txt', 'file3.doc', 'subdir']
-        mock_isfile.side_effect = lambda path: not path.endswith('subdir')
+        self._set_scandir_entries(mock_scandir, ['file1.txt', 'file2.txt', 'file3.doc', 'subdir'], is_file=lambda path: not path.endswith('subdir'))
         
         result = self.util.get_files_by_extension('/test/directory', '.txt', return_extension=True)
         
         assert result == ['file1.txt', 'file2.txt']
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    def test_get_files_by_extension_success_without_extension(self, mock_isfile, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_success_without_extension(self, mock_scandir, mock_isdir, mock_exists):
         """Test obtener archivos con extensión, retornando nombres sin extensión"""
         # Setup mocks
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.txt', 'file2.txt', 'file3.doc', 'subdir']
-        mock_isfile.side_effect = lambda path: not path.endswith('subdir')
+        self._set_scandir_entries(mock_scandir, ['file1.txt', 'file2.txt', 'file3.doc', 'subdir'], is_file=lambda path: not path.endswith('subdir'))
         
         result = self.util.get_files_by_extension('/test/directory', '.txt', return_extension=False)
         
         assert result == ['file1', 'file2']
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    def test_get_files_by_extension_success_extension_without_dot(self, mock_isfile, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_success_extension_without_dot(self, mock_scandir, mock_isdir, mock_exists):
         """Test obtener archivos con extensión sin punto, retornando nombres sin extensión"""
         # Setup mocks
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.txt', 'file2.txt', 'file3.doc', 'subdir']
-        mock_isfile.side_effect = lambda path: not path.endswith('subdir')
+        self._set_scandir_entries(mock_scandir, ['file1.txt', 'file2.txt', 'file3.doc', 'subdir'], is_file=lambda path: not path.endswith('subdir'))
         
         result = self.util.get_files_by_extension('/test/directory', 'txt', return_extension=False)
         
         assert result == ['file1', 'file2']
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    def test_get_files_by_extension_empty_result(self, mock_isfile, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_empty_result(self, mock_scandir, mock_isdir, mock_exists):
         """Test cuando no hay archivos con la extensión especificada"""
         # Setup mocks
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.doc', 'file2.pdf', 'subdir']
-        mock_isfile.side_effect = lambda path: not path.endswith('subdir')
+        self._set_scandir_entries(mock_scandir, ['file1.doc', 'file2.pdf', 'subdir'], is_file=lambda path: not path.endswith('subdir'))
         
         result = self.util.get_files_by_extension('/test/directory', '.txt')
         
         assert result == []
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    def test_get_files_by_extension_sorted_result(self, mock_isfile, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_sorted_result(self, mock_scandir, mock_isdir, mock_exists):
         """Test que los resultados estén ordenados alfabéticamente"""
         # Setup mocks
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.return_value = ['zebra.txt', 'alpha.txt', 'beta.txt', 'subdir']
-        mock_isfile.side_effect = lambda path: not path.endswith('subdir')
+        self._set_scandir_entries(mock_scandir, ['zebra.txt', 'alpha.txt', 'beta.txt', 'subdir'], is_file=lambda path: not path.endswith('subdir'))
         
         result = self.util.get_files_by_extension('/test/directory', '.txt', return_extension=True)
         
         assert result == ['alpha.txt', 'beta.txt', 'zebra.txt']
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
     @patch('os.path.exists')
     def test_get_files_by_extension_directory_not_exists(self, mock_exists):
@@ -417,12 +466,12 @@ class TestUtil:
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    def test_get_files_by_extension_os_error(self, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_os_error(self, mock_scandir, mock_isdir, mock_exists):
         """Test cuando hay un error del sistema operativo al listar el directorio"""
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.side_effect = OSError("Permission denied")
+        mock_scandir.side_effect = OSError("Permission denied")
         
         with pytest.raises(IAToolkitException) as excinfo:
             self.util.get_files_by_extension('/test/directory', '.txt')
@@ -431,39 +480,34 @@ class TestUtil:
         assert "Error al buscar archivos en el directorio" in excinfo.value.message
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    def test_get_files_by_extension_with_subdirectories(self, mock_isfile, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_with_subdirectories(self, mock_scandir, mock_isdir, mock_exists):
         """Test que solo se consideren archivos, no subdirectorios"""
         # Setup mocks
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.txt', 'subdir1', 'file2.txt', 'subdir2']
-        # Simular que solo los archivos son archivos, los subdirectorios no
-        mock_isfile.side_effect = lambda path: 'subdir' not in path
+        self._set_scandir_entries(mock_scandir, ['file1.txt', 'subdir1', 'file2.txt', 'subdir2'], is_file=lambda path: 'subdir' not in path)
         
         result = self.util.get_files_by_extension('/test/directory', '.txt', return_extension=True)
         
         assert result == ['file1.txt', 'file2.txt']
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
     @patch('os.path.exists')
     @patch('os.path.isdir')
-    @patch('os.listdir')
-    @patch('os.path.isfile')
-    def test_get_files_by_extension_case_sensitive(self, mock_isfile, mock_listdir, mock_isdir, mock_exists):
+    @patch('os.scandir')
+    def test_get_files_by_extension_case_sensitive(self, mock_scandir, mock_isdir, mock_exists):
         """Test que la búsqueda sea sensible a mayúsculas/minúsculas"""
         # Setup mocks
         mock_exists.return_value = True
         mock_isdir.return_value = True
-        mock_listdir.return_value = ['file1.txt', 'file2.TXT', 'file3.txt', 'subdir']
-        mock_isfile.side_effect = lambda path: not path.endswith('subdir')
+        self._set_scandir_entries(mock_scandir, ['file1.txt', 'file2.TXT', 'file3.txt', 'subdir'], is_file=lambda path: not path.endswith('subdir'))
         
         result = self.util.get_files_by_extension('/test/directory', '.txt', return_extension=True)
         
@@ -471,10 +515,11 @@ class TestUtil:
         assert result == ['file1.txt', 'file3.txt']
         mock_exists.assert_called_once_with('/test/directory')
         mock_isdir.assert_called_once_with('/test/directory')
-        mock_listdir.assert_called_once_with('/test/directory')
+        mock_scandir.assert_called_once_with('/test/directory')
 
+    @patch('os.stat', return_value=MagicMock(st_mtime_ns=1, st_size=10))
     @patch('os.path.exists', return_value=True)
-    def test_get_company_template_success(self, mock_exists):
+    def test_get_company_template_success(self, mock_exists, mock_stat):
         """
         Prueba que la plantilla de una compañía se cargue correctamente cuando el archivo existe.
         """
@@ -512,9 +557,10 @@ class TestUtil:
             mock_file.assert_not_called()
             assert result is None
 
+    @patch('os.stat', return_value=MagicMock(st_mtime_ns=1, st_size=10))
     @patch('os.path.exists', return_value=True)
     @patch('logging.exception')
-    def test_get_company_template_read_error(self, mock_logging, mock_exists):
+    def test_get_company_template_read_error(self, mock_logging, mock_exists, mock_stat):
         """
         Prueba que la función retorne None y loguee una excepción si hay un error al leer el archivo.
         """
@@ -5,10 +5,9 @@
 
 import pytest
 import os
-from unittest.mock import patch, mock_open, call
+from unittest.mock import patch, mock_open
 from iatoolkit.infra.connectors.local_file_connector import LocalFileConnector
 from iatoolkit.common.exceptions import IAToolkitException
-from datetime import datetime
 
 
 class TestLocalFileConnector:
@@ -16,50 +15,35 @@ class TestLocalFileConnector:
         self.mock_directory = "/mock/directory"
         self.file_connector = LocalFileConnector(self.mock_directory)
 
-    @patch("os.listdir", side_effect=Exception("Error al listar directorio"))
-    def test_list_files_error(self, mock_listdir):
+    @patch("os.scandir", side_effect=Exception("Error al listar directorio"))
+    def test_list_files_error(self, mock_scandir):
         with pytest.raises(IAToolkitException) as excinfo:
             self.file_connector.list_files()
 
         assert excinfo.value.error_type == IAToolkitException.ErrorType.FILE_IO_ERROR
         assert "Error procesando el directorio" in str(excinfo.value)
-        mock_listdir.assert_called_once_with(self.mock_directory)
-
-    @patch("os.path.getmtime")
-    @patch("os.path.getsize")
-    @patch("os.listdir")
-    @patch("os.path.isfile")
-    def test_list_files_success(self, mock_isfile, mock_listdir,
-                                mock_getsize, mock_getmtime):
-        # Configurar mocks
-        mock_listdir.return_value = ["file1.txt", "file2.pdf", "subdir"]
-        mock_isfile.side_effect = lambda path: not path.endswith("subdir")
-        mock_getsize.return_value = 100
-        mock_getmtime.return_value = datetime(2024, 2, 19, 15, 30)
-
-        expected_return = [
+        mock_scandir.assert_called_once_with(self.mock_directory)
+
+    def test_list_files_success(self, tmp_path):
+        (tmp_path / "file1.txt").write_bytes(b"x" * 100)
+        (tmp_path / "file2.pdf").write_bytes(b"y" * 20)
+        (tmp_path / "subdir").mkdir()
+        os.utime(tmp_path / "file1.txt", (1708356600, 1708356600))
+        connector = LocalFileConnector(str(tmp_path))
+
+        result = sorted(connector.list_files(), key=lambda f: f["name"])
+
+        assert result == [
             {
-                'name': "file1.txt", 'path': '/mock/directory/file1.txt',
-                'metadata': {'size': 100, 'last_modified': mock_getmtime.return_value}
+                'name': "file1.txt", 'path': os.path.join(str(tmp_path), "file1.txt"),
+                'metadata': {'size': 100, 'last_modified': 1708356600}
             },
             {
-                'name': "file2.pdf", 'path': '/mock/directory/file2.pdf',
-                'metadata': {'size': 100, 'last_modified': mock_getmtime.return_value}
+                'name': "file2.pdf", 'path': os.path.join(str(tmp_path), "file2.pdf"),
+                'metadata': {'size': 20, 'last_modified': os.path.getmtime(tmp_path / "file2.pdf")}
             }
         ]
 
-
-        result = self.file_connector.list_files()
-
-        assert result == expected_return
-        mock_listdir.assert_called_once_with(self.mock_directory)
-        mock_isfile.assert_has_calls([
-            call(os.path.join(self.mock_directory, "file1.txt")),
-            call(os.path.join(self.mock_directory, "file2.pdf")),
-            call(os.path.join(self.mock_directory, "subdir")),
-        ])
-
-
     @patch("builtins.open", side_effect=Exception("Error al abrir el archivo"))
     def test_get_file_content_error(self, mock_open_file):
         """Prueba para verificar que `get_file_content` lanza una excepción en caso de error."""
@@ -5,7 +5,7 @@
 
 import unittest
 from unittest.mock import patch, MagicMock
-from iatoolkit.infra.connectors.s3_connector import S3Connector
+from iatoolkit.infra.connectors.s3_connector import S3Connector, S3_CLIENT_CONFIG, _get_s3_client
 from datetime import datetime
 
 
@@ -14,6 +14,7 @@ class TestS3Connector(unittest.TestCase):
         # 1. Patch de `boto3.client`
         self.boto3_client_patch = patch('iatoolkit.infra.connectors.s3_connector.boto3.client')
         self.mock_boto3_client = self.boto3_client_patch.start()
+        _get_s3_client.cache_clear()
 
         # 2. Configurar el objeto cliente mock que devuelve boto3
         self.mock_s3_client = MagicMock()
@@ -39,10 +40,22 @@ class TestS3Connector(unittest.TestCase):
 
     def tearDown(self):
         self.boto3_client_patch.stop()
+        _get_s3_client.cache_clear()
 
     def test_init_creates_boto3_client_correctly(self):
         """Verifica que el cliente boto3 se inicializa con las credenciales pasadas."""
-        self.mock_boto3_client.assert_called_with('s3', **self.auth)
+        self.mock_boto3_client.assert_called_with('s3', config=S3_CLIENT_CONFIG, **self.auth)
+
+    def test_client_is_reused_for_same_credentials(self):
+        """Conectores con las mismas credenciales comparten el cliente (y su pool de conexiones)."""
+        other = S3Connector(bucket="other-bucket", prefix="", folder="", auth=dict(self.auth))
+        rotated = S3Connector(bucket=self.bucket, prefix="", folder="",
+                              auth={**self.auth, "aws_secret_access_key": "rotated"})
+
+        self.assertIs(other.s3, self.connector.s3)
+        self.assertEqual(self.mock_boto3_client.call_count, 2)
+        rotated_call = self.mock_boto3_client.call_args
+        self.assertEqual(rotated_call.kwargs["aws_secret_access_key"], "rotated")
 
     def test_list_files_returns_mapped_objects(self):
         """Verifica que list_files mapea correctamente la respuesta de S3 a la estructura interna."""
@@ -163,3 +163,31 @@ class TestAnthropicAdapter:
 
         assert excinfo.value.error_type == IAToolkitException.ErrorType.LLM_ERROR
         assert "Error calling Anthropic API" in str(excinfo.value)
+
+    def test_create_response_marks_stable_prefix_for_prompt_caching(self):
+        block = MagicMock()
+        block.type = "text"
+        block.text = "ok"
+        response = self._mock_response([block], input_tokens=10, output_tokens=5)
+        response.usage.cache_read_input_tokens = 900
+        response.usage.cache_creation_input_tokens = 0
+        self.mock_client.messages.create.return_value = response
+
+        result = self.adapter.create_response(
+            model="claude-3-5-sonnet-latest",
+            input=[{"role": "system", "content": "Contexto largo"}, {"role": "user", "content": "Hola"}],
+            tools=[
+                {"type": "function", "name": "tool_a", "parameters": {"type": "object"}},
+                {"type": "function", "name": "tool_b", "parameters": {"type": "object"}},
+            ],
+        )
+
+        call_kwargs = self.mock_client.messages.create.call_args.kwargs
+        assert call_kwargs["system"] == [
+            {"type": "text", "text": "Contexto largo", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert "cache_control" not in call_kwargs["tools"][0]
+        assert call_kwargs["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        assert result.usage.input_tokens == 910
+        assert result.usage.cached_input_tokens == 900
+        assert result.usage.total_tokens == 915
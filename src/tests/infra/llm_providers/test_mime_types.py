@@ -0,0 +1,25 @@
+from unittest.mock import patch
+
+from iatoolkit.infra.llm_providers import mime_types
+from iatoolkit.infra.llm_providers.mime_types import guess_mime_type
+
+
+class TestGuessMimeType:
+
+    def setup_method(self):
+        mime_types._guess_mime_type.cache_clear()
+
+    def test_common_extensions_skip_the_mimetypes_db(self):
+        with patch.object(mime_types.mimetypes, "guess_type") as guess_type:
+            assert guess_mime_type("foto.JPG") == "image/jpeg"
+            assert guess_mime_type("scan.webp") == "image/webp"
+            assert guess_mime_type("contrato.pdf") == "application/pdf"
+        guess_type.assert_not_called()
+
+    def test_other_names_match_mimetypes_and_are_cached(self):
+        with patch.object(mime_types.mimetypes, "guess_type", wraps=mime_types.mimetypes.guess_type) as guess_type:
+            assert guess_mime_type("notas.txt") == "text/plain"
+            assert guess_mime_type("notas.txt") == "text/plain"
+            assert guess_mime_type("sin_extension") is None
+            assert guess_mime_type(None) is None
+        assert guess_type.call_count == 3  # notas.txt only once
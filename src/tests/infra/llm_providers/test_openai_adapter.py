@@ -4,9 +4,11 @@
 # IAToolkit is open source software.
 
 
+import asyncio
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, AsyncMock, patch
 from iatoolkit.infra.llm_providers.openai_adapter import OpenAIAdapter
+from iatoolkit.infra.llm_response_cache import InMemoryLLMResponseCache, SemanticLLMResponseCache
 from iatoolkit.infra.llm_response import LLMResponse, ToolCall, Usage
 from iatoolkit.common.exceptions import IAToolkitException
 
@@ -283,3 +285,192 @@ class TestOpenAIAdapter:
 
         # output_text debe incluir texto (la imagen está en content_parts)
         assert 'Here is the image:' in result.output_text
+
+    def test_map_response_collects_text_and_reasoning_in_one_pass(self):
+        """Los textos de varios mensajes se concatenan en orden y el reasoning se extrae del mismo recorrido."""
+        from types import SimpleNamespace as NS
+        response = MagicMock()
+        response.output = [
+            NS(type='reasoning', summary=[NS(text=' paso 1 ')], content=[NS(text='paso 2')]),
+            NS(type='message', content=[NS(type='output_text', text='Hola '), NS(type='refusal', text='x')]),
+            NS(type='message', content=[NS(type='output_text', text='mundo')]),
+        ]
+        response.usage.input_tokens = 1
+        response.usage.output_tokens = 1
+        response.usage.total_tokens = 2
+
+        result = self.adapter._map_openai_response(response)
+
+        assert result.output_text == 'Hola mundo'
+        assert result.content_parts == [{'type': 'text', 'text': 'Hola '}, {'type': 'text', 'text': 'mundo'}]
+        assert result.reasoning_content == 'paso 1\npaso 2'
+
+    def test_to_data_url_wraps_only_valid_base64(self):
+        """_to_data_url valida el base64 sin decodificarlo y respeta data URLs existentes."""
+        assert OpenAIAdapter._to_data_url("aGVsbG8=", "text/plain") == "data:text/plain;base64,aGVsbG8="
+        assert OpenAIAdapter._to_data_url("data:image/png;base64,AAAA", "image/png") == "data:image/png;base64,AAAA"
+        assert OpenAIAdapter._to_data_url("aGVsbG8", "text/plain") == "aGVsbG8"
+        assert OpenAIAdapter._to_data_url("no es base64!", "text/plain") == "no es base64!"
+
+    def test_acreate_response_awaits_async_client(self):
+        """acreate_response usa el cliente async y mapea igual que create_response."""
+        mock_response = MagicMock()
+        mock_response.id = 'resp-async'
+        mock_response.model = 'gpt-4'
+        mock_response.status = 'completed'
+        mock_response.output_text = 'async hello'
+        mock_response.output = []
+        mock_response.usage.input_tokens = 3
+        mock_response.usage.output_tokens = 2
+        mock_response.usage.total_tokens = 5
+
+        async_client = MagicMock()
+        async_client.responses.create = AsyncMock(return_value=mock_response)
+        adapter = OpenAIAdapter(openai_client=self.mock_openai_client, async_client=async_client)
+
+        result = asyncio.run(adapter.acreate_response(
+            model='gpt-4', input=[{'role': 'user', 'content': 'hi'}], tool_choice='required'))
+
+        async_client.responses.create.assert_awaited_once()
+        call_kwargs = async_client.responses.create.call_args.kwargs
+        assert call_kwargs['model'] == 'gpt-4'
+        assert call_kwargs['tool_choice'] == 'required'
+        assert result.id == 'resp-async'
+        assert result.output_text == 'async hello'
+        self.mock_openai_client.responses.create.assert_not_called()
+
+    def test_acreate_response_waits_for_rate_limiter(self):
+        """Con rate_limiter, acreate_response reserva los tokens estimados antes de llamar."""
+        async_client = MagicMock()
+        async_client.responses.create = AsyncMock(return_value=MagicMock(output=[]))
+        rate_limiter = MagicMock()
+        rate_limiter.acquire = AsyncMock()
+        adapter = OpenAIAdapter(openai_client=self.mock_openai_client, async_client=async_client,
+                                rate_limiter=rate_limiter)
+
+        with patch('iatoolkit.infra.llm_providers.openai_adapter.estimate_tokens', return_value=7) as estimate:
+            asyncio.run(adapter.acreate_response(model='gpt-4', input=[{'role': 'user', 'content': 'hi'}]))
+
+        estimate.assert_called_once_with([{'role': 'user', 'content': 'hi'}], 'gpt-4')
+        rate_limiter.acquire.assert_awaited_once_with(7)
+        async_client.responses.create.assert_awaited_once()
+
+    def test_acreate_response_timeout_raises_llm_error(self):
+        """Un timeout en acreate_response se reporta como IAToolkitException LLM_ERROR."""
+        async def slow_create(**kwargs):
+            await asyncio.sleep(1)
+
+        async_client = MagicMock()
+        async_client.responses.create = slow_create
+        adapter = OpenAIAdapter(openai_client=self.mock_openai_client, async_client=async_client)
+
+        with pytest.raises(IAToolkitException) as excinfo:
+            asyncio.run(adapter.acreate_response(model='gpt-4', input=[], request_timeout=0.01))
+
+        assert excinfo.value.error_type == IAToolkitException.ErrorType.LLM_ERROR
+        assert "TimeoutError" in str(excinfo.value)
+
+    def test_create_response_applies_timeout_and_retries_per_call(self):
+        """request_timeout y max_retries se aplican con with_options sin tocar el cliente base."""
+        per_call_client = MagicMock()
+        per_call_client.responses.create.return_value.output = []
+        self.mock_openai_client.with_options.return_value = per_call_client
+
+        self.adapter.create_response(model='gpt-4', input=[], request_timeout=30, max_retries=1)
+
+        self.mock_openai_client.with_options.assert_called_once_with(timeout=30, max_retries=1)
+        per_call_client.responses.create.assert_called_once()
+        self.mock_openai_client.responses.create.assert_not_called()
+
+    def test_create_response_served_from_cache_for_identical_request(self):
+        """Con response_cache, una segunda llamada idéntica no llama a la API."""
+        mock_response = MagicMock()
+        mock_response.id = 'resp-cached'
+        mock_response.model = 'gpt-4'
+        mock_response.status = 'completed'
+        mock_response.output_text = 'cached'
+        mock_response.output = []
+        mock_response.usage.input_tokens = 1
+        mock_response.usage.output_tokens = 1
+        mock_response.usage.total_tokens = 2
+        self.mock_openai_client.responses.create.return_value = mock_response
+        adapter = OpenAIAdapter(openai_client=self.mock_openai_client,
+                                response_cache=InMemoryLLMResponseCache())
+        input_data = [{'role': 'user', 'content': 'Hello'}]
+
+        first = adapter.create_response(model='gpt-4', input=input_data)
+        second = adapter.create_response(model='gpt-4', input=input_data)
+        adapter.create_response(model='gpt-4', input=input_data, previous_response_id='resp-0')
+
+        assert second == first
+        assert self.mock_openai_client.responses.create.call_count == 2
+        assert adapter.response_cache.stats == {"hits": 1, "misses": 1}
+
+    def test_response_cache_is_not_shared_across_scopes(self):
+        """Otra API key no recibe un response id creado con la primera, aunque el cache sea compartido."""
+        mock_response = MagicMock()
+        mock_response.id = 'resp-key-a'
+        mock_response.model = 'gpt-4'
+        mock_response.status = 'completed'
+        mock_response.output_text = 'hola'
+        mock_response.output = []
+        mock_response.usage.input_tokens = 1
+        mock_response.usage.output_tokens = 1
+        mock_response.usage.total_tokens = 2
+        self.mock_openai_client.responses.create.return_value = mock_response
+        shared_cache = InMemoryLLMResponseCache()
+        adapter_a = OpenAIAdapter(openai_client=self.mock_openai_client,
+                                  response_cache=shared_cache, response_cache_scope="scope-a")
+        adapter_b = OpenAIAdapter(openai_client=self.mock_openai_client,
+                                  response_cache=shared_cache, response_cache_scope="scope-b")
+        input_data = [{'role': 'user', 'content': 'Hello'}]
+
+        adapter_a.create_response(model='gpt-4', input=input_data)
+        adapter_b.create_response(model='gpt-4', input=input_data)
+
+        assert self.mock_openai_client.responses.create.call_count == 2
+        assert shared_cache.stats == {"hits": 0, "misses": 2}
+
+    def test_semantic_cache_embeds_only_when_a_paraphrase_can_hit(self):
+        """El primer turno no paga la consulta al cache; una paráfrasis posterior se responde desde él."""
+        mock_response = MagicMock()
+        mock_response.id = 'resp-1'
+        mock_response.model = 'gpt-4'
+        mock_response.status = 'completed'
+        mock_response.output_text = 'hola'
+        mock_response.output = []
+        mock_response.usage.input_tokens = 1
+        mock_response.usage.output_tokens = 1
+        mock_response.usage.total_tokens = 2
+        self.mock_openai_client.responses.create.return_value = mock_response
+        vectors = {"hola": [1.0, 0.0], "hola!": [0.99, 0.05]}
+        self.mock_openai_client.embeddings.create.side_effect = lambda model, input: MagicMock(
+            data=[MagicMock(embedding=vectors[input])]
+        )
+        semantic_cache = SemanticLLMResponseCache(self.mock_openai_client)
+        adapter = OpenAIAdapter(openai_client=self.mock_openai_client, semantic_cache=semantic_cache)
+        tools = [{"type": "function", "name": "f"}]
+
+        first = adapter.create_response(model='gpt-4', input=[{'role': 'user', 'content': 'hola'}], tools=list(tools))
+        second = adapter.create_response(model='gpt-4', input=[{'role': 'user', 'content': 'hola!'}], tools=list(tools))
+
+        assert second == first
+        assert self.mock_openai_client.responses.create.call_count == 1
+        # one embedding to store the first answer, one to look up the paraphrase
+        assert self.mock_openai_client.embeddings.create.call_count == 2
+        assert semantic_cache.stats == {"hits": 1, "misses": 0}
+
+    def test_map_response_reports_cached_input_tokens(self):
+        """cached_tokens de input_tokens_details se expone en Usage.cached_input_tokens."""
+        mock_response = MagicMock()
+        mock_response.output = []
+        mock_response.output_text = 'ok'
+        mock_response.usage.input_tokens = 1200
+        mock_response.usage.output_tokens = 10
+        mock_response.usage.total_tokens = 1210
+        mock_response.usage.input_tokens_details.cached_tokens = 1024
+
+        result = self.adapter._map_openai_response(mock_response)
+
+        assert result.usage.cached_input_tokens == 1024
+        assert result.usage.input_tokens == 1200
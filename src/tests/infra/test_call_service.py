@@ -4,7 +4,11 @@
 # IAToolkit is open source software.
 
 import pytest
+from email.message import Message
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
+import requests
+from requests.cookies import extract_cookies_to_jar
 from iatoolkit.infra.call_service import CallServiceClient
 from requests import RequestException
 from iatoolkit.common.exceptions import IAToolkitException
@@ -19,19 +23,18 @@ class TestCallServiceClient:
         self.mock_response.json.return_value = {'result': 'ok'}
         self.mock_response.status_code = 200
 
-        # Patch 'requests' methods
-        self.get_patcher = patch('iatoolkit.infra.call_service.requests.get', return_value=self.mock_response)
-        self.post_patcher = patch('iatoolkit.infra.call_service.requests.post', return_value=self.mock_response)
-        self.put_patcher = patch('iatoolkit.infra.call_service.requests.put', return_value=self.mock_response)
-        self.patch_patcher = patch('iatoolkit.infra.call_service.requests.patch', return_value=self.mock_response)
-        self.delete_patcher = patch('iatoolkit.infra.call_service.requests.delete', return_value=self.mock_response)
+        # Patch the shared session methods
+        self.mock_session = MagicMock()
+        for method in ('get', 'post', 'put', 'patch', 'delete'):
+            getattr(self.mock_session, method).return_value = self.mock_response
+        self.session_patcher = patch.object(CallServiceClient, '_get_session', return_value=self.mock_session)
+        self.session_patcher.start()
 
-        # Start patching
-        self.mock_get = self.get_patcher.start()
-        self.mock_post = self.post_patcher.start()
-        self.mock_put = self.put_patcher.start()
-        self.mock_patch = self.patch_patcher.start()
-        self.mock_delete = self.delete_patcher.start()
+        self.mock_get = self.mock_session.get
+        self.mock_post = self.mock_session.post
+        self.mock_put = self.mock_session.put
+        self.mock_patch = self.mock_session.patch
+        self.mock_delete = self.mock_session.delete
 
     def teardown_method(self):
         patch.stopall()
@@ -92,3 +95,37 @@ class TestCallServiceClient:
         assert status == 200
         assert response == {'result': 'ok'}
 
+
+    def test_session_is_shared_and_pooled(self):
+        self.session_patcher.stop()
+        CallServiceClient._session = None
+        try:
+            session = CallServiceClient()._get_session()
+
+            assert CallServiceClient()._get_session() is session
+            adapter = session.get_adapter("https://hf.endpoint/predict")
+            assert adapter._pool_maxsize == CallServiceClient.POOL_MAXSIZE
+            assert "POST" not in adapter.max_retries.allowed_methods
+        finally:
+            CallServiceClient._session = None
+            self.session_patcher.start()
+
+    def test_shared_session_does_not_keep_cookies_between_calls(self):
+        self.session_patcher.stop()
+        CallServiceClient._session = None
+        try:
+            session = CallServiceClient()._get_session()
+            request = session.prepare_request(requests.Request('GET', 'https://tools.acme.test/a'))
+            headers = Message()
+            headers['Set-Cookie'] = 'sid=tenant-a; Path=/'
+
+            # same extraction Session.send does with each response
+            extract_cookies_to_jar(session.cookies, request,
+                                   SimpleNamespace(_original_response=SimpleNamespace(msg=headers)))
+            next_request = session.prepare_request(requests.Request('GET', 'https://tools.acme.test/b'))
+
+            assert len(session.cookies) == 0
+            assert 'Cookie' not in next_request.headers
+        finally:
+            CallServiceClient._session = None
+            self.session_patcher.start()
@@ -60,10 +60,12 @@ class TestLLMProxy:
 
         # Aseguramos que el cache global esté limpio para cada test
         LLMProxy._clients_cache.clear()
+        LLMProxy._semantic_caches.clear()
 
     def teardown_method(self):
         patch.stopall()
         LLMProxy._clients_cache.clear()
+        LLMProxy._semantic_caches.clear()
 
     def test_create_response_raises_if_no_api_key_configured(self):
         """
@@ -99,6 +101,59 @@ class TestLLMProxy:
         self.mock_openai_class.assert_called_once_with(api_key="val")
         assert client1 is client2
 
+    def test_create_response_passes_llm_request_options_to_openai(self):
+        """llm.request_timeout y llm.max_retries llegan al adaptador OpenAI por llamada."""
+        self.model_registry_mock.get_provider.return_value = "openai"
+        self.config_service_mock.get_configuration.return_value = {
+            "api-key": "LLM_KEY", "request_timeout": 45, "max_retries": 1,
+        }
+
+        with patch.dict(os.environ, {"LLM_KEY": "dummy"}, clear=True):
+            self.proxy.create_response(
+                company_short_name=self.company_short_name,
+                model="gpt-4",
+                input=[],
+            )
+
+        call_kwargs = self.mock_openai_adapter_instance.create_response.call_args.kwargs
+        assert call_kwargs["request_timeout"] == 45.0
+        assert call_kwargs["max_retries"] == 1
+
+    def test_openai_adapter_gets_rate_limiter_from_llm_config(self):
+        """llm.rate_limit crea un RateLimiter compartido por proveedor + api key."""
+        self.config_service_mock.get_configuration.return_value = {
+            "api-key": "LLM_KEY", "rate_limit": {"requests_per_min": 500, "tokens_per_min": 30000},
+        }
+
+        with patch.dict(os.environ, {"LLM_KEY": "dummy"}, clear=True), \
+                patch('iatoolkit.infra.rate_limiter.warm_encoding'):
+            self.proxy._get_or_create_adapter(LLMProxy.PROVIDER_OPENAI, self.company_short_name)
+
+        rate_limiter = self.mock_openai_adapter_class.call_args.kwargs["rate_limiter"]
+        assert rate_limiter.requests_per_min == 500.0
+        assert rate_limiter.tokens_per_min == 30000.0
+
+    def test_semantic_cache_is_shared_across_proxy_instances(self):
+        """El cache semántico vive a nivel de proceso: otro LLMProxy (otro request) usa el mismo."""
+        self.config_service_mock.get_configuration.return_value = {"api-key": "LLM_KEY"}
+        other_proxy = LLMProxy(
+            util=self.util_mock,
+            configuration_service=self.config_service_mock,
+            model_registry=self.model_registry_mock,
+            secret_provider=self.secret_provider_mock,
+        )
+
+        with patch.dict(os.environ, {"LLM_KEY": "dummy", "LLM_SEMANTIC_CACHE": "true"}, clear=True):
+            self.proxy._get_or_create_adapter(LLMProxy.PROVIDER_OPENAI, self.company_short_name)
+            other_proxy._get_or_create_adapter(LLMProxy.PROVIDER_OPENAI, self.company_short_name)
+
+        first, second = [c.kwargs["semantic_cache"] for c in self.mock_openai_adapter_class.call_args_list]
+        assert first is not None
+        assert first is second
+
+        LLMProxy.clear_low_level_clients_cache()
+        assert LLMProxy._semantic_caches == {}
+
     def test_routing_to_correct_adapter(self):
         """create_response debe rutear al adaptador correcto según el modelo."""
 
@@ -207,6 +262,12 @@ class TestLLMProxy:
         assert third is adapter_a
         assert self.mock_openai_adapter_class.call_count == 2
 
+        # cached response ids belong to one API key: the exact cache is scoped per key too
+        scope_a, scope_b = [c.kwargs["response_cache_scope"]
+                            for c in self.mock_openai_adapter_class.call_args_list]
+        assert scope_a != scope_b
+        assert "sk-a" not in scope_a
+
     def test_clear_runtime_cache_clears_adapter_and_client_caches(self):
         self.proxy.adapters = {(LLMProxy.PROVIDER_OPENAI, "key"): MagicMock()}
         LLMProxy._clients_cache[(LLMProxy.PROVIDER_OPENAI, "key")] = MagicMock()
@@ -0,0 +1,126 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from iatoolkit.infra.llm_response import LLMResponse, ToolCall, Usage
+from iatoolkit.infra.llm_response_cache import (
+    InMemoryLLMResponseCache,
+    RedisLLMResponseCache,
+    SemanticLLMResponseCache,
+    make_cache_key,
+    response_to_dict,
+)
+
+
+def _response(response_id="resp-1"):
+    return LLMResponse(
+        id=response_id,
+        model="gpt-4",
+        status="completed",
+        output_text="hola",
+        output=[ToolCall(call_id="c1", type="function_call", name="f", arguments="{}")],
+        usage=Usage(input_tokens=1, output_tokens=2, total_tokens=3),
+    )
+
+
+class TestLLMResponseCache:
+
+    def test_make_cache_key_ignores_key_order(self):
+        assert make_cache_key({"model": "gpt-4", "input": [1]}) == make_cache_key({"input": [1], "model": "gpt-4"})
+        assert make_cache_key({"model": "gpt-4"}) != make_cache_key({"model": "gpt-5"})
+
+    def test_in_memory_round_trip_and_stats(self):
+        cache = InMemoryLLMResponseCache(max_entries=2)
+
+        assert cache.get("k1") is None
+        cache.set("k1", _response())
+        cached = cache.get("k1")
+
+        assert cached == _response()
+        assert isinstance(cached.output[0], ToolCall)
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    def test_in_memory_evicts_least_recently_used(self):
+        cache = InMemoryLLMResponseCache(max_entries=2)
+        cache.set("a", _response("a"))
+        cache.set("b", _response("b"))
+        cache.get("a")
+        cache.set("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").id == "a"
+        assert cache.get("c").id == "c"
+
+    def test_in_memory_entries_expire_after_ttl(self):
+        cache = InMemoryLLMResponseCache(ttl=60)
+        with patch("iatoolkit.infra.llm_response_cache.time.monotonic", return_value=1000.0):
+            cache.set("default", _response("default"))
+            cache.set("short", _response("short"), ttl=10)
+
+        with patch("iatoolkit.infra.llm_response_cache.time.monotonic", return_value=1011.0):
+            assert cache.get("short") is None
+            assert cache.get("default").id == "default"
+
+        with patch("iatoolkit.infra.llm_response_cache.time.monotonic", return_value=1060.0):
+            assert cache.get("default") is None
+
+    def test_redis_backend_stores_json_with_ttl(self):
+        cache = RedisLLMResponseCache(ttl=60)
+        with patch("iatoolkit.infra.llm_response_cache.RedisSessionManager") as mock_redis:
+            cache.set("k1", _response())
+            mock_redis.set.assert_called_once_with(
+                "llm_response_cache:k1", json.dumps(response_to_dict(_response())), ex=60
+            )
+
+            mock_redis.get.return_value = json.dumps(response_to_dict(_response()))
+            assert cache.get("k1") == _response()
+
+    def test_redis_errors_are_treated_as_misses(self):
+        cache = RedisLLMResponseCache()
+        with patch("iatoolkit.infra.llm_response_cache.RedisSessionManager") as mock_redis:
+            mock_redis.get.side_effect = ConnectionError("down")
+            assert cache.get("k1") is None
+            assert cache.stats["misses"] == 1
+
+
+class TestSemanticLLMResponseCache:
+
+    def _embed_client(self, vectors_by_text):
+        client = MagicMock()
+        client.embeddings.create.side_effect = lambda model, input: MagicMock(
+            data=[MagicMock(embedding=vectors_by_text[input])]
+        )
+        return client
+
+    def test_paraphrase_above_threshold_hits_within_same_scope(self):
+        cache = SemanticLLMResponseCache(self._embed_client({
+            "hola": [1.0, 0.0], "hola!": [0.99, 0.05], "chao": [0.0, 1.0],
+        }))
+        params = {"model": "gpt-4", "input": [{"role": "user", "content": "hola"}]}
+        scope, text = cache.split_input(params)
+        cache.store(scope, cache.embed(text), _response())
+
+        assert cache.lookup(scope, cache.embed("hola!")) == _response()
+        assert cache.lookup(scope, cache.embed("chao")) is None
+        other_scope, _ = cache.split_input({"model": "gpt-5", "input": params["input"]})
+        assert cache.lookup(other_scope, cache.embed("hola")) is None
+        assert cache.stats == {"hits": 1, "misses": 2}
+
+    def test_entries_expire_by_ttl_and_scopes_are_bounded(self):
+        cache = SemanticLLMResponseCache(self._embed_client({"hola": [1.0, 0.0]}), ttl=60, max_scopes=2)
+        vector = cache.embed("hola")
+        with patch("iatoolkit.infra.llm_response_cache.time.monotonic", return_value=1000.0):
+            cache.store("scope-a", vector, _response("a"))
+            cache.store("scope-b", vector, _response("b"))
+            cache.lookup("scope-a", vector)
+            cache.store("scope-c", vector, _response("c"))
+
+            assert not cache.has_entries("scope-b")
+            assert cache.lookup("scope-a", vector).id == "a"
+
+        with patch("iatoolkit.infra.llm_response_cache.time.monotonic", return_value=1061.0):
+            assert not cache.has_entries("scope-a")
+            assert cache.lookup("scope-c", vector) is None
+
+    def test_split_input_skips_multimodal_content(self):
+        params = {"model": "gpt-4", "input": [{"role": "user", "content": [{"type": "input_text"}]}]}
+        assert SemanticLLMResponseCache.split_input(params) == ("", "")
@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from iatoolkit.infra import rate_limiter
+from iatoolkit.infra.rate_limiter import RateLimiter, estimate_tokens, get_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def clear_module_state():
+    # limiters and encodings are process-wide; keep them from leaking between tests
+    yield
+    rate_limiter._limiters.clear()
+    rate_limiter._encodings.clear()
+    rate_limiter._encodings_loading.clear()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRateLimiter:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.time_patcher = patch("iatoolkit.infra.rate_limiter.time.monotonic", self.clock.monotonic)
+        self.sleep_patcher = patch("iatoolkit.infra.rate_limiter.asyncio.sleep", self.clock.sleep)
+        self.time_patcher.start()
+        self.sleep_patcher.start()
+
+    def teardown_method(self):
+        self.time_patcher.stop()
+        self.sleep_patcher.stop()
+
+    def test_consumes_budget_then_reports_wait_for_the_scarcest_limit(self):
+        limiter = RateLimiter(requests_per_min=2, tokens_per_min=100)
+
+        assert limiter._try_consume(40) == 0
+        assert limiter._try_consume(40) == 0
+        # no requests left (30s to refill one) and 20 tokens left (12s to refill 40)
+        assert limiter._try_consume(40) == 30.0
+
+    def test_acquire_sleeps_until_budget_refills(self):
+        limiter = RateLimiter(tokens_per_min=60)
+
+        async def run():
+            await limiter.acquire(60)
+            await limiter.acquire(30)
+
+        asyncio.run(run())
+
+        assert self.clock.now == 1030.0
+
+    def test_request_larger_than_bucket_waits_for_full_bucket(self):
+        limiter = RateLimiter(tokens_per_min=60)
+        limiter._try_consume(60)
+
+        asyncio.run(limiter.acquire(500))
+
+        assert self.clock.now == 1060.0
+
+    def test_get_rate_limiter_is_shared_per_scope_and_optional(self):
+        config = {"requests_per_min": 500, "tokens_per_min": 30000}
+
+        with patch.object(rate_limiter, "warm_encoding") as warm_encoding:
+            limiter = get_rate_limiter(("openai", "key-1"), config)
+        warm_encoding.assert_called_once_with(rate_limiter.DEFAULT_ENCODING_MODEL)
+
+        assert limiter is get_rate_limiter(("openai", "key-1"), dict(config))
+        assert limiter is not get_rate_limiter(("openai", "key-2"), config)
+        assert limiter.tokens_per_min == 30000.0
+        assert get_rate_limiter(("openai", "key-1"), {}) is None
+        assert get_rate_limiter(("openai", "key-1"), None) is None
+
+
+class TestEstimateTokens:
+
+    def test_uses_tiktoken_encoding(self):
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2, 3]
+        with patch.object(rate_limiter, "_get_encoding", return_value=encoding) as get_encoding:
+            assert estimate_tokens("hola mundo", "gpt-4o-mini") == 3
+        get_encoding.assert_called_once_with("gpt-4o-mini")
+
+    def test_falls_back_to_length_estimate_without_encoding(self):
+        with patch.object(rate_limiter, "_get_encoding", return_value=None):
+            assert estimate_tokens([{"role": "user", "content": "x" * 100}]) > 25
+
+    def test_encoding_loads_in_background_and_length_estimate_is_used_meanwhile(self):
+        threads = []
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2]
+
+        with patch.object(rate_limiter.threading, "Thread",
+                          side_effect=lambda **kwargs: threads.append(kwargs) or MagicMock()), \
+                patch.object(rate_limiter.tiktoken, "encoding_for_model", return_value=encoding) as load:
+            assert estimate_tokens("x" * 40, "gpt-4o") == 11
+            assert estimate_tokens("x" * 40, "gpt-4o") == 11
+            load.assert_not_called()
+
+            assert len(threads) == 1
+            threads[0]["target"](*threads[0]["args"])
+
+            assert estimate_tokens("x" * 40, "gpt-4o") == 2
+        load.assert_called_once_with("gpt-4o")
@@ -50,10 +50,49 @@ class TestDatabaseManager:
         """Verify that DatabaseManager implements DatabaseProvider"""
         assert isinstance(self.db_manager, DatabaseProvider)
 
+    def test_engine_uses_sized_compiled_query_cache(self):
+        self.mock_create_engine.assert_called_once_with(
+            self.database_url, echo=False, query_cache_size=DatabaseManager.QUERY_CACHE_SIZE
+        )
+
     def test_get_session_returns_scoped_session(self):
         session = self.db_manager.get_session()
         assert session == self.mock_scoped_session
 
+    def test_get_database_structure_uses_batch_reflection(self):
+        inspector_mock = self.mock_inspect.return_value
+        inspector_mock.get_table_names.return_value = ['users', 'orders']
+        inspector_mock.get_multi_columns.return_value = {
+            ('public', 'users'): [{'name': 'id', 'type': 'INTEGER', 'nullable': False},
+                                  {'name': 'name', 'type': 'VARCHAR', 'nullable': True}],
+            ('public', 'orders'): [{'name': 'id', 'type': 'INTEGER', 'nullable': False}],
+        }
+        inspector_mock.get_multi_pk_constraint.return_value = {
+            ('public', 'users'): {'constrained_columns': ['id']},
+            ('public', 'orders'): {'constrained_columns': ['id']},
+        }
+
+        structure = self.db_manager.get_database_structure()
+
+        assert [c['name'] for c in structure['users']['columns']] == ['id', 'name']
+        assert structure['users']['columns'][0]['pk'] is True
+        assert structure['users']['columns'][1]['pk'] is False
+        assert structure['orders']['columns'][0]['pk'] is True
+        inspector_mock.get_columns.assert_not_called()
+        inspector_mock.get_pk_constraint.assert_not_called()
+
+    def test_get_database_structure_falls_back_to_per_table_reflection(self):
+        inspector_mock = self.mock_inspect.return_value
+        inspector_mock.get_table_names.return_value = ['users']
+        inspector_mock.get_multi_columns.side_effect = NotImplementedError()
+        inspector_mock.get_columns.return_value = [{'name': 'id', 'type': 'INTEGER', 'nullable': False}]
+        inspector_mock.get_pk_constraint.return_value = {'constrained_columns': ['id']}
+
+        structure = self.db_manager.get_database_structure()
+
+        assert structure['users']['columns'][0]['pk'] is True
+        inspector_mock.get_columns.assert_called_once_with('users', schema='public')
+
     def test_create_all_calls_metadata_create_all(self):
         self.db_manager.create_all()
         assert self.mock_base_metadata.create_all.call_count == 1
@@ -79,7 +118,7 @@ class TestDatabaseManager:
         mock_result = mock_session.execute.return_value
         mock_result.returns_rows = True
         mock_result.keys.return_value = ['id', 'val']
-        mock_result.fetchall.return_value = [(1, 'a'), (2, 'b')]
+        mock_result.fetchmany.side_effect = [[(1, 'a')], [(2, 'b')], []]
 
         # Act
         result = self.db_manager.execute_query(query="SELECT * FROM t")
@@ -87,6 +126,8 @@ class TestDatabaseManager:
         # Assert
         assert result == [{'id': 1, 'val': 'a'}, {'id': 2, 'val': 'b'}]
         assert mock_session.execute.call_count >= 1
+        mock_result.fetchmany.assert_called_with(DatabaseManager.FETCH_BATCH_SIZE)
+        mock_result.fetchall.assert_not_called()
 
     def test_execute_query_no_rows_returns_rowcount(self):
         """
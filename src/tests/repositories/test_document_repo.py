@@ -55,23 +55,23 @@ class TestDocumentRepo:
         result = self.repo.get_by_id(0)
 
         assert result is None
-        self.session.query.assert_not_called()
+        self.session.get.assert_not_called()
 
     def test_get_by_id_when_document_not_found(self):
-        self.session.query.return_value.filter_by.return_value.first.return_value = None
+        self.session.get.return_value = None
 
         result = self.repo.get_by_id(999)
 
         assert result is None
-        self.session.query.assert_called()
+        self.session.get.assert_called_once_with(Document, 999)
 
     def test_get_by_id_when_document_exists(self):
-        self.session.query.return_value.filter_by.return_value.first.return_value = self.mock_document
+        self.session.get.return_value = self.mock_document
 
         result = self.repo.get_by_id(1)
 
         assert result == self.mock_document
-        self.session.query.assert_called()
+        self.session.get.assert_called_once_with(Document, 1)
 
     def test_get_by_hash_scopes_by_collection(self):
         self.session.query.return_value.filter_by.return_value.first.return_value = self.mock_document
@@ -94,6 +94,22 @@ class TestFileSystemAssetRepository:
         assert len(yaml_files) == 1
         assert "valid.yaml" in yaml_files
 
+    def test_read_many_reads_matching_files_in_one_scan(self, tmp_path, monkeypatch):
+        # Arrange: companies/test_company/context with two markdown files, a text file and a subfolder
+        monkeypatch.chdir(tmp_path)
+        context_dir = tmp_path / "companies" / self.company_short_name / "context"
+        (context_dir / "nested.md").mkdir(parents=True)
+        (context_dir / "intro.md").write_text("INTRO", encoding="utf-8")
+        (context_dir / "faq.md").write_text("FAQ", encoding="utf-8")
+        (context_dir / "notes.txt").write_text("NOTES", encoding="utf-8")
+
+        # Act
+        result = self.repo.read_many(self.company_short_name, AssetType.CONTEXT, extension=".md")
+
+        # Assert
+        assert result == {"intro.md": "INTRO", "faq.md": "FAQ"}
+        assert self.repo.read_many(self.company_short_name, AssetType.SCHEMA) == {}
+
     @patch('pathlib.Path.exists')
     def test_list_files_returns_empty_if_dir_missing(self, mock_exists):
         # Arrange
@@ -189,6 +189,24 @@ class TestLLMQueryRepo:
         assert updated.id == created.id
         assert updated.execution_config["request"]["timeout_ms"] == 15000
 
+    def test_create_or_update_system_tools_creates_and_updates_in_one_commit(self):
+        existing = Tool(name="sys_a", tool_type=Tool.TYPE_SYSTEM, description="old", parameters={})
+        self.session.add(existing)
+        self.session.commit()
+
+        result = self.repo.create_or_update_system_tools([
+            Tool(name="sys_a", tool_type=Tool.TYPE_SYSTEM, description="new",
+                 parameters={"type": "object"}, source=Tool.SOURCE_SYSTEM, is_active=True),
+            Tool(name="sys_b", tool_type=Tool.TYPE_SYSTEM, description="b",
+                 parameters={}, source=Tool.SOURCE_SYSTEM, is_active=True),
+        ])
+
+        assert [tool.name for tool in result] == ["sys_a", "sys_b"]
+        assert result[0].id == existing.id
+        assert result[0].description == "new"
+        assert result[0].parameters == {"type": "object"}
+        assert self.session.query(Tool).filter_by(tool_type=Tool.TYPE_SYSTEM).count() == 2
+
     def test_delete_system_tools(self):
         """Test deleting only system tools."""
         t1 = Tool(name="s1", tool_type=Tool.TYPE_SYSTEM, description="s", parameters={})
@@ -255,6 +273,36 @@ class TestLLMQueryRepo:
         assert result.prompt_type == PromptType.AGENT.value
         assert result.custom_fields == [{'key': 'val'}]
 
+    def test_upsert_prompts_updates_existing_and_adds_new_without_commit(self):
+        existing = Prompt(name="p_existing", company_id=self.company.id, description="Old", filename="old.prompt")
+        self.session.add(existing)
+        self.session.commit()
+
+        result = self.repo.upsert_prompts(self.company.id, [
+            Prompt(name="p_existing", company_id=self.company.id, description="New", filename="p.prompt"),
+            Prompt(name="p_new", company_id=self.company.id, description="Fresh", filename="n.prompt"),
+        ])
+
+        assert result[0] is existing
+        assert existing.description == "New"
+        assert result[1].attachment_mode == "extracted_only"
+        self.session.rollback()
+        assert self.session.query(Prompt).filter_by(name="p_new").first() is None
+
+    def test_upsert_prompt_categories_assigns_ids_and_keeps_existing(self):
+        cat = PromptCategory(name="Existing", order=1, company_id=self.company.id)
+        self.session.add(cat)
+        self.session.commit()
+
+        result = self.repo.upsert_prompt_categories(self.company.id, [
+            PromptCategory(name="Existing", order=5, company_id=self.company.id),
+            PromptCategory(name="New", order=6, company_id=self.company.id),
+        ])
+
+        assert result["Existing"] is cat
+        assert cat.order == 5
+        assert result["New"].id is not None
+
     def test_create_prompt_category(self):
         """Test creating a new prompt category."""
         new_category = PromptCategory(name="Cat1", order=1, company_id=self.company.id)
@@ -8,8 +8,9 @@ from iatoolkit.repositories.models import (User, Company, UserFeedback,
                                            user_company, AccessLog)
 from iatoolkit.repositories.profile_repo import ProfileRepo
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from sqlalchemy.exc import OperationalError
+from flask import Flask
 
 
 class TestProfileRepo:
@@ -289,3 +290,34 @@ class TestProfileRepo:
         assert result == expected_company
         assert query_chain.first.call_count == 2
         mock_db_manager.remove_session.assert_called_once()
+
+    def test_get_company_by_short_name_is_memoized_per_request(self):
+        self.session.add(self.company)
+        self.session.commit()
+        app = Flask(__name__)
+
+        with patch.object(self.repo, '_query_company_by_short_name',
+                          wraps=self.repo._query_company_by_short_name) as query:
+            with app.test_request_context('/'):
+                assert self.repo.get_company_by_short_name('open') == self.company
+                assert self.repo.get_company_by_short_name('open') == self.company
+                assert self.repo.get_company_by_short_name('missing') is None
+                assert self.repo.get_company_by_short_name('missing') is None
+            assert query.call_count == 3
+
+            with app.test_request_context('/'):
+                self.repo.get_company_by_short_name('open')
+            assert query.call_count == 4
+
+    def test_memoized_company_is_looked_up_again_after_session_close(self):
+        self.session.add(self.company)
+        self.session.commit()
+        app = Flask(__name__)
+
+        with app.test_request_context('/'):
+            first = self.repo.get_company_by_short_name('open')
+            self.session.close()
+            second = self.repo.get_company_by_short_name('open')
+
+        assert second in self.session
+        assert second.id == first.id
@@ -0,0 +1,42 @@
+# Copyright (c) 2024 Fernando Libedinsky
+# Product: IAToolkit
+#
+# IAToolkit is open source software.
+
+from unittest.mock import patch
+
+from iatoolkit.repositories.database_manager import DatabaseManager
+from iatoolkit.repositories.models import Company, SqlSource
+from iatoolkit.repositories.sql_source_repo import SqlSourceRepo
+
+
+class TestSqlSourceRepo:
+    def setup_method(self):
+        self.db_manager = DatabaseManager('sqlite:///:memory:')
+        self.db_manager.create_all()
+        self.session = self.db_manager.get_session()
+        self.repo = SqlSourceRepo(self.db_manager)
+
+        self.company = Company(name='Acme', short_name='acme')
+        self.session.add(self.company)
+        self.session.commit()
+
+    def _source(self, database: str) -> SqlSource:
+        return SqlSource(company_id=self.company.id,
+                         database=database,
+                         connection_type=SqlSource.CONNECTION_DIRECT,
+                         connection_string_env='DB_URI',
+                         source=SqlSource.SOURCE_YAML)
+
+    def test_save_all_upserts_and_deletes_in_one_commit(self):
+        keep = self.repo.create_or_update(self._source('keep'))
+        remove = self.repo.create_or_update(self._source('remove'))
+        keep.description = 'updated'
+
+        with patch.object(self.session, 'commit', wraps=self.session.commit) as commit:
+            persisted = self.repo.save_all([keep, self._source('new')], [remove])
+
+        assert commit.call_count == 1
+        assert [s.database for s in persisted] == ['keep', 'new']
+        rows = self.repo.list_by_company(self.company.id, active_only=False)
+        assert [(s.database, s.description) for s in rows] == [('keep', 'updated'), ('new', None)]
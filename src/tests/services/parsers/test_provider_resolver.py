@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from iatoolkit.services.parsers.contracts import ParseRequest
 from iatoolkit.services.parsers.provider_resolver import ParsingProviderResolver
@@ -130,3 +130,45 @@ class TestParsingProviderResolver:
 
         self.mock_factory.get_provider.assert_called_with("basic")
         assert result == mock_basic
+
+    def test_collection_provider_is_cached_until_clear_cache(self):
+        self.mock_config_service.get_configuration.return_value = {}
+        self.mock_document_repo.get_collection_by_name.return_value = MagicMock(parser_provider="docling")
+        request = ParseRequest(
+            company_short_name="acme",
+            filename="a.pdf",
+            content=b"x",
+            collection_name="Invoices",
+        )
+
+        assert self.resolver.resolve_provider_name(request) == "docling"
+        assert self.resolver.resolve_provider_name(request) == "docling"
+        self.mock_document_repo.get_collection_by_name.assert_called_once_with("acme", "Invoices")
+
+        self.mock_document_repo.get_collection_by_name.return_value = MagicMock(parser_provider=None)
+        self.resolver.clear_cache()
+
+        assert self.resolver.resolve_provider_name(request) == "auto"
+        assert self.mock_document_repo.get_collection_by_name.call_count == 2
+
+    def test_collection_provider_expires_after_ttl(self):
+        self.mock_config_service.get_configuration.return_value = {}
+        self.mock_document_repo.get_collection_by_name.return_value = MagicMock(parser_provider="docling")
+        request = ParseRequest(
+            company_short_name="acme",
+            filename="a.pdf",
+            content=b"x",
+            collection_name="Invoices",
+        )
+
+        with patch("iatoolkit.services.parsers.provider_resolver.time.monotonic", return_value=1000.0):
+            assert self.resolver.resolve_provider_name(request) == "docling"
+
+        # changed by another worker, which cleared only its own cache
+        self.mock_document_repo.get_collection_by_name.return_value = MagicMock(parser_provider="basic")
+        ttl = ParsingProviderResolver.COLLECTION_PROVIDER_TTL
+
+        with patch("iatoolkit.services.parsers.provider_resolver.time.monotonic", return_value=1000.0 + ttl - 1):
+            assert self.resolver.resolve_provider_name(request) == "docling"
+        with patch("iatoolkit.services.parsers.provider_resolver.time.monotonic", return_value=1000.0 + ttl):
+            assert self.resolver.resolve_provider_name(request) == "basic"
@@ -10,6 +10,7 @@ from iatoolkit.services.sql_service import SqlService
 from iatoolkit.common.util import Utility
 from iatoolkit.common.exceptions import IAToolkitException
 import textwrap
+import threading
 
 # --- Mock Data for different test scenarios ---
 
@@ -137,9 +138,7 @@ class TestCompanyContextService:
         self.mock_sql_source_service.list_sources.return_value = MOCK_SQL_SOURCES
 
         # Mock Markdown
-        # FIX: Update lambda signature to accept 'extension' kwarg
-        self.mock_asset_repo.list_files.side_effect = lambda c, t, extension=None: ['intro.md'] if t == AssetType.CONTEXT else []
-        self.mock_asset_repo.read_text.return_value = "MARKDOWN_CONTENT"
+        self.mock_asset_repo.read_many.return_value = {'intro.md': "MARKDOWN_CONTENT"}
 
         # Mock SQL Enriched Return
         self.context_service._get_sql_enriched_context = MagicMock(return_value=("SQL_CONTENT", ["users"]))
@@ -380,10 +379,7 @@ class TestCompanyContextService:
         """
         # Arrange
         # 1. Mock Markdown files
-        self.mock_asset_repo.list_files.side_effect = lambda company, asset_type, extension: \
-            ['info.md'] if asset_type == AssetType.CONTEXT else []
-
-        self.mock_asset_repo.read_text.return_value = "STATIC_INFO"
+        self.mock_asset_repo.read_many.return_value = {'info.md': "STATIC_INFO"}
 
         # 2. No SQL sources
         self.mock_sql_source_service.list_sources.return_value = []
@@ -395,8 +391,8 @@ class TestCompanyContextService:
         assert "STATIC_INFO" in full_context
 
         # Verify repository calls
-        self.mock_asset_repo.list_files.assert_any_call(self.COMPANY_NAME, AssetType.CONTEXT, extension='.md')
-        self.mock_asset_repo.read_text.assert_any_call(self.COMPANY_NAME, AssetType.CONTEXT, 'info.md')
+        self.mock_asset_repo.read_many.assert_called_once_with(self.COMPANY_NAME, AssetType.CONTEXT, extension='.md')
+        self.mock_asset_repo.read_text.assert_not_called()
 
         # Verify SQL service was NOT called
         self.mock_sql_service.get_database_structure.assert_not_called()
@@ -442,6 +438,40 @@ class TestCompanyContextService:
         self.mock_asset_repo.read_text.assert_called_with(self.COMPANY_NAME, AssetType.SCHEMA, 'orders.yaml')
         self.mock_utility.load_yaml_from_string.assert_called_with("yaml_content")
 
+    def test_yaml_schema_context_skips_tables_already_in_sql_context(self):
+        """Schema files of tables rendered in the SQL context are neither read nor repeated."""
+        self.mock_asset_repo.list_files.return_value = ['main_db-users.yaml', 'main_db-products.yaml', 'orders.yaml']
+        self.mock_asset_repo.read_text.side_effect = lambda company, asset_type, filename: filename
+        self.mock_utility.load_yaml_from_string.side_effect = lambda content: {content: {}}
+
+        result = self.context_service._get_yaml_schema_context(
+            self.COMPANY_NAME, [{'db_name': 'main_db', 'table_name': 'users'}])
+
+        read_files = [c.args[2] for c in self.mock_asset_repo.read_text.call_args_list]
+        assert read_files == ['main_db-products.yaml', 'orders.yaml']
+        assert "main_db-users.yaml" not in result
+
+    def test_schema_reads_stay_on_callers_thread_unless_repo_opts_in(self):
+        """Repositories may need the app context or the request's DB session, so threads are opt-in."""
+        read_threads = set()
+
+        def read_text(company, asset_type, filename):
+            read_threads.add(threading.get_ident())
+            return filename
+
+        self.mock_asset_repo.read_text.side_effect = read_text
+        filenames = ['a.yaml', 'b.yaml', 'c.yaml']
+
+        contents = self.context_service._read_assets(self.COMPANY_NAME, AssetType.SCHEMA, filenames)
+        assert contents == filenames
+        assert read_threads == {threading.get_ident()}
+
+        read_threads.clear()
+        self.mock_asset_repo.read_many_workers = 3
+        contents = self.context_service._read_assets(self.COMPANY_NAME, AssetType.SCHEMA, filenames)
+        assert contents == filenames
+        assert threading.get_ident() not in read_threads
+
     def test_gracefully_handles_repo_exceptions(self):
         """
         GIVEN the repository raises an exception when listing/reading
@@ -450,6 +480,7 @@ class TestCompanyContextService:
         """
         # Arrange
         self.mock_asset_repo.list_files.side_effect = Exception("Repo Down")
+        self.mock_asset_repo.read_many.side_effect = Exception("Repo Down")
         self.mock_sql_source_service.list_sources.return_value = []
 
         # Act
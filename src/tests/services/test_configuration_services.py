@@ -194,6 +194,28 @@ class TestConfigurationService:
             MOCK_VALID_CONFIG["data_sources"]["sql"],
         )
 
+    def test_reloading_configuration_reparses_only_changed_yaml(self):
+        """
+        GIVEN the configuration is reloaded several times
+        WHEN the YAML text is unchanged
+        THEN it is parsed once, and each caller gets its own copy of the config.
+        """
+        self.mock_asset_repo.exists.return_value = True
+        self.mock_asset_repo.read_text.return_value = "yaml v1"
+        self.mock_utility.load_yaml_from_string.return_value = {'id': 'acme', 'name': 'ACME Corp'}
+
+        first = self.service._load_and_merge_configs(self.COMPANY_NAME)
+        first['company'] = object()
+        second = self.service._load_and_merge_configs(self.COMPANY_NAME)
+
+        assert second == {'id': 'acme', 'name': 'ACME Corp'}
+        assert self.mock_utility.load_yaml_from_string.call_count == 1
+
+        self.mock_asset_repo.read_text.return_value = "yaml v2"
+        self.service._load_and_merge_configs(self.COMPANY_NAME)
+        self.mock_utility.load_yaml_from_string.assert_called_with("yaml v2")
+        assert self.mock_utility.load_yaml_from_string.call_count == 2
+
     def test_get_configuration_uses_cache_on_second_call(self):
         """
         GIVEN configuration loaded from files
@@ -1,3 +1,7 @@
+import io
+import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -33,6 +37,10 @@ class TestDoclingParsingProvider:
         assert provider.supports(request_pdf) is True
         assert provider.supports(request_png) is False
 
+    def test_supports_nothing_when_disabled(self, provider):
+        provider.enabled = False
+        assert provider.supports(MagicMock(filename="file.pdf")) is False
+
     def test_parse_raises_if_provider_is_marked_unavailable(self, mock_i18n):
         provider = DoclingParsingProvider(i18n_service=mock_i18n, config_service=MagicMock(spec=ConfigurationService))
         provider.enabled = False
@@ -76,6 +84,24 @@ class TestDoclingParsingProvider:
         assert result.metrics["detect_tables"] is False
         mock_converter.convert.assert_called_once_with("/tmp/test.pdf")
 
+    @patch("iatoolkit.services.parsers.providers.docling_provider.tempfile.NamedTemporaryFile")
+    def test_parse_text_only_skips_dict_export(self, mock_temp, provider):
+        mock_temp.return_value.__enter__.return_value = MagicMock(name="tmp")
+        mock_converter = MagicMock()
+        provider._converter_cache[(False, False)] = mock_converter
+        mock_doc = mock_converter.convert.return_value.document
+        mock_doc.export_to_markdown.return_value = "# Titulo\n\nTexto"
+
+        request = MagicMock(filename="test.pdf", content=b"fake_content",
+                            provider_config={"text_only": True, "detect_tables": True})
+        with patch.object(provider, "_should_enable_ocr", return_value=False):
+            result = provider.parse(request)
+
+        mock_doc.export_to_dict.assert_not_called()
+        assert [t.text for t in result.texts] == ["# Titulo\n\nTexto"]
+        assert result.tables == [] and result.images == []
+        assert result.metrics["text_only"] is True
+
     def test_extract_texts_skips_list_item_and_section_header(self, provider):
         doc_dict = {
             "body": [
@@ -132,6 +158,53 @@ class TestDoclingParsingProvider:
         assert images[0].meta.get("caption_text") == "Figura 3: Diagrama general"
         assert images[0].meta.get("caption_source") == "inferred"
 
+    def test_scan_doc_dict_collects_texts_and_captions_in_one_pass(self, provider):
+        doc_dict = {
+            "body": [
+                {"type": "section_header", "text": "Costos"},
+                {"type": "text", "text": "Detalle", "prov": [{"page_no": 1}]},
+                {"label": "Table_Caption", "text": "Tabla 1", "prov": [{"page_no": 1}]},
+            ]
+        }
+
+        texts, caption_entries = provider._scan_doc_dict(doc_dict)
+
+        assert [t.text for t in texts] == ["Detalle"]
+        assert texts[0].meta["section_title"] == "Costos"
+        assert [(e["text"], e["kind"], e["page"]) for e in caption_entries] == [("Tabla 1", "table", 1)]
+
+        # finders built from the shared entries do not consume each other's captions
+        with patch.object(provider, "_scan_doc_dict") as scan:
+            first = provider._build_caption_finder(doc_dict, caption_entries)
+            second = provider._build_caption_finder(doc_dict, caption_entries)
+        scan.assert_not_called()
+        assert first(kind="table", page_no=1, item_index=1) == "Tabla 1"
+        assert second(kind="table", page_no=1, item_index=1) == "Tabla 1"
+
+    def test_walk_items_keeps_document_order_on_deep_trees(self, provider):
+        doc_dict = {"a": {"id": 1, "children": [{"id": 2}, {"id": 3, "x": [{"id": 4}]}]}, "b": {"id": 5}}
+        assert [item.get("id") for item in provider._walk_items(doc_dict)] == [None, 1, 2, 3, 4, 5]
+
+        deep = node = {}
+        for _ in range(5000):
+            node["children"] = [{}]
+            node = node["children"][0]
+        assert sum(1 for _ in provider._walk_items(deep)) == 5001
+
+    def test_write_temp_file_streams_bytes_and_file_objects(self, provider, tmp_path, monkeypatch):
+        monkeypatch.setenv("DOCLING_TMP_DIR", str(tmp_path))
+        provider.COPY_CHUNK_SIZE = 4
+        content = b"%PDF-1.7 contenido"
+
+        from_bytes = provider._write_temp_file(content, suffix=".pdf")
+        from_stream = provider._write_temp_file(io.BytesIO(content), suffix=".pdf")
+
+        for path in (from_bytes, from_stream):
+            assert os.path.dirname(path) == str(tmp_path)
+            assert path.endswith(".pdf")
+            with open(path, "rb") as fh:
+                assert fh.read() == content
+
     def test_resolve_detect_tables_uses_provider_config(self, provider):
         request = MagicMock(provider_config={"detect_tables": True})
         assert provider._resolve_detect_tables(request) is True
@@ -141,6 +214,25 @@ class TestDoclingParsingProvider:
         with patch.object(provider, "_pdf_needs_ocr", return_value=True):
             assert provider._should_enable_ocr(request) is True
 
+    def test_concurrent_init_builds_one_converter_per_profile(self, provider):
+        pytest.importorskip("docling")
+
+        def slow_converter(**kwargs):
+            # widen the window in which a second thread could also build one
+            time.sleep(0.01)
+            return MagicMock()
+
+        with patch("docling.document_converter.DocumentConverter",
+                   side_effect=slow_converter) as mock_converter_cls:
+            threads = [threading.Thread(target=provider.init) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_converter_cls.call_count == 1
+        assert list(provider._converter_cache) == [(False, False)]
+
     def test_init_uses_rapidocr_with_onnxruntime_when_ocr_is_enabled(self, provider):
         pytest.importorskip("docling")
 
@@ -107,3 +107,34 @@ class TestFileProcessor:
 
         # Verificar las llamadas al logger (si es necesario)
         self.mock_connector.list_files.assert_called_once()
+
+    def test_process_files_with_workers_processes_all_files(self):
+        self.mock_config.max_workers = 4
+        self.mock_connector.list_files.return_value = [
+            {'path': f"/mock/directory/test_file{i}.txt", 'name': f'test_file{i}.txt'}
+            for i in range(6)
+        ] + [{'path': "/mock/directory/test_file.doc", 'name': 'test_file.doc'}]
+        self.mock_connector.get_file_content.side_effect = lambda path: path.encode()
+
+        self.processor.process_files()
+
+        assert self.processor.processed_files == 6
+        processed = sorted(call.kwargs['filename'] for call in self.mock_callback.call_args_list)
+        assert processed == [f'test_file{i}.txt' for i in range(6)]
+
+    def test_process_files_with_workers_stop_on_error(self):
+        self.mock_config.max_workers = 2
+        self.mock_config.continue_on_error = False
+        self.mock_connector.list_files.return_value = [
+            {'path': "/mock/directory/test_file1.txt", 'name': 'test_file1.txt'},
+            {'path': "/mock/directory/test_file2.txt", 'name': 'test_file2.txt'},
+        ]
+        self.mock_connector.get_file_content.side_effect = Exception("Mocked error")
+
+        with pytest.raises(Exception, match="Mocked error"):
+            self.processor.process_files()
+
+    def test_max_workers_is_sequential_unless_caller_asks(self):
+        with patch.dict('os.environ', {'IATOOLKIT_INGEST_WORKERS': '4'}):
+            assert FileProcessorConfig(filters={}, callback=MagicMock()).max_workers == 1
+        assert FileProcessorConfig(filters={}, callback=MagicMock(), max_workers=2).max_workers == 2
@@ -1,5 +1,10 @@
+import asyncio
+import base64
+import json
+import httpx
+import numpy as np
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from iatoolkit.services.configuration_service import ConfigurationService
 from iatoolkit.services.i18n_service import I18nService
@@ -117,3 +122,144 @@ class TestInferenceServiceConfigResolution:
                 tool_name="text_embeddings",
                 input_data={"mode": "text", "text": "hello"},
             )
+
+    def test_predict_decodes_float16_base64_embedding(self):
+        self.mock_config_service.get_configuration.return_value = {
+            "text_embeddings": {
+                "endpoint_url": "https://hf.endpoint",
+                "model_id": "sentence-transformers/all-MiniLM-L6-v2",
+                "model_parameters": {"embedding_encoding": "float16_base64"},
+            },
+        }
+        self.mock_secret_provider.get_secret.return_value = "token"
+        vector = np.array([0.5, -0.25, 1.0], dtype="<f2")
+        self.mock_call_service.post.return_value = ({
+            "embedding_b64": base64.b64encode(vector.tobytes()).decode("ascii"),
+            "dtype": "float16",
+            "dimensions": 3,
+        }, 200)
+
+        result = self.service.predict("acme", "text_embeddings", {"mode": "text", "text": "hola"})
+
+        assert result == {"embedding": [0.5, -0.25, 1.0], "dimensions": 3}
+        payload = self.mock_call_service.post.call_args.kwargs["json_dict"]
+        assert payload["parameters"]["embedding_encoding"] == "float16_base64"
+
+    def test_predict_decodes_batched_float16_base64_embeddings(self):
+        self.mock_config_service.get_configuration.return_value = {
+            "text_embeddings": {"endpoint_url": "https://hf.endpoint"},
+        }
+        self.mock_secret_provider.get_secret.return_value = "token"
+        vectors = np.array([[1.0, 0.0], [0.0, 2.0]], dtype="<f2")
+        self.mock_call_service.post.return_value = ({
+            "embeddings_b64": base64.b64encode(vectors.tobytes()).decode("ascii"),
+            "dtype": "float16",
+            "dimensions": 2,
+            "count": 2,
+        }, 200)
+
+        result = self.service.predict("acme", "text_embeddings", {"mode": "text", "text": ["a", "b"]})
+
+        assert result["embeddings"] == [[1.0, 0.0], [0.0, 2.0]]
+
+    def _configure_text_embeddings_tool(self):
+        self.mock_config_service.get_configuration.return_value = {
+            "text_embeddings": {"endpoint_url": "https://hf.endpoint", "model_id": "minilm"},
+        }
+        self.mock_secret_provider.get_secret.return_value = "token"
+
+    def test_predict_batch_sends_one_request_per_group(self):
+        self._configure_text_embeddings_tool()
+        self.mock_call_service.post.return_value = ({"embeddings": [[1.0], [2.0], [3.0]]}, 200)
+        inputs = [{"mode": "text", "text": t} for t in ("a", "b", "c")]
+
+        results = self.service.predict_batch("acme", "text_embeddings", inputs)
+
+        assert results == [{"embedding": [1.0]}, {"embedding": [2.0]}, {"embedding": [3.0]}]
+        self.mock_call_service.post.assert_called_once()
+        payload = self.mock_call_service.post.call_args.kwargs["json_dict"]
+        assert payload["inputs"] == {"mode": "text", "text": ["a", "b", "c"]}
+        assert payload["parameters"] == {"model_id": "minilm"}
+
+    def test_predict_batch_splits_by_max_batch_and_mode(self):
+        self._configure_text_embeddings_tool()
+        self.mock_call_service.post.side_effect = [
+            ({"embeddings": [[1.0], [2.0]]}, 200),
+            ({"embedding": [3.0]}, 200),
+            ({"embedding": [4.0]}, 200),
+        ]
+        inputs = [
+            {"mode": "text", "text": "a"},
+            {"mode": "text", "text": "b"},
+            {"mode": "text", "text": "c"},
+            {"mode": "image", "url": "https://img"},
+        ]
+
+        results = self.service.predict_batch("acme", "text_embeddings", inputs, max_batch=2)
+
+        assert [r["embedding"] for r in results] == [[1.0], [2.0], [3.0], [4.0]]
+        assert self.mock_call_service.post.call_count == 3
+
+    def test_predict_batch_falls_back_to_single_calls_when_batch_is_rejected(self):
+        self._configure_text_embeddings_tool()
+        self.mock_call_service.post.side_effect = [
+            ({"error": "unsupported"}, 400),
+            ({"embedding": [1.0]}, 200),
+            ({"embedding": [2.0]}, 200),
+        ]
+        inputs = [{"mode": "text", "text": "a"}, {"mode": "text", "text": "b"}]
+
+        results = self.service.predict_batch("acme", "text_embeddings", inputs)
+
+        assert results == [{"embedding": [1.0]}, {"embedding": [2.0]}]
+        assert self.mock_call_service.post.call_count == 3
+
+    def test_apredict_many_runs_concurrently_and_keeps_order(self):
+        self._configure_text_embeddings_tool()
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            text = json.loads(request.content)["inputs"]["text"]
+            if text == "bad":
+                return httpx.Response(500, json={"error": "boom"})
+            return httpx.Response(200, json={"embedding": [float(len(text))]})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                inputs = [{"mode": "text", "text": "x" * n} for n in range(1, 6)] + [{"mode": "text", "text": "bad"}]
+                return await self.service.apredict_many(
+                    "acme", "text_embeddings", inputs, max_concurrency=2, client=client)
+
+        results = asyncio.run(run())
+
+        assert [r["embedding"] for r in results[:5]] == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert isinstance(results[5], ValueError)
+        assert in_flight["max"] == 2
+        self.mock_call_service.post.assert_not_called()
+
+    def test_apredict_waits_for_tool_rate_limit(self):
+        self.mock_config_service.get_configuration.return_value = {
+            "text_embeddings": {
+                "endpoint_url": "https://hf.endpoint",
+                "rate_limit": {"requests_per_min": 120},
+            },
+        }
+        self.mock_secret_provider.get_secret.return_value = "token"
+        limiter = MagicMock(tokens_per_min=None)
+        limiter.acquire = AsyncMock()
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"embedding": [1.0]}))
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await self.service.apredict(
+                    "acme", "text_embeddings", {"mode": "text", "text": "hola"}, client)
+
+        with patch("iatoolkit.services.inference_service.get_rate_limiter", return_value=limiter) as get_limiter:
+            assert asyncio.run(run()) == {"embedding": [1.0]}
+
+        get_limiter.assert_called_once_with(("inference", "acme", "text_embeddings"), {"requests_per_min": 120})
+        limiter.acquire.assert_awaited_once_with(0)
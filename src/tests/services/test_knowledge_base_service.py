@@ -122,7 +122,19 @@ class TestKnowledgeBaseService:
         assert args[0] == 'acme'
         assert len(args[1]) > 0
 
-        assert self.mock_session.commit.call_count >= 2
+        assert self.mock_session.commit.call_count >= 1
+
+    def test_ingest_document_sync_inserts_processing_document_without_extra_commit(self):
+        self.mock_doc_repo.get_by_hash.return_value = None
+        self.mock_storage.upload_document.return_value = "key"
+        inserted_status = []
+        self.mock_doc_repo.insert.side_effect = lambda doc: inserted_status.append(doc.status)
+
+        self.service.ingest_document_sync(self.company, self.filename, self.content)
+
+        assert inserted_status == [DocumentStatus.PROCESSING]
+        # only the final ACTIVE status is committed by the service itself
+        assert self.mock_session.commit.call_count == 1
 
     def test_ingest_document_sync_handles_processing_error(self):
         self.mock_doc_repo.get_by_hash.return_value = None
@@ -240,6 +252,23 @@ class TestKnowledgeBaseService:
         assert existing.description == "Accounts payable and billing records"
         self.mock_session.add.assert_not_called()
         self.mock_session.commit.assert_called()
+        self.mock_parsing_service.clear_provider_cache.assert_called_once()
+
+    def test_list_documents_eager_loads_collection_type(self):
+        query = self.mock_session.query.return_value
+        query.options.return_value = query
+        query.join.return_value = query
+        query.filter.return_value = query
+        query.order_by.return_value = query
+        query.limit.return_value = query
+        query.offset.return_value = query
+        query.all.return_value = []
+
+        assert self.service.list_documents("acme") == []
+
+        query.options.assert_called_once()
+        loader = query.options.call_args[0][0]
+        assert "Document.collection_type" in str(loader.path)
 
     def test_get_collection_descriptors_returns_description_and_parser_provider(self):
         self.mock_profile_service.get_company_by_short_name.return_value = self.company
@@ -122,10 +122,10 @@ class TestLLMClient:
         self.mock_proxy.create_response.return_value = mock_response
 
         # 2. Configurar el mock de storage para devolver URLs simuladas
-        self.storage_service_mock.store_generated_image.return_value = {
+        self.storage_service_mock.store_generated_images.return_value = [{
             'storage_key': 'companies/test_company/generated_images/uuid.png',
             'url': 'https://s3.amazonaws.com/bucket/uuid.png?token=...'
-        }
+        }]
 
         # 3. Invocar
         result = self.client.invoke(
@@ -134,8 +134,8 @@ class TestLLMClient:
         )
 
         # 4. Validar llamada a storage service
-        self.storage_service_mock.store_generated_image.assert_called_once_with(
-            'test_company', base64_data, mime_type
+        self.storage_service_mock.store_generated_images.assert_called_once_with(
+            'test_company', [(base64_data, mime_type)]
         )
 
         # 5. Validar que la respuesta final contiene la URL y no el base64
@@ -152,6 +152,26 @@ class TestLLMClient:
         assert 'data' not in image_part['source']
 
 
+    def test_process_generated_images_uploads_together_and_flags_failures(self):
+        ok_part = {'type': 'image', 'source': {'type': 'base64', 'media_type': 'image/png', 'data': 'AAAA'}}
+        failed_part = {'type': 'image', 'source': {'type': 'base64', 'media_type': 'image/jpeg', 'data': 'BBBB'}}
+        url_part = {'type': 'image', 'source': {'type': 'url', 'url': 'https://x/y.png'}}
+        response = MagicMock(content_parts=[ok_part, url_part, failed_part])
+        self.storage_service_mock.store_generated_images.return_value = [
+            {'storage_key': 'k1', 'url': 'https://signed/k1'},
+            IAToolkitException(IAToolkitException.ErrorType.FILE_IO_ERROR, 'upload failed'),
+        ]
+
+        self.client._process_generated_images(response, 'test_company')
+
+        self.storage_service_mock.store_generated_images.assert_called_once_with(
+            'test_company', [('AAAA', 'image/png'), ('BBBB', 'image/jpeg')]
+        )
+        assert ok_part['source']['url'] == 'https://signed/k1'
+        assert url_part['source']['storage_key'] is None
+        assert failed_part['error'] == "Failed to upload image"
+        assert failed_part['source']['data'] == 'BBBB'
+
     def test_invoke_success_with_images(self):
         """Test de una llamada invoke exitosa con imagenes."""
         self.mock_proxy.create_response.return_value = self.mock_llm_response
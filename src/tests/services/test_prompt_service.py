@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock, patch
+from iatoolkit.services import prompt_service as prompt_service_module
 from iatoolkit.services.prompt_service import PromptService
 from iatoolkit.services.i18n_service import I18nService
 from iatoolkit.services.sql_service import SqlService
@@ -211,6 +212,18 @@ class TestPromptService:
         assert saved_prompt.category_id == 10
         assert saved_prompt.active is False
 
+    def test_save_prompt_drops_cached_responses_of_the_company(self):
+        prompt_service_module.cache_prompt_response(('test_co', 'p'), (b'{}', 'etag'))
+        prompt_service_module.cache_prompt_response(('other_co', 'p'), (b'{}', 'etag'))
+        self.profile_repo.get_company_by_short_name.return_value = self.mock_company
+        self.llm_query_repo.get_category_by_name.return_value = None
+
+        self.prompt_service.save_prompt('test_co', 'p', {'content': 'x'})
+
+        assert prompt_service_module.get_cached_prompt_response(('test_co', 'p')) is None
+        assert prompt_service_module.get_cached_prompt_response(('other_co', 'p')) == (b'{}', 'etag')
+        prompt_service_module._prompt_cache.clear()
+
     def test_save_prompt_company_not_found(self):
         """Prueba que save_prompt lanza excepción si la compañía no existe."""
         self.profile_repo.get_company_by_short_name.return_value = None
@@ -220,6 +233,23 @@ class TestPromptService:
 
         assert exc.value.error_type == IAToolkitException.ErrorType.INVALID_NAME
 
+    def test_validate_prompt_data_rejects_what_save_prompt_rejects(self):
+        with pytest.raises(IAToolkitException) as exc:
+            self.prompt_service.validate_prompt_data('test_co', ['not', 'a', 'dict'])
+        assert exc.value.error_type == IAToolkitException.ErrorType.INVALID_PARAMETER
+
+        self.profile_repo.get_company_by_short_name.return_value = None
+        with pytest.raises(IAToolkitException) as exc:
+            self.prompt_service.validate_prompt_data('unknown', {})
+        assert exc.value.error_type == IAToolkitException.ErrorType.INVALID_NAME
+
+        self.profile_repo.get_company_by_short_name.return_value = self.mock_company
+        with pytest.raises(IAToolkitException) as exc:
+            self.prompt_service.validate_prompt_data('test_co', {'output_schema': 'nope'})
+
+        assert exc.value.error_type == IAToolkitException.ErrorType.INVALID_PARAMETER
+        self.mock_asset_repo.write_text.assert_not_called()
+
     def test_save_prompt_invalid_prompt_type_falls_back_to_company(self):
         self.profile_repo.get_company_by_short_name.return_value = self.mock_company
         self.llm_query_repo.get_category_by_name.return_value = None
@@ -347,12 +377,13 @@ properties:
         self.prompt_service.sync_company_prompts('test_co', [], [])
 
         # No debería intentar buscar categorías ni hacer nada más con los repos
-        self.llm_query_repo.create_or_update_prompt_category.assert_not_called()
-        self.llm_query_repo.create_or_update_prompt.assert_not_called()
+        self.llm_query_repo.upsert_prompt_categories.assert_not_called()
+        self.llm_query_repo.upsert_prompts.assert_not_called()
 
 
+    @patch('iatoolkit.services.prompt_service.invalidate_prompt_cache')
     @patch('iatoolkit.services.prompt_service.current_iatoolkit')
-    def test_sync_company_prompts_community_mode(self, mock_current_toolkit):
+    def test_sync_company_prompts_community_mode(self, mock_current_toolkit, mock_invalidate):
         """
         Prueba que si ES community, realiza la sincronización completa.
         """
@@ -366,18 +397,45 @@ properties:
         # Mock category persistence
         mock_cat = MagicMock()
         mock_cat.id = 100
-        self.llm_query_repo.create_or_update_prompt_category.return_value = mock_cat
+        self.llm_query_repo.upsert_prompt_categories.return_value = {'Sales': mock_cat}
 
         # Mock existing prompts for cleanup
-        self.llm_query_repo.get_prompts.return_value = []
+        stale_prompt = MagicMock()
+        stale_prompt.name = 'old'
+        self.llm_query_repo.get_prompts.return_value = [stale_prompt]
 
         # Act
         self.prompt_service.sync_company_prompts('test_co', prompt_list, categories_config)
 
-        # Se crean categorías
-        self.llm_query_repo.create_or_update_prompt_category.assert_called()
-        # Se crean prompts
-        self.llm_query_repo.create_or_update_prompt.assert_called()
+        # Se crean categorías y prompts en lote, con un único commit
+        categories = self.llm_query_repo.upsert_prompt_categories.call_args[0][1]
+        assert [(c.name, c.order) for c in categories] == [('Sales', 1)]
+        company_id, prompts = self.llm_query_repo.upsert_prompts.call_args[0]
+        assert [(p.name, p.category_id) for p in prompts] == [('p1', 100)]
+        self.llm_query_repo.create_or_update_prompt.assert_not_called()
+        self.llm_query_repo.session.delete.assert_called_once_with(stale_prompt)
+        self.llm_query_repo.commit.assert_called_once()
+        # a config reload must not leave the prompt API serving the old tree
+        mock_invalidate.assert_called_once_with('test_co')
+
+    @patch('iatoolkit.services.prompt_service.current_iatoolkit')
+    def test_sync_company_prompts_resolves_llm_models_once(self, mock_current_toolkit):
+        """Los modelos permitidos se resuelven una vez por sync, no una vez por prompt."""
+        mock_current_toolkit.return_value.is_community = True
+        self.profile_repo.get_company_by_short_name.return_value = self.mock_company
+        mock_cat = MagicMock()
+        mock_cat.id = 100
+        self.llm_query_repo.upsert_prompt_categories.return_value = {'Sales': mock_cat}
+        self.llm_query_repo.get_prompts.return_value = []
+        prompt_list = [
+            {'name': f'p{i}', 'category': 'Sales', 'llm_model': 'gpt-4.1-mini'} for i in range(3)
+        ]
+
+        self.prompt_service.sync_company_prompts('test_co', prompt_list, ['Sales'])
+
+        self.mock_configuration_service.get_llm_configuration.assert_called_once_with('test_co')
+        saved = self.llm_query_repo.upsert_prompts.call_args[0][1]
+        assert [p.llm_model for p in saved] == ['gpt-4.1-mini'] * 3
 
     # --- Tests para sync_prompt_categories ---
 
@@ -432,7 +490,8 @@ properties:
 
     # --- Tests para delete_prompt ---
 
-    def test_delete_prompt_success(self):
+    @patch('iatoolkit.services.prompt_service.invalidate_prompt_cache')
+    def test_delete_prompt_success(self, mock_invalidate):
         """Prueba borrado exitoso de un prompt."""
         # Arrange
         self.profile_repo.get_company_by_short_name.return_value = self.mock_company
@@ -444,6 +503,7 @@ properties:
 
         # Assert
         self.llm_query_repo.delete_prompt.assert_called_once_with(mock_prompt)
+        mock_invalidate.assert_called_once_with('test_co')
 
     def test_delete_prompt_not_found(self):
         """Prueba error DocumentNotFound si el prompt no existe."""
@@ -153,6 +153,50 @@ class TestSqlService:
         assert ('company_A', 'db_sales') not in self.service._db_connections
         assert ('company_B', 'db_sales') in self.service._db_connections
 
+    # --- Tests for get_database_structure (Introspection Cache) ---
+
+    def test_get_database_structure_introspects_once(self):
+        mock_provider = MagicMock(spec=DatabaseProvider)
+        mock_provider.get_database_structure.return_value = {'users': {'columns': [{'name': 'id'}]}}
+        self.service._db_connections[(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)] = mock_provider
+
+        first = self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        first['users']['description'] = 'enriched by the caller'
+        second = self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+
+        mock_provider.get_database_structure.assert_called_once()
+        assert second == {'users': {'columns': [{'name': 'id'}]}}
+
+    def test_refresh_database_structure_forces_new_introspection(self):
+        mock_provider = MagicMock(spec=DatabaseProvider)
+        mock_provider.get_database_structure.return_value = {'users': {'columns': []}}
+        self.service._db_connections[(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)] = mock_provider
+
+        self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        self.service.refresh_database_structure(COMPANY_SHORT_NAME)
+        self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+
+        assert mock_provider.get_database_structure.call_count == 2
+
+    def test_database_structure_expires_after_ttl_and_on_config_reload(self):
+        mock_provider = MagicMock(spec=DatabaseProvider)
+        mock_provider.get_database_structure.return_value = {'users': {'columns': []}}
+        self.service._db_connections[(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)] = mock_provider
+        ttl = SqlService.DB_STRUCTURE_CACHE_TTL
+
+        with patch('iatoolkit.services.sql_service.time.monotonic', return_value=1000.0):
+            self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        with patch('iatoolkit.services.sql_service.time.monotonic', return_value=1000.0 + ttl - 1):
+            self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        assert mock_provider.get_database_structure.call_count == 1
+
+        with patch('iatoolkit.services.sql_service.time.monotonic', return_value=1000.0 + ttl):
+            self.service.get_database_structure(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        assert mock_provider.get_database_structure.call_count == 2
+
+        self.service.clear_company_connections(COMPANY_SHORT_NAME)
+        assert self.service._db_structures == {}
+
     # --- Tests for exec_sql (Delegation Logic) ---
 
     @patch('iatoolkit.services.sql_service.DatabaseManager')
@@ -242,3 +286,23 @@ class TestSqlService:
 
         # Verify rollback called on provider
         mock_provider.rollback.assert_called_once()
+
+    @patch('iatoolkit.services.sql_service.DatabaseManager')
+    def test_exec_sql_rolls_back_the_provider_that_failed(self, MockDatabaseManager):
+        """
+        GIVEN a failing query
+        WHEN exec_sql handles the error
+        THEN it should roll back the provider it already resolved, without looking it up again.
+        """
+        mock_provider = MockDatabaseManager.return_value
+        mock_provider.execute_query.side_effect = Exception("boom")
+        self.service.register_database(COMPANY_SHORT_NAME, DB_NAME_SUCCESS, {'DATABASE_URI': DUMMY_URI})
+
+        with patch.object(self.service, 'get_database_provider', wraps=self.service.get_database_provider) as get_provider:
+            with pytest.raises(IAToolkitException):
+                self.service.exec_sql(company_short_name=COMPANY_SHORT_NAME,
+                                      database_key=DB_NAME_SUCCESS,
+                                      query="SELECT *")
+
+        get_provider.assert_called_once_with(COMPANY_SHORT_NAME, DB_NAME_SUCCESS)
+        mock_provider.rollback.assert_called_once()
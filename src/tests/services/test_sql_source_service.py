@@ -120,8 +120,6 @@ class TestSqlSourceService:
             existing_yaml_remove,
             existing_user,
         ]
-        self.sql_source_repo.create_or_update.side_effect = lambda source: source
-
         result = self.service.sync_from_yaml(
             self.company_short_name,
             [
@@ -148,15 +146,19 @@ class TestSqlSourceService:
         )
 
         assert result == {"upserted": 2, "deleted": 1, "skipped": 1}
-        assert self.sql_source_repo.create_or_update.call_count == 2
-        self.sql_source_repo.delete.assert_called_once_with(existing_yaml_remove)
-
-        updated_wealth = self.sql_source_repo.create_or_update.call_args_list[0][0][0]
+        self.sql_source_repo.save_all.assert_called_once()
+        upserts, deletes = self.sql_source_repo.save_all.call_args[0]
+        assert len(upserts) == 2
+        assert deletes == [existing_yaml_remove]
+        self.sql_source_repo.create_or_update.assert_not_called()
+        self.sql_source_repo.delete.assert_not_called()
+
+        updated_wealth = upserts[0]
         assert updated_wealth.database == "wealth"
         assert updated_wealth.description == "Primary wealth model"
         assert updated_wealth.source == SqlSource.SOURCE_YAML
 
-        created_transactions = self.sql_source_repo.create_or_update.call_args_list[1][0][0]
+        created_transactions = upserts[1]
         assert created_transactions.database == "transactions"
         assert created_transactions.connection_type == SqlSource.CONNECTION_BRIDGE
         assert created_transactions.bridge_id == "bridge-wealth"
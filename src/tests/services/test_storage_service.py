@@ -3,6 +3,7 @@
 #
 # IAToolkit is open source software.
 
+import base64
 import unittest
 from unittest.mock import MagicMock, patch
 from iatoolkit.services.storage_service import StorageService
@@ -94,6 +95,29 @@ class TestStorageService(unittest.TestCase):
         self.assertEqual(context.exception.error_type, IAToolkitException.ErrorType.FILE_IO_ERROR)
         self.assertIn("Upload failed", str(context.exception))
 
+    def test_store_generated_images_uses_one_connector_and_keeps_order(self):
+        self.mock_connector_instance.generate_presigned_url.side_effect = lambda key: f"https://signed/{key}"
+
+        def upload(file_path, content, content_type):
+            # uploads run concurrently: fail by content, not by call order
+            if content == base64.b64decode("AAAA"):
+                raise Exception("Upload failed")
+        self.mock_connector_instance.upload_file.side_effect = upload
+
+        results = self.service.store_generated_images(self.company_name, [
+            ("aGVsbG8=", "image/png"),
+            ("AAAA", "image/png"),
+            ("data:image/jpeg;base64,aGVsbG8=", "image/jpeg"),
+        ])
+
+        self.assertEqual(self.mock_factory.create.call_count, 1)
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[1], IAToolkitException)
+        self.assertEqual(results[1].error_type, IAToolkitException.ErrorType.FILE_IO_ERROR)
+        for result in (results[0], results[2]):
+            self.assertEqual(result['url'], f"https://signed/{result['storage_key']}")
+        self.assertTrue(results[2]['storage_key'].endswith(".jpg"))
+
     def test_get_public_url(self):
         # Arrange
         key = "some/path/file.jpg"
@@ -210,3 +210,20 @@ def test_get_system_tool_routing_profile():
             "cost": {"penalty": 0.1},
         }
         assert system_tools.get_system_tool_routing_profile("tool_missing") is None
+
+
+def test_system_tool_templates_match_definitions():
+    templates = system_tools.get_system_tool_templates(system_tools.SYSTEM_TOOLS_DEFINITIONS)
+
+    assert templates is system_tools.SYSTEM_TOOLS_TEMPLATES
+    assert [name for name, _, _ in templates] == [
+        item["function_name"] for item in system_tools.SYSTEM_TOOLS_DEFINITIONS
+    ]
+
+
+def test_get_system_tool_templates_builds_for_other_definitions():
+    definitions = [{"function_name": "tool_a", "description": "A", "parameters": {"type": "object"}}]
+
+    assert system_tools.get_system_tool_templates(definitions) == (
+        ("tool_a", "A", {"type": "object"}),
+    )
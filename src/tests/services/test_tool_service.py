@@ -127,10 +127,13 @@ class TestToolService:
             self.service.register_system_tools()
 
             # Assert
-            self.mock_llm_query_repo.create_or_update_tool.assert_called_once()
+            self.mock_llm_query_repo.create_or_update_system_tools.assert_called_once()
 
             # Check args
-            created_tool = self.mock_llm_query_repo.create_or_update_tool.call_args[0][0]
+            created_tools = self.mock_llm_query_repo.create_or_update_system_tools.call_args[0][0]
+            assert len(created_tools) == 1
+            created_tool = created_tools[0]
+            assert created_tool.name == 'sys_1'
             assert created_tool.tool_type == Tool.TYPE_SYSTEM
             assert created_tool.source == Tool.SOURCE_SYSTEM
             assert created_tool.is_active is True
@@ -153,7 +156,7 @@ class TestToolService:
         self.service.system_handlers["sys_1"] = MagicMock()
 
         # Arrange
-        self.mock_llm_query_repo.create_or_update_tool.side_effect = Exception("DB Error")
+        self.mock_llm_query_repo.create_or_update_system_tools.side_effect = Exception("DB Error")
 
         # Act & Assert
         with pytest.raises(IAToolkitException) as excinfo:
@@ -169,7 +172,7 @@ class TestToolService:
                 self.service.register_system_tools()
 
         assert excinfo.value.error_type == IAToolkitException.ErrorType.SYSTEM_ERROR
-        self.mock_llm_query_repo.create_or_update_tool.assert_not_called()
+        self.mock_llm_query_repo.create_or_update_system_tools.assert_not_called()
         self.mock_llm_query_repo.rollback.assert_called_once()
 
     def test_sync_system_tools_if_catalog_changed_skips_when_no_drift(self):
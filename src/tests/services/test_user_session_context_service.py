@@ -93,10 +93,13 @@ class TestUserSessionContextService(unittest.TestCase):
     def test_clear_all_context_also_clears_selected_system_prompt_keys(self):
         self.service.clear_all_context(self.company_short_name, self.user_identifier)
 
-        self.mock_redis_manager.hdel.assert_any_call(self.session_key, 'context_version')
-        self.mock_redis_manager.hdel.assert_any_call(self.session_key, 'context_history')
-        self.mock_redis_manager.hdel.assert_any_call(self.session_key, 'last_response_id')
-        self.mock_redis_manager.hdel.assert_any_call(self.session_key, 'selected_system_prompt_keys')
+        self.mock_redis_manager.hdel.assert_called_once_with(
+            self.session_key,
+            'context_version',
+            'context_history',
+            'last_response_id',
+            'selected_system_prompt_keys',
+        )
 
     def test_save_prepared_context(self):
         """Prueba que el contexto preparado y su versión se guardan correctamente."""
@@ -132,6 +132,23 @@ class TestIAToolkit(unittest.TestCase):
         with patch.dict(os.environ, {'TEST_KEY': 'env_value_override'}):
             self.assertEqual(toolkit._get_config_value('TEST_KEY'), 'config_value')
 
+    @patch('iatoolkit.core.threading.Thread')
+    def test_preload_modules_starts_daemon_thread(self, mock_thread_cls):
+        toolkit = IAToolkit({})
+
+        toolkit._preload_modules()
+
+        mock_thread_cls.assert_called_once_with(target=ANY, name='iatoolkit-preload', daemon=True)
+        mock_thread_cls.return_value.start.assert_called_once()
+
+    @patch('iatoolkit.core.threading.Thread')
+    def test_preload_modules_can_be_disabled(self, mock_thread_cls):
+        toolkit = IAToolkit({'IATOOLKIT_PRELOAD_MODULES': 'false'})
+
+        toolkit._preload_modules()
+
+        mock_thread_cls.assert_not_called()
+
     @patch('iatoolkit.core.DatabaseManager')
     def test_setup_database_failure_missing_uri(self, mock_db_cls):
         """Test that missing DATABASE_URI raises IAToolkitException."""
@@ -4,7 +4,7 @@
 # IAToolkit is open source software.
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from flask import Flask
 from iatoolkit.views.load_document_api_view import LoadDocumentApiView
 from iatoolkit.services.knowledge_base_service import KnowledgeBaseService
@@ -12,6 +12,8 @@ from iatoolkit.repositories.profile_repo import ProfileRepo
 from iatoolkit.services.auth_service import AuthService
 from iatoolkit.repositories.models import Document
 import base64
+import threading
+from concurrent.futures import Future
 
 
 class TestLoadDocumentView:
@@ -151,3 +153,60 @@ class TestLoadDocumentView:
             company=mock_company,
             metadata={"key": "value"}
         )
+
+    def test_post_async_queues_ingestion_and_returns_202(self):
+        company = MagicMock()
+        self.mock_profile_repo.get_company_by_short_name.return_value = company
+        executor = MagicMock()
+
+        def run_now(fn, *args, **kwargs):
+            future = Future()
+            future.set_result(fn(*args, **kwargs))
+            return future
+        executor.submit.side_effect = run_now
+        payload = {
+            "company": "test_company",
+            "filename": "test_file.txt",
+            "content": base64.b64encode(b"test content").decode('utf-8'),
+            "async": True,
+        }
+
+        with patch('iatoolkit.views.load_document_api_view._get_ingest_executor', return_value=executor):
+            response = self.client.post(self.url, json=payload)
+
+        assert response.status_code == 202
+        assert response.get_json() == {"filename": "test_file.txt", "status": "queued"}
+        executor.submit.assert_called_once()
+        self.mock_kb_service.ingest_document_sync.assert_called_once_with(
+            company=company,
+            filename="test_file.txt",
+            content=b"test content",
+            metadata={}
+        )
+
+    def test_post_async_returns_503_when_ingest_queue_is_full(self):
+        self.mock_profile_repo.get_company_by_short_name.return_value = MagicMock()
+        executor = MagicMock()
+        executor.submit.return_value = future = Future()
+        slots = threading.BoundedSemaphore(1)
+        payload = {
+            "company": "test_company",
+            "filename": "test_file.txt",
+            "content": base64.b64encode(b"test content").decode('utf-8'),
+            "async": True,
+        }
+
+        with patch('iatoolkit.views.load_document_api_view._get_ingest_executor', return_value=executor), \
+                patch('iatoolkit.views.load_document_api_view._get_ingest_slots', return_value=slots):
+            first = self.client.post(self.url, json=payload)
+            second = self.client.post(self.url, json=payload)
+
+            assert first.status_code == 202
+            assert second.status_code == 503
+            assert second.headers['Retry-After'] == '30'
+            executor.submit.assert_called_once()
+
+            # the slot is freed once the queued ingestion has run
+            future.set_result(None)
+            assert self.client.post(self.url, json=payload).status_code == 202
+
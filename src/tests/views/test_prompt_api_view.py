@@ -4,13 +4,16 @@
 # IAToolkit is open source software.
 
 import pytest
-from unittest.mock import MagicMock
-from flask import Flask
+from unittest.mock import MagicMock, patch
+from flask import Flask, jsonify
+from iatoolkit.views import prompt_api_view
+from iatoolkit.services import prompt_service as prompt_service_module
 from iatoolkit.views.prompt_api_view import PromptApiView
 from iatoolkit.services.prompt_service import PromptService
 from iatoolkit.services.auth_service import AuthService
 from iatoolkit.repositories.llm_query_repo import LLMQueryRepo
 from iatoolkit.services.profile_service import ProfileService
+from iatoolkit.common.exceptions import IAToolkitException
 
 
 class TestPromptView:
@@ -24,6 +27,8 @@ class TestPromptView:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Set up the test client and mock dependencies for each test."""
+        prompt_service_module._prompt_cache.clear()
+        prompt_api_view._pending_prompt_saves.clear()
         self.app = self.create_app()
         self.client = self.app.test_client()
         self.prompt_service = MagicMock(spec=PromptService)
@@ -31,6 +36,12 @@ class TestPromptView:
         self.profile_service = MagicMock(spec=ProfileService)
         self.llm_query_repo = MagicMock(spec=LLMQueryRepo)
 
+        # like the real service, writes drop the company's cached responses
+        def invalidate(company_short_name, *args):
+            prompt_service_module.invalidate_prompt_cache(company_short_name)
+        self.prompt_service.save_prompt.side_effect = invalidate
+        self.prompt_service.delete_prompt.side_effect = invalidate
+
         self.company_short_name = 'test_company'
         self.base_url = f'/{self.company_short_name}/api/prompts'
 
@@ -92,6 +103,41 @@ class TestPromptView:
         assert response.status_code == 200
         self.prompt_service.get_prompts.assert_called_with(self.company_short_name, include_all=True)
 
+    def test_get_list_is_cached_per_filter_until_prompt_is_deleted(self):
+        """The encoded tree is reused per (company, all) and dropped on writes; errors are not cached."""
+        self.prompt_service.get_prompts.return_value = {'message': [{'prompt': 'sales_prompt'}]}
+
+        self.client.get(self.base_url)
+        response = self.client.get(self.base_url)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.json == {'message': [{'prompt': 'sales_prompt'}]}
+        assert self.prompt_service.get_prompts.call_count == 1
+
+        self.client.get(f"{self.base_url}?all=true")
+        assert self.prompt_service.get_prompts.call_count == 2
+
+        self.client.delete(f"{self.base_url}/sales_prompt")
+        self.prompt_service.get_prompts.return_value = {'error': 'db down'}
+        self.client.get(self.base_url)
+        response = self.client.get(self.base_url)
+
+        assert response.json == {'error': 'db down'}
+        assert self.prompt_service.get_prompts.call_count == 4
+
+    def test_get_list_body_matches_jsonify(self):
+        tree = {'message': [{'prompt': 'sales_prompt', 'description': 'Ventas', 'order': 1}]}
+        self.prompt_service.get_prompts.return_value = tree
+
+        first = self.client.get(self.base_url)
+        cached = self.client.get(self.base_url)
+        with self.app.app_context():
+            expected = jsonify(tree).get_data()
+
+        assert first.data == expected
+        assert cached.data == expected
+
     # --- POST Tests ---
     def test_post_create_prompt(self):
         """Test creating a new prompt via POST."""
@@ -134,6 +180,51 @@ class TestPromptView:
         self.llm_query_repo.get_prompt_by_name.assert_called_once()
         self.prompt_service.get_prompt_content.assert_called_once()
 
+    def test_get_detail_is_cached_until_prompt_is_saved(self):
+        """Repeated detail requests are served from cache; a PUT invalidates it."""
+        mock_prompt_obj = MagicMock()
+        mock_prompt_obj.to_dict.return_value = {"name": "sales_prompt"}
+        self.llm_query_repo.get_prompt_by_name.return_value = mock_prompt_obj
+        self.prompt_service.get_prompt_content.return_value = "v1"
+
+        self.client.get(f"{self.base_url}/sales_prompt")
+        response = self.client.get(f"{self.base_url}/sales_prompt")
+
+        assert response.json['content'] == "v1"
+        self.prompt_service.get_prompt_content.assert_called_once()
+        self.profile_service.get_company_by_short_name.assert_called_once()
+        assert self.auth_service.verify_for_company.call_count == 2
+
+        self.prompt_service.get_prompt_content.return_value = "v2"
+        self.client.put(f"{self.base_url}/sales_prompt", json={"content": "v2"})
+        response = self.client.get(f"{self.base_url}/sales_prompt")
+
+        assert response.json['content'] == "v2"
+        assert self.prompt_service.get_prompt_content.call_count == 2
+
+    def test_get_detail_returns_304_when_etag_matches(self):
+        """A client revalidating an unchanged prompt gets a 304 without body; an edit changes the ETag."""
+        mock_prompt_obj = MagicMock()
+        mock_prompt_obj.to_dict.return_value = {"name": "sales_prompt"}
+        self.llm_query_repo.get_prompt_by_name.return_value = mock_prompt_obj
+        self.prompt_service.get_prompt_content.return_value = "v1"
+
+        response = self.client.get(f"{self.base_url}/sales_prompt")
+        etag = response.headers['ETag']
+        assert 'no-cache' in response.headers['Cache-Control']
+
+        response = self.client.get(f"{self.base_url}/sales_prompt", headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        self.prompt_service.get_prompt_content.return_value = "v2"
+        self.client.put(f"{self.base_url}/sales_prompt", json={"content": "v2"})
+        response = self.client.get(f"{self.base_url}/sales_prompt", headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.json['content'] == "v2"
+        assert response.headers['ETag'] != etag
+
     # --- PUT Tests ---
 
     def test_put_success(self):
@@ -145,10 +236,13 @@ class TestPromptView:
             "custom_fields": []
         }
 
-        response = self.client.put(f"{self.base_url}/{prompt_name}", json=payload)
+        with patch('iatoolkit.views.prompt_api_view._get_prompt_save_executor') as get_executor:
+            response = self.client.put(f"{self.base_url}/{prompt_name}", json=payload)
 
         assert response.status_code == 200
         assert response.json['status'] == 'success'
+        # synchronous writes stay on the request thread
+        get_executor.assert_not_called()
 
         self.prompt_service.save_prompt.assert_called_once_with(
             self.company_short_name,
@@ -156,6 +250,58 @@ class TestPromptView:
             payload
         )
 
+    def test_put_async_queues_save_and_collapses_repeated_edits(self):
+        """With ?async=true the save is queued (202); edits queued before it runs collapse into the last one."""
+        executor = MagicMock()
+        url = f"{self.base_url}/sales_prompt?async=true"
+
+        with patch('iatoolkit.views.prompt_api_view._get_prompt_save_executor', return_value=executor):
+            first = self.client.put(url, json={"content": "v1"})
+            second = self.client.put(url, json={"content": "v2"})
+
+        assert first.status_code == 202
+        assert second.json == {"status": "queued"}
+        self.prompt_service.save_prompt.assert_not_called()
+        executor.submit.assert_called_once()
+
+        fn, *args = executor.submit.call_args.args
+        fn(*args, **executor.submit.call_args.kwargs)
+
+        self.prompt_service.save_prompt.assert_called_once_with(
+            self.company_short_name, "sales_prompt", {"content": "v2"}
+        )
+        assert prompt_api_view._pending_prompt_saves == {}
+
+    @pytest.mark.parametrize("error_type, status_code", [
+        (IAToolkitException.ErrorType.INVALID_NAME, 404),
+        (IAToolkitException.ErrorType.INVALID_PARAMETER, 400),
+    ])
+    def test_put_async_rejects_invalid_save_before_queuing(self, error_type, status_code):
+        self.prompt_service.validate_prompt_data.side_effect = IAToolkitException(error_type, "bad")
+        executor = MagicMock()
+
+        with patch('iatoolkit.views.prompt_api_view._get_prompt_save_executor', return_value=executor):
+            response = self.client.put(f"{self.base_url}/sales_prompt?async=true", json={"llm_model": "x"})
+
+        assert response.status_code == status_code
+        executor.submit.assert_not_called()
+        assert prompt_api_view._pending_prompt_saves == {}
+
+    def test_delete_drops_save_queued_before_it(self):
+        """A queued save that has not run yet must not recreate a prompt deleted after it."""
+        prompt_api_view._pending_prompt_saves[(self.company_short_name, "p")] = {"content": "old"}
+        view = PromptApiView(auth_service=self.auth_service,
+                             prompt_service=self.prompt_service,
+                             profile_service=self.profile_service,
+                             llm_query_repo=self.llm_query_repo)
+
+        response = self.client.delete(f"{self.base_url}/p")
+        view._save_in_background((self.company_short_name, "p"))
+
+        assert response.status_code == 200
+        self.prompt_service.delete_prompt.assert_called_once_with(self.company_short_name, "p")
+        self.prompt_service.save_prompt.assert_not_called()
+
     def test_put_auth_error(self):
         """Test that PUT is protected by authentication."""
         self.auth_service.verify_for_company.return_value = {"success": False, "status_code": 401}